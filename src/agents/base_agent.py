@@ -1,4 +1,3 @@
-import os
 from abc import ABC, abstractmethod
 from typing import List, Dict
 
@@ -6,7 +5,6 @@ from typing import List, Dict
 class BaseAgent(ABC):
     def __init__(self, openai_api_key: str):
         self.openai_api_key = openai_api_key
-        os.environ["OPENAI_API_KEY"] = openai_api_key
 
     @abstractmethod
     def infer_skills_from_job(self, job: Dict, job_category: str) -> List[str]:
@@ -0,0 +1,197 @@
+import asyncio
+import json
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_openai import ChatOpenAI
+from pydantic import Field, PrivateAttr
+
+from ..config.settings import Config
+from ..services.llm_cache import LLMResponseCache
+
+SYNTHETIC_SKILLS = [
+    "Docker", "Kubernetes", "AWS", "Git", "SQL", "CI/CD", "REST API", "Linux", "Terraform", "Apache Spark",
+    "Apache Kafka", "Redis", "PostgreSQL", "MLflow", "Airflow", "GraphQL", "Pandas", "PyTorch", "TensorFlow"
+]
+
+_BATCH_JOB_PATTERN = re.compile(r"^Job (\d+):", re.MULTILINE)
+
+
+class SyntheticLLMError(RuntimeError):
+    status_code = 503
+
+
+def prompt_text(messages: List[BaseMessage]) -> str:
+    return "\n\n".join(str(message.content) for message in messages)
+
+
+def _chat_result(content: str) -> ChatResult:
+    return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+
+class RecordingChatModel(BaseChatModel):
+    """Wraps a live model and appends every prompt and response to a JSONL log that ReplayChatModel can serve."""
+
+    inner: BaseChatModel
+    path: str
+    model_name: str = Config.OPENAI_MODEL
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def _llm_type(self) -> str:
+        return "recording"
+
+    def _record(self, messages: List[BaseMessage], content: str):
+        prompt = prompt_text(messages)
+        entry = {"key": LLMResponseCache.make_key(self.model_name, prompt), "prompt": prompt, "response": content}
+
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        response = self.inner.invoke(messages, stop=stop, **kwargs)
+        self._record(messages, str(response.content))
+        return _chat_result(str(response.content))
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        response = await self.inner.ainvoke(messages, stop=stop, **kwargs)
+        self._record(messages, str(response.content))
+        return _chat_result(str(response.content))
+
+
+class ReplayChatModel(BaseChatModel):
+    """Serves responses from a RecordingChatModel log and raises on prompts that were never recorded."""
+
+    path: str
+    model_name: str = Config.OPENAI_MODEL
+    hits: int = 0
+    misses: int = 0
+
+    _responses: Dict[str, str] = PrivateAttr(default_factory=dict)
+
+    def __init__(self, **data: Any):
+        super().__init__(**data)
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._responses[entry["key"]] = entry["response"]
+        except OSError as e:
+            print(f"Failed to load LLM recordings: {e}")
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        content = self._responses.get(LLMResponseCache.make_key(self.model_name, prompt_text(messages)))
+        if content is None:
+            self.misses += 1
+            raise LookupError(f"No recorded response for this prompt in {self.path}")
+
+        self.hits += 1
+        return _chat_result(content)
+
+
+class SyntheticChatModel(BaseChatModel):
+    """Offline stand-in that answers after a lognormal delay and fails at ``error_rate``.
+
+    Answers are derived from a hash of the prompt, so a given prompt always
+    gets the same skills. Batch prompts get one answer per job. The random
+    stream is seeded, so delays and failures are reproducible for a given
+    call order.
+    """
+
+    model_name: str = "synthetic"
+    latency: float = Field(default=0.5, description="median delay in seconds")
+    latency_sigma: float = 0.3
+    error_rate: float = 0.0
+    seed: int = 0
+
+    _random: random.Random = PrivateAttr()
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def __init__(self, **data: Any):
+        super().__init__(**data)
+        self._random = random.Random(self.seed)
+
+    @property
+    def _llm_type(self) -> str:
+        return "synthetic"
+
+    def _draw(self):
+        with self._lock:
+            delay = self.latency * self._random.lognormvariate(0, self.latency_sigma) if self.latency > 0 else 0.0
+            failed = self._random.random() < self.error_rate
+        return delay, failed
+
+    def _skills_for(self, text: str) -> List[str]:
+        rng = random.Random(LLMResponseCache.make_key(self.model_name, text))
+        return rng.sample(SYNTHETIC_SKILLS, 3)
+
+    def _answer(self, messages: List[BaseMessage]) -> str:
+        prompt = prompt_text(messages)
+        job_numbers = _BATCH_JOB_PATTERN.findall(prompt)
+
+        if job_numbers:
+            return json.dumps({number: self._skills_for(f"{number}\n{prompt}") for number in job_numbers})
+        return json.dumps(self._skills_for(prompt))
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        delay, failed = self._draw()
+        time.sleep(delay)
+        if failed:
+            raise SyntheticLLMError("Synthetic LLM error")
+        return _chat_result(self._answer(messages))
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        delay, failed = self._draw()
+        await asyncio.sleep(delay)
+        if failed:
+            raise SyntheticLLMError("Synthetic LLM error")
+        return _chat_result(self._answer(messages))
+
+
+def create_chat_model(openai_api_key: Optional[str] = None, backend: Optional[str] = None) -> BaseChatModel:
+    """Build the chat model selected by ``LLM_BACKEND``: live, record, replay or synthetic."""
+    backend = (backend or Config.LLM_BACKEND).lower()
+
+    if backend == "replay":
+        return ReplayChatModel(path=Config.LLM_RECORD_PATH)
+
+    if backend == "synthetic":
+        return SyntheticChatModel(
+            latency=Config.SYNTHETIC_LATENCY,
+            latency_sigma=Config.SYNTHETIC_LATENCY_SIGMA,
+            error_rate=Config.SYNTHETIC_ERROR_RATE,
+            seed=Config.SYNTHETIC_SEED
+        )
+
+    live = ChatOpenAI(
+        model=Config.OPENAI_MODEL,
+        api_key=openai_api_key or Config.OPENAI_API_KEY,
+        temperature=0.1,
+        max_tokens=300,
+        max_retries=0  # retries are handled by the shared LLMScheduler
+    )
+
+    if backend == "record":
+        return RecordingChatModel(inner=live, path=Config.LLM_RECORD_PATH)
+    return live
@@ -0,0 +1,108 @@
+import threading
+from typing import Callable, Dict, List, Optional
+
+from ..config.settings import Config
+from ..services.skills_taxonomy import SkillsTaxonomy, get_skills_taxonomy
+
+
+class RoutingRun:
+    """Routing decisions and LLM budget for one workflow run. Safe to share between worker threads."""
+
+    def __init__(self, router: "ConfidenceRouter", max_calls: int, max_tokens: int,
+                 is_cached: Optional[Callable[[Dict, List[str]], bool]] = None):
+        self.router = router
+        self.max_calls = max_calls
+        self.max_tokens = max_tokens
+        self.is_cached = is_cached
+
+        self.local = 0
+        self.cached = 0
+        self.llm = 0
+        self.capped = 0
+        self.tokens = 0
+        self._lock = threading.Lock()
+
+    def should_enhance(self, job: Dict, skills: List[str]) -> bool:
+        if self.router.score(job, skills) >= self.router.threshold:
+            with self._lock:
+                self.local += 1
+            return False
+
+        # A cached answer costs no API call, so it does not use up the caps
+        if self.is_cached and self.is_cached(job, skills):
+            with self._lock:
+                self.cached += 1
+            return True
+
+        tokens = self.router.estimate_tokens(job)
+
+        with self._lock:
+            over_calls = self.max_calls and self.llm >= self.max_calls
+            over_tokens = self.max_tokens and self.tokens + tokens > self.max_tokens
+            if over_calls or over_tokens:
+                self.capped += 1
+                return False
+
+            self.llm += 1
+            self.tokens += tokens
+            return True
+
+    def stats(self) -> Dict:
+        with self._lock:
+            routed = self.local + self.cached + self.llm + self.capped
+            return {
+                "routed_jobs": routed,
+                "local": self.local,
+                "cached": self.cached,
+                "llm": self.llm,
+                "capped": self.capped,
+                "estimated_llm_tokens": self.tokens,
+                "llm_share": round(self.llm / routed, 3) if routed else 0.0
+            }
+
+
+class ConfidenceRouter:
+    """Decides which jobs still need LLM enhancement after local inference.
+
+    A job's confidence score in [0, 1] blends three signals. Skill count is
+    measured against ``target_skills``. Title specificity checks whether the
+    title names any taxonomy skill, so "Django Developer" scores higher than
+    "Software Engineer". Description density counts taxonomy matches per
+    100 words. Only jobs scoring below ``threshold`` are sent to the LLM,
+    within each run's call and token caps. Jobs whose answer is already in
+    the LLM cache are enhanced without counting against the caps.
+    """
+
+    def __init__(self, threshold: Optional[float] = None, target_skills: Optional[int] = None,
+                 taxonomy: Optional[SkillsTaxonomy] = None):
+        self.threshold = Config.LLM_ROUTING_THRESHOLD if threshold is None else threshold
+        self.target_skills = max(1, target_skills or Config.LLM_ROUTING_TARGET_SKILLS)
+        self.taxonomy = taxonomy or get_skills_taxonomy()
+
+    def score(self, job: Dict, skills: List[str]) -> float:
+        count_score = min(len(skills) / self.target_skills, 1.0)
+        title_score = 1.0 if self.taxonomy.extract(job.get("title", "")) else 0.0
+
+        description = job.get("description") or ""
+        if not description:
+            return round(0.6 * count_score + 0.4 * title_score, 3)
+
+        words = max(len(description.split()), 1)
+        density = len(self.taxonomy.extract(description)) * 100 / words
+        density_score = min(density / 3, 1.0)
+
+        return round(0.4 * count_score + 0.3 * title_score + 0.3 * density_score, 3)
+
+    def estimate_tokens(self, job: Dict) -> int:
+        text_length = (len(job.get("title", "")) + len(job.get("company", "")) + len(job.get("location", ""))
+                       + min(len(job.get("description") or ""), 1500))
+        return text_length // 4 + 180
+
+    def start_run(self, max_calls: Optional[int] = None, max_tokens: Optional[int] = None,
+                  is_cached: Optional[Callable[[Dict, List[str]], bool]] = None) -> RoutingRun:
+        return RoutingRun(
+            self,
+            Config.LLM_MAX_CALLS_PER_RUN if max_calls is None else max_calls,
+            Config.LLM_MAX_TOKENS_PER_RUN if max_tokens is None else max_tokens,
+            is_cached
+        )
@@ -1,22 +1,28 @@
 import json
-from typing import List, Dict
+from typing import List, Dict, Optional
 from langchain.schema import HumanMessage
-from langchain_openai import ChatOpenAI
+from langchain_core.language_models import BaseChatModel
 
 from .base_agent import BaseAgent
+from .chat_models import create_chat_model
+from .title_rules import TitleRuleEngine
+from ..config.settings import Config
+from ..services.llm_cache import LLMResponseCache
+from ..services.skill_registry import get_skill_registry
+from ..utils.llm_scheduler import get_llm_scheduler
 
 
 class SkillsAgent(BaseAgent):
-    def __init__(self, openai_api_key: str):
+    def __init__(self, openai_api_key: str, llm: Optional[BaseChatModel] = None):
         super().__init__(openai_api_key)
 
-        self.llm = ChatOpenAI(
-            model="gpt-3.5-turbo",
-            temperature=0.1,
-            max_tokens=300
-        )
+        self.llm = llm or create_chat_model(openai_api_key)
 
+        self.llm_cache = LLMResponseCache() if Config.LLM_CACHE_ENABLED else None
+        self.skill_registry = get_skill_registry()
+        self.scheduler = get_llm_scheduler()
         self.skills_database = self._build_skills_database()
+        self.title_rules = TitleRuleEngine(self.skills_database)
 
     def _build_skills_database(self) -> Dict:
         return {
@@ -48,52 +54,218 @@ class SkillsAgent(BaseAgent):
         }
 
     def infer_skills_from_job(self, job: Dict, job_category: str) -> List[str]:
-        inferred_skills = []
-        title_lower = job['title'].lower()
-
-        category_skills = self.skills_database.get(job_category, {})
-        core_skills = category_skills.get('core_skills', [])
-        inferred_skills.extend(core_skills[:5])
-
-        title_keywords = {
-            'senior': category_skills.get('advanced_skills', [])[:3],
-            'machine learning': ['Machine Learning', 'Python', 'Scikit-learn'],
-            'data scientist': ['Python', 'R', 'SQL', 'Statistics'],
-            'python': ['Python', 'Django', 'Flask'],
-            'ai': ['AI', 'Machine Learning', 'Python']
-        }
+        core_skills = self.skills_database.get(job_category, {}).get('core_skills', [])
+        inferred_skills = core_skills[:5] + self.title_rules.match(job['title'], job_category)
 
-        for keyword, skills in title_keywords.items():
-            if keyword in title_lower:
-                inferred_skills.extend(skills)
+        return self.skill_registry.canonicalize(inferred_skills)
 
-        return list(set(inferred_skills))
+    def needs_llm(self, job: Dict) -> bool:
+        return True
 
-    def enhance_with_ai(self, job: Dict, base_skills: List[str]) -> List[str]:
-        try:
-            prompt = f"""
+    def _build_enhancement_prompt(self, job: Dict, base_skills: List[str]) -> str:
+        description = ""
+        if job.get("description"):
+            description = f"Description: {job['description'][:1500]}"
+
+        return f"""
             Based on this job, suggest 3 additional technical skills:
 
             Title: {job['title']}
             Company: {job['company']}
             Location: {job['location']}
-            Current skills: {', '.join(base_skills[:5])}
+            Current skills: {', '.join(sorted(base_skills)[:5])}
+            {description}
 
             Return only JSON array: ["skill1", "skill2", "skill3"]
             """
 
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            content = response.content.strip()
+    def _parse_skill_list(self, content: str) -> List[str]:
+        content = content.strip()
+
+        if content.startswith('```'):
+            content = content.split('\n', 1)[1].split('\n```')[0]
 
-            if content.startswith('```'):
-                content = content.split('\n', 1)[1].split('\n```')[0]
+        additional_skills = json.loads(content)
 
-            additional_skills = json.loads(content)
+        if isinstance(additional_skills, list):
+            return self.skill_registry.canonicalize(skill for skill in additional_skills if isinstance(skill, str))
 
-            if isinstance(additional_skills, list):
-                return [skill.strip() for skill in additional_skills if isinstance(skill, str)]
+        return []
+
+    def _cached_response(self, prompt: str) -> Optional[str]:
+        return self.llm_cache.get(self._model_name(), prompt) if self.llm_cache else None
+
+    def has_cached_enhancement(self, job: Dict, base_skills: List[str]) -> bool:
+        """Whether enhancing ``job`` would be answered from the LLM cache without an API call."""
+        return bool(self.llm_cache) and self.llm_cache.contains(
+            self._model_name(), self._build_enhancement_prompt(job, base_skills)
+        )
+
+    def _remember_response(self, prompt: str, content: str, additional_skills: List[str]):
+        if self.llm_cache and additional_skills:
+            self.llm_cache.put(self._model_name(), prompt, content)
+
+    def enhance_with_ai(self, job: Dict, base_skills: List[str]) -> List[str]:
+        try:
+            prompt = self._build_enhancement_prompt(job, base_skills)
+
+            content = self._cached_response(prompt)
+            if content is not None:
+                return self._parse_skill_list(content)
+
+            response = self.scheduler.invoke(self.llm, [HumanMessage(content=prompt)], self._estimate_call_tokens(prompt))
+            additional_skills = self._parse_skill_list(response.content)
+            self._remember_response(prompt, response.content, additional_skills)
+
+            return additional_skills
 
         except Exception as e:
             print(f"AI enhancement failed: {e}")
 
-        return []
\ No newline at end of file
+        return []
+
+    async def aenhance_with_ai(self, job: Dict, base_skills: List[str],
+                               timeout: Optional[float] = None) -> List[str]:
+        """Async counterpart of enhance_with_ai built on ``ainvoke``.
+
+        Failures and timeouts propagate instead of returning an empty list,
+        so concurrent callers can mark the job as errored.
+        """
+        prompt = self._build_enhancement_prompt(job, base_skills)
+
+        content = self._cached_response(prompt)
+        if content is not None:
+            return self._parse_skill_list(content)
+
+        response = await self.scheduler.ainvoke(self.llm, [HumanMessage(content=prompt)],
+                                                self._estimate_call_tokens(prompt), timeout=timeout)
+        additional_skills = self._parse_skill_list(response.content)
+        self._remember_response(prompt, response.content, additional_skills)
+
+        return additional_skills
+
+    def _model_name(self) -> str:
+        return getattr(self.llm, "model_name", None) or type(self.llm).__name__
+
+    def _estimate_tokens(self, text: str) -> int:
+        return len(text) // 4 + 1
+
+    def _estimate_call_tokens(self, prompt: str, completion_tokens: int = 60) -> int:
+        return self._estimate_tokens(prompt) + completion_tokens
+
+    def _build_batch_entry(self, index: int, job: Dict, base_skills: List[str]) -> str:
+        entry = (f"Job {index}:\n"
+                 f"Title: {job['title']}\n"
+                 f"Company: {job['company']}\n"
+                 f"Location: {job['location']}\n"
+                 f"Current skills: {', '.join(sorted(base_skills)[:5])}\n")
+        if job.get("description"):
+            entry += f"Description: {job['description'][:500]}\n"
+        return entry
+
+    def _build_batch_prompt(self, entries: List[str]) -> str:
+        return ("Based on each job below, suggest 3 additional technical skills.\n\n"
+                + "\n".join(entries)
+                + '\nReturn only a JSON object mapping each job number to its JSON array of skills, '
+                  'for example: {"0": ["skill1", "skill2", "skill3"], "1": ["skill1", "skill2", "skill3"]}')
+
+    def _plan_batches(self, entries: List[str], batch_size: int, token_budget: int) -> List[List[int]]:
+        batches = []
+        current = []
+        current_tokens = 0
+
+        for index, entry in enumerate(entries):
+            entry_tokens = self._estimate_tokens(entry)
+            if current and (len(current) >= batch_size or current_tokens + entry_tokens > token_budget):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(index)
+            current_tokens += entry_tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def _parse_batch_response(self, content: str) -> Dict[int, List[str]]:
+        content = content.strip()
+        start, end = content.find("{"), content.rfind("}")
+        if start == -1 or end <= start:
+            return {}
+
+        try:
+            parsed = json.loads(content[start:end + 1])
+        except ValueError:
+            return {}
+
+        if not isinstance(parsed, dict):
+            return {}
+
+        results = {}
+        for key, skills in parsed.items():
+            try:
+                index = int(str(key).strip().lower().replace("job", "").strip())
+            except ValueError:
+                continue
+            if isinstance(skills, list):
+                cleaned = self.skill_registry.canonicalize(skill for skill in skills if isinstance(skill, str))
+                if cleaned:
+                    results[index] = cleaned
+        return results
+
+    def enhance_batch_with_ai(self, jobs: List[Dict], base_skills_list: List[List[str]],
+                              batch_size: Optional[int] = None,
+                              token_budget: Optional[int] = None) -> List[List[str]]:
+        """Enhance many jobs with one prompt per batch.
+
+        Batches hold at most ``batch_size`` jobs and roughly ``token_budget``
+        prompt tokens. Jobs the model leaves out, or answers malformed, fall
+        back to a single enhance_with_ai call.
+        """
+        batch_size = batch_size or Config.ENHANCE_BATCH_SIZE
+        token_budget = token_budget or Config.ENHANCE_BATCH_TOKEN_BUDGET
+        model = self._model_name()
+
+        results: List[Optional[List[str]]] = [None] * len(jobs)
+        pending = []
+
+        for index, (job, base_skills) in enumerate(zip(jobs, base_skills_list)):
+            single_prompt = self._build_enhancement_prompt(job, base_skills)
+            cached = self.llm_cache.get(model, single_prompt) if self.llm_cache else None
+            if cached is not None:
+                try:
+                    results[index] = self._parse_skill_list(cached)
+                    continue
+                except ValueError:
+                    pass
+            pending.append(index)
+
+        entries = [self._build_batch_entry(i, jobs[index], base_skills_list[index]) for i, index in enumerate(pending)]
+
+        for batch in self._plan_batches(entries, batch_size, token_budget):
+            prompt = self._build_batch_prompt([entries[i] for i in batch])
+
+            try:
+                completion_tokens = 40 * len(batch) + 50
+                response = self.scheduler.invoke(self.llm.bind(max_tokens=completion_tokens),
+                                                 [HumanMessage(content=prompt)],
+                                                 self._estimate_call_tokens(prompt, completion_tokens))
+                parsed = self._parse_batch_response(response.content)
+            except Exception as e:
+                print(f"AI batch enhancement failed: {e}")
+                parsed = {}
+
+            for local_index in batch:
+                index = pending[local_index]
+                skills = parsed.get(local_index)
+
+                if skills is None:
+                    results[index] = self.enhance_with_ai(jobs[index], base_skills_list[index])
+                    continue
+
+                results[index] = skills
+                if self.llm_cache:
+                    self.llm_cache.put(model, self._build_enhancement_prompt(jobs[index], base_skills_list[index]),
+                                       json.dumps(skills))
+
+        return [skills or [] for skills in results]
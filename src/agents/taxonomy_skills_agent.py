@@ -0,0 +1,54 @@
+from typing import List, Dict, Optional
+
+from .base_agent import BaseAgent
+from .skills_agent import SkillsAgent
+from ..config.settings import Config
+from ..services.skills_taxonomy import SkillsTaxonomy, get_skills_taxonomy
+
+
+class TaxonomySkillsAgent(BaseAgent):
+    """Extracts job-specific skills by scanning the title and description against the skills taxonomy.
+
+    A job with fewer than ``min_skills`` taxonomy matches counts as a leftover.
+    It also gets the category's rule-based skills. ``needs_llm`` marks
+    leftovers for the workflow when no router is configured. The enhance
+    methods always go through ``fallback_agent``'s LLM, so whichever gate the
+    workflow uses is the only one.
+    """
+
+    def __init__(self, openai_api_key: str, fallback_agent: Optional[SkillsAgent] = None,
+                 taxonomy: Optional[SkillsTaxonomy] = None, min_skills: Optional[int] = None):
+        super().__init__(openai_api_key)
+
+        self.taxonomy = taxonomy or get_skills_taxonomy()
+        self.fallback_agent = fallback_agent or SkillsAgent(openai_api_key)
+        self.min_skills = Config.TAXONOMY_MIN_SKILLS if min_skills is None else min_skills
+
+    def extract_skills(self, job: Dict) -> List[str]:
+        return self.taxonomy.extract(job.get('title', ''), job.get('description') or '')
+
+    def needs_llm(self, job: Dict) -> bool:
+        return len(self.extract_skills(job)) < self.min_skills
+
+    def infer_skills_from_job(self, job: Dict, job_category: str) -> List[str]:
+        skills = self.extract_skills(job)
+        if len(skills) >= self.min_skills:
+            return skills
+
+        rule_skills = self.fallback_agent.infer_skills_from_job(job, job_category)
+        return skills + [skill for skill in rule_skills if skill not in skills]
+
+    def has_cached_enhancement(self, job: Dict, base_skills: List[str]) -> bool:
+        return self.fallback_agent.has_cached_enhancement(job, base_skills)
+
+    def enhance_with_ai(self, job: Dict, base_skills: List[str]) -> List[str]:
+        return self.fallback_agent.enhance_with_ai(job, base_skills)
+
+    async def aenhance_with_ai(self, job: Dict, base_skills: List[str],
+                               timeout: Optional[float] = None) -> List[str]:
+        return await self.fallback_agent.aenhance_with_ai(job, base_skills, timeout)
+
+    def enhance_batch_with_ai(self, jobs: List[Dict], base_skills_list: List[List[str]],
+                              batch_size: Optional[int] = None,
+                              token_budget: Optional[int] = None) -> List[List[str]]:
+        return self.fallback_agent.enhance_batch_with_ai(jobs, base_skills_list, batch_size, token_budget)
@@ -0,0 +1,74 @@
+import json
+import re
+import threading
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from ..config.settings import Config
+
+
+class TitleRuleEngine:
+    """Title keyword rules compiled once per job category into a single word-boundary regex.
+
+    Rules come from a JSON file. The ``default`` list applies to every
+    category, and ``categories`` adds rules for one category. A rule either
+    lists its ``skills`` or takes the first ``limit`` entries of one of the
+    category's skill lists (``category_skills``). Matching is whole-word, so
+    "ai" no longer fires on "maintenance" or "retail".
+    """
+
+    def __init__(self, skills_database: Dict, path: Optional[str] = None):
+        self.skills_database = skills_database
+        self.path = path or Config.TITLE_RULES_PATH
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.rules = json.load(f)
+
+        self._compiled: Dict[str, Tuple[Optional[Pattern], Dict[str, Tuple[str, ...]]]] = {}
+        self._lock = threading.Lock()
+        for category in skills_database:
+            self._compiled[category] = self._compile(category)
+
+    @staticmethod
+    def _normalize(keyword: str) -> str:
+        return " ".join(keyword.lower().split())
+
+    def _compile(self, category: str) -> Tuple[Optional[Pattern], Dict[str, Tuple[str, ...]]]:
+        category_skills = self.skills_database.get(category, {})
+        skills_by_keyword: Dict[str, List[str]] = {}
+
+        for rule in self.rules.get("default", []) + self.rules.get("categories", {}).get(category, []):
+            skills = list(rule.get("skills", []))
+            if rule.get("category_skills"):
+                skills += category_skills.get(rule["category_skills"], [])[:rule.get("limit")]
+
+            for keyword in rule.get("keywords", []):
+                bucket = skills_by_keyword.setdefault(self._normalize(keyword), [])
+                bucket.extend(skill for skill in skills if skill not in bucket)
+
+        if not skills_by_keyword:
+            return None, {}
+
+        alternatives = sorted(skills_by_keyword, key=len, reverse=True)
+        pattern = re.compile(
+            r"\b(?:" + "|".join(r"\s+".join(map(re.escape, keyword.split())) for keyword in alternatives) + r")\b"
+        )
+        return pattern, {keyword: tuple(skills) for keyword, skills in skills_by_keyword.items()}
+
+    def match(self, title: str, category: str) -> List[str]:
+        compiled = self._compiled.get(category)
+        if compiled is None:
+            with self._lock:
+                compiled = self._compiled.setdefault(category, self._compile(category))
+
+        pattern, skills_by_keyword = compiled
+        if pattern is None:
+            return []
+
+        skills = []
+        matched = set()
+        for found in pattern.finditer(title.lower()):
+            keyword = self._normalize(found.group(0))
+            if keyword not in matched:
+                matched.add(keyword)
+                skills.extend(skills_by_keyword[keyword])
+        return skills
@@ -18,13 +18,96 @@ class Config:
     MAX_JOBS_PER_SEARCH = int(os.getenv("MAX_JOBS_PER_SEARCH", "10"))
     SCRAPING_DELAY = int(os.getenv("SCRAPING_DELAY", "2"))
 
+    # Scraper Settings
+    SCRAPER_BACKEND = os.getenv("SCRAPER_BACKEND", "selenium")
+    HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "4"))
+    HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "15"))
+    CARD_EXTRACTION_MODE = os.getenv("CARD_EXTRACTION_MODE", "page_source")
+    SCRAPER_WORKERS = int(os.getenv("SCRAPER_WORKERS", "3"))
+    SCRAPE_MIN_RATE = float(os.getenv("SCRAPE_MIN_RATE", "0.05"))  # requests per second per host
+    SCRAPE_MAX_RATE = float(os.getenv("SCRAPE_MAX_RATE", "2.0"))
+    FETCH_DESCRIPTIONS = os.getenv("FETCH_DESCRIPTIONS", "false").lower() == "true"
+    DESCRIPTION_WORKERS = int(os.getenv("DESCRIPTION_WORKERS", "4"))
+    DESCRIPTION_MAX_PAGE_BYTES = int(os.getenv("DESCRIPTION_MAX_PAGE_BYTES", str(512 * 1024)))
+    DESCRIPTION_BYTE_BUDGET = int(os.getenv("DESCRIPTION_BYTE_BUDGET", str(20 * 1024 * 1024)))
+    DESCRIPTION_RUN_TIMEOUT = float(os.getenv("DESCRIPTION_RUN_TIMEOUT", "120"))
+    DESCRIPTION_MAX_CHARS = int(os.getenv("DESCRIPTION_MAX_CHARS", "4000"))
+    MAX_PAGES_PER_KEYWORD = int(os.getenv("MAX_PAGES_PER_KEYWORD", "1"))
+    MAX_KEYWORDS_PER_SEARCH = int(os.getenv("MAX_KEYWORDS_PER_SEARCH", "3"))  # 0 scrapes every keyword
+
+    # Browser Pool Settings
+    DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", str(SCRAPER_WORKERS)))
+    DRIVER_MAX_PAGES = int(os.getenv("DRIVER_MAX_PAGES", "50"))
+    DRIVER_WARMUP = os.getenv("DRIVER_WARMUP", "true").lower() == "true"
+
     # Data Settings
     DATA_DIR = "data"
 
+    # LLM Backend Settings
+    LLM_BACKEND = os.getenv("LLM_BACKEND", "live")  # live, record, replay or synthetic
+    LLM_RECORD_PATH = os.getenv("LLM_RECORD_PATH", os.path.join(DATA_DIR, "llm_recordings.jsonl"))
+    SYNTHETIC_LATENCY = float(os.getenv("SYNTHETIC_LATENCY", "0.5"))  # median seconds per call
+    SYNTHETIC_LATENCY_SIGMA = float(os.getenv("SYNTHETIC_LATENCY_SIGMA", "0.3"))
+    SYNTHETIC_ERROR_RATE = float(os.getenv("SYNTHETIC_ERROR_RATE", "0.0"))
+    SYNTHETIC_SEED = int(os.getenv("SYNTHETIC_SEED", "0"))
+
+    # Skill Enhancement Settings
+    ENHANCE_BATCH_SIZE = int(os.getenv("ENHANCE_BATCH_SIZE", "1"))  # 1 sends one prompt per job
+    ENHANCE_BATCH_TOKEN_BUDGET = int(os.getenv("ENHANCE_BATCH_TOKEN_BUDGET", "3000"))
+    SKILLS_EXTRACTOR = os.getenv("SKILLS_EXTRACTOR", "taxonomy")
+    SKILLS_TAXONOMY_PATH = os.getenv(
+        "SKILLS_TAXONOMY_PATH", os.path.join(os.path.dirname(__file__), "skills_taxonomy.json")
+    )
+    SKILL_CATEGORIES_PATH = os.getenv(
+        "SKILL_CATEGORIES_PATH", os.path.join(os.path.dirname(__file__), "skill_categories.json")
+    )
+    TITLE_RULES_PATH = os.getenv(
+        "TITLE_RULES_PATH", os.path.join(os.path.dirname(__file__), "title_rules.json")
+    )
+    TAXONOMY_MIN_SKILLS = int(os.getenv("TAXONOMY_MIN_SKILLS", "3"))
+    LLM_ROUTING_ENABLED = os.getenv("LLM_ROUTING_ENABLED", "true").lower() == "true"
+    LLM_ROUTING_THRESHOLD = float(os.getenv("LLM_ROUTING_THRESHOLD", "0.6"))  # jobs scoring below go to the LLM
+    LLM_ROUTING_TARGET_SKILLS = int(os.getenv("LLM_ROUTING_TARGET_SKILLS", "8"))
+    LLM_MAX_CALLS_PER_RUN = int(os.getenv("LLM_MAX_CALLS_PER_RUN", "0"))  # 0 means no cap
+    LLM_MAX_TOKENS_PER_RUN = int(os.getenv("LLM_MAX_TOKENS_PER_RUN", "0"))
+    LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "4"))
+    LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "30"))
+    LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+    LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))
+    LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+    LLM_BACKOFF_BASE = float(os.getenv("LLM_BACKOFF_BASE", "1.0"))  # seconds, doubled per attempt
+    LLM_BACKOFF_MAX = float(os.getenv("LLM_BACKOFF_MAX", "30"))
+    LLM_CIRCUIT_FAILURES = int(os.getenv("LLM_CIRCUIT_FAILURES", "5"))  # consecutive failed attempts
+    LLM_CIRCUIT_RESET = float(os.getenv("LLM_CIRCUIT_RESET", "60"))  # seconds before a trial call
+
+    # Analytics Settings
+    ANALYSIS_APPROXIMATE = os.getenv("ANALYSIS_APPROXIMATE", "false").lower() == "true"
+    SKETCH_CAPACITY = int(os.getenv("SKETCH_CAPACITY", "1000"))  # skills tracked by Space-Saving
+    SKETCH_EPSILON = float(os.getenv("SKETCH_EPSILON", "0.001"))  # Count-Min overcount, as a share of mentions
+    SKETCH_DELTA = float(os.getenv("SKETCH_DELTA", "0.01"))  # probability an estimate exceeds that bound
+
+    SKILL_TRENDS_ENABLED = os.getenv("SKILL_TRENDS_ENABLED", "true").lower() == "true"
+
+    # Pipeline Settings
+    STREAMING_PIPELINE = os.getenv("STREAMING_PIPELINE", "false").lower() == "true"
+    STREAM_WORKERS = int(os.getenv("STREAM_WORKERS", "4"))
+
+    # Incremental Run Settings
+    SEEN_JOBS_ENABLED = os.getenv("SEEN_JOBS_ENABLED", "true").lower() == "true"
+    SEEN_JOBS_BLOOM = os.getenv("SEEN_JOBS_BLOOM", "true").lower() == "true"
+
+    # Cache Settings
+    SCRAPE_CACHE_ENABLED = os.getenv("SCRAPE_CACHE_ENABLED", "true").lower() == "true"
+    SCRAPE_CACHE_MAX_ENTRIES = int(os.getenv("SCRAPE_CACHE_MAX_ENTRIES", "500"))
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "20000"))
+    LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "0"))  # seconds, 0 keeps entries until evicted
+    SCRAPE_CACHE_TTL_RATIO = float(os.getenv("SCRAPE_CACHE_TTL_RATIO", str(1 / 168)))  # "Last Week" -> 1 hour
+
     @staticmethod
     def validate_config():
         """Validate configuration"""
-        if not Config.OPENAI_API_KEY:
+        if Config.LLM_BACKEND in ("live", "record") and not Config.OPENAI_API_KEY:
             return False, "OpenAI API key is required"
 
         return True, "Configuration is valid"
\ No newline at end of file
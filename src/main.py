@@ -15,11 +15,13 @@ try:
     from config.job_keywords import JobKeywords
     from config.settings import Config
     from services.analysis_service import AnalysisService
+    from services.skill_analytics import SkillAnalytics
 except ImportError:
     from src.workflows.skills_workflow import SkillsExtractionWorkflow
     from src.config.job_keywords import JobKeywords
     from src.config.settings import Config
     from src.services.analysis_service import AnalysisService
+    from src.services.skill_analytics import SkillAnalytics
 
 st.set_page_config(
     page_title="Skills Miner",
@@ -244,6 +246,22 @@ def main():
         render_main_interface()
 
 
+def get_analysis_service() -> AnalysisService:
+    if 'analysis_service' not in st.session_state:
+        st.session_state.analysis_service = AnalysisService()
+    return st.session_state.analysis_service
+
+
+def get_skill_analytics(results: Dict) -> SkillAnalytics:
+    """The run's incrementally maintained counts, kept in the session next to the results they describe."""
+    if st.session_state.get('skill_analytics_results') is not results:
+        analytics = SkillAnalytics()
+        analytics.add_jobs(results.get("jobs_with_skills", []))
+        st.session_state.skill_analytics = analytics
+        st.session_state.skill_analytics_results = results
+    return st.session_state.skill_analytics
+
+
 def render_main_interface():
     col1, col2 = st.columns([3, 2])
 
@@ -344,17 +362,41 @@ def run_analysis(job_category: str, location: str, date_filter: str):
             progress_bar.progress(33)
             st.write("📊 Scraping LinkedIn...")
 
-            results = workflow.run_analysis(
-                job_category=job_category,
-                location=location,
-                date_filter=date_filter,
-                search_keywords=search_keywords
-            )
+            if Config.STREAMING_PIPELINE:
+                live_status = st.empty()
+                live_analytics = SkillAnalytics()
+
+                for event, payload in workflow.stream_analysis(
+                        job_category=job_category,
+                        location=location,
+                        date_filter=date_filter,
+                        search_keywords=search_keywords
+                ):
+                    if event == "job":
+                        live_analytics.add_job(payload)
+                        top_skills = ", ".join(entry["skill"] for entry in live_analytics.skill_frequencies(top_k=3))
+                        live_status.markdown(
+                            f'<p style="color: #ffffff;">✅ {len(live_analytics)} jobs analyzed - latest: '
+                            f'{payload.get("title")} at {payload.get("company")} ({payload.get("skills_count", 0)} skills)'
+                            f' - top skills so far: {top_skills}</p>',
+                            unsafe_allow_html=True)
+                    else:
+                        results = payload
+            else:
+                results = workflow.run_analysis(
+                    job_category=job_category,
+                    location=location,
+                    date_filter=date_filter,
+                    search_keywords=search_keywords
+                )
 
             progress_bar.progress(66)
             st.write("🤖 LangChain agent extracting skills...")
 
             st.session_state.analysis_results = results
+            if workflow.last_analytics is not None:
+                st.session_state.skill_analytics = workflow.last_analytics
+                st.session_state.skill_analytics_results = results
 
             progress_bar.progress(100)
             st.success("✅ LangGraph workflow completed!")
@@ -376,14 +418,15 @@ def render_results():
 
     jobs = results.get("jobs_with_skills", [])
     skills = results.get("extracted_skills", [])
+    analytics = get_skill_analytics(results)
 
     st.markdown(f'<h1 class="section-title">📊 {results.get("job_category", "Job")} Skills Analysis</h1>',
                 unsafe_allow_html=True)
 
     col1, col2, col3, col4 = st.columns(4)
 
-    jobs_with_skills = len([j for j in jobs if j.get("skills")])
-    unique_companies = len(set([job.get("company", "") for job in jobs if job.get("company")]))
+    jobs_with_skills = analytics.jobs_with_skills
+    unique_companies = analytics.company_analysis()["unique_companies"]
 
     with col1:
         st.markdown(f'''
@@ -425,18 +468,18 @@ def render_results():
     tab1, tab2, tab3 = st.tabs(["🎯 Skills Overview", "💼 Job Details", "📈 Skills Analytics"])
 
     with tab1:
-        render_skills_overview(skills, jobs)
+        render_skills_overview(skills, jobs, analytics)
 
     with tab2:
         render_job_details(jobs)
 
     with tab3:
-        render_skills_analytics(jobs, skills)
+        render_skills_analytics(jobs, skills, analytics)
 
     st.markdown('</div>', unsafe_allow_html=True)
 
 
-def render_skills_overview(skills: List[str], jobs: List[Dict]):
+def render_skills_overview(skills: List[str], jobs: List[Dict], analytics: SkillAnalytics):
     if not skills:
         st.warning("⚠️ No skills extracted. Try a different search or check if jobs have descriptions.")
         return
@@ -463,8 +506,7 @@ def render_skills_overview(skills: List[str], jobs: List[Dict]):
             <h4 style="color: white; margin-bottom: 1rem;">📊 Quick Stats</h4>
         """, unsafe_allow_html=True)
 
-        analysis_service = AnalysisService()
-        skill_frequencies = analysis_service.analyze_skills_frequency(jobs)
+        skill_frequencies = analytics.skill_frequencies(top_k=1)
 
         if skill_frequencies:
             most_common = skill_frequencies[0]
@@ -472,13 +514,12 @@ def render_skills_overview(skills: List[str], jobs: List[Dict]):
                 f'<p style="color: #ffffff;"><strong style="color: #FF6B6B;">🏆 Most Common Skill:</strong> {most_common["skill"]} ({most_common["frequency"]} jobs)</p>',
                 unsafe_allow_html=True)
 
-            avg_skills_per_job = sum(len(job.get("skills", [])) for job in jobs if job.get("skills")) / max(
-                len([j for j in jobs if j.get("skills")]), 1)
+            avg_skills_per_job = analytics.avg_skills_per_job
             st.markdown(
                 f'<p style="color: #ffffff;"><strong style="color: #FF8E53;">📈 Avg Skills per Job:</strong> {avg_skills_per_job:.1f}</p>',
                 unsafe_allow_html=True)
 
-            jobs_with_skills_pct = (len([j for j in jobs if j.get("skills")]) / max(len(jobs), 1)) * 100
+            jobs_with_skills_pct = (analytics.jobs_with_skills / max(analytics.total_jobs, 1)) * 100
             st.markdown(
                 f'<p style="color: #ffffff;"><strong style="color: #4ECDC4;">✅ Success Rate:</strong> {jobs_with_skills_pct:.1f}% jobs analyzed</p>',
                 unsafe_allow_html=True)
@@ -491,7 +532,7 @@ def render_skills_overview(skills: List[str], jobs: List[Dict]):
             <h4 style="color: white; margin-bottom: 1rem;">📂 Skill Categories</h4>
         """, unsafe_allow_html=True)
 
-        analysis_service = AnalysisService()
+        analysis_service = get_analysis_service()
         categories = analysis_service.categorize_skills(skills)
 
         for category, category_skills in categories.items():
@@ -560,20 +601,19 @@ def render_job_details(jobs: List[Dict]):
             st.markdown('</div></div></div>', unsafe_allow_html=True)
 
 
-def render_skills_analytics(jobs: List[Dict], skills: List[str]):
+def render_skills_analytics(jobs: List[Dict], skills: List[str], analytics: SkillAnalytics):
     if not skills:
         st.warning("⚠️ No skills data available for analytics")
         return
 
-    analysis_service = AnalysisService()
+    analysis_service = get_analysis_service()
 
     col1, col2 = st.columns(2)
 
     with col1:
         st.markdown('<h3 style="color: #FF6B6B;">📊 Top Skills by Frequency</h3>', unsafe_allow_html=True)
 
-        skill_frequencies = analysis_service.analyze_skills_frequency(jobs)
-        top_skills = skill_frequencies[:15]
+        top_skills = analytics.skill_frequencies(top_k=15)
 
         if top_skills:
             df_skills = pd.DataFrame(top_skills)
@@ -602,19 +642,20 @@ def render_skills_analytics(jobs: List[Dict], skills: List[str]):
     with col2:
         st.markdown('<h3 style="color: #FF8E53;">🔗 Skills Co-occurrence</h3>', unsafe_allow_html=True)
 
-        skill_combinations = analysis_service.find_skill_combinations(jobs)
-        top_combinations = skill_combinations[:10]
+        top_combinations = analysis_service.find_skill_bundles(jobs, min_size=3, top_k=10)
+        if not top_combinations:
+            top_combinations = analysis_service.find_skill_bundles(jobs, min_size=2, top_k=10)
 
         if top_combinations:
             st.markdown("""
             <div class="featured-card" style="border-color: #FF8E53;">
-                <h4 style="color: white; margin-bottom: 1rem;">Top skill combinations</h4>
+                <h4 style="color: white; margin-bottom: 1rem;">Top skill bundles</h4>
             """, unsafe_allow_html=True)
 
             for combo in top_combinations:
                 skills_str = " + ".join(combo["skills"])
                 st.markdown(
-                    f'<p style="color: #ffffff;">• <strong style="color: #FFE66D;">{skills_str}</strong> <span style="color: #4ECDC4;">({combo["frequency"]} jobs)</span></p>',
+                    f'<p style="color: #ffffff;">• <strong style="color: #FFE66D;">{skills_str}</strong> <span style="color: #4ECDC4;">({combo["frequency"]} jobs, lift {combo["lift"]:.1f})</span></p>',
                     unsafe_allow_html=True)
 
             st.markdown('</div>', unsafe_allow_html=True)
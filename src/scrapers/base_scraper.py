@@ -0,0 +1,51 @@
+import urllib.parse
+from abc import ABC, abstractmethod
+from typing import List, Dict, Optional
+
+from ..config.job_keywords import JobKeywords
+from ..config.settings import Config
+
+LINKEDIN_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+LINKEDIN_PAGE_SIZE = 25
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+]
+
+
+class BaseScraper(ABC):
+    def __init__(self, search_url: Optional[str] = None, max_cards: Optional[int] = None,
+                 max_pages: Optional[int] = None, seen_index=None):
+        self.search_url = search_url or LINKEDIN_SEARCH_URL
+        self.max_cards = max_cards or Config.MAX_JOBS_PER_SEARCH
+        self.max_pages = max(1, max_pages or Config.MAX_PAGES_PER_KEYWORD)
+        self.seen_index = seen_index
+
+    @abstractmethod
+    def search_jobs_for_keyword(self, keyword: str, location: str, date_filter: str) -> List[Dict]:
+        pass
+
+    def warm_up(self) -> int:
+        return 0
+
+    def _has_more_pages(self, page: int, page_jobs: List[Dict], jobs: List[Dict]) -> bool:
+        """Keep paging until the card cap is hit, a page comes back empty, or we reach known postings."""
+        if not page_jobs or page + 1 >= self.max_pages or len(jobs) >= self.max_cards:
+            return False
+
+        if self.seen_index and any(self.seen_index.contains(job) for job in page_jobs):
+            return False
+
+        return True
+
+    def _build_linkedin_url(self, keyword: str, location: str, date_filter: str, start: int = 0) -> str:
+        date_param = JobKeywords.get_date_filter(date_filter)
+
+        keyword_encoded = urllib.parse.quote_plus(keyword)
+        location_encoded = urllib.parse.quote_plus(location)
+
+        url = f"{self.search_url}?keywords={keyword_encoded}&location={location_encoded}&f_TPR={date_param}"
+        if start:
+            url += f"&start={start}"
+        return url
@@ -0,0 +1,119 @@
+import urllib.parse
+from typing import List, Dict, Optional, Tuple
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+from .selector_stats import SelectorStats
+
+CARD_SELECTORS = [
+    ".job-search-card",
+    ".base-search-card",
+    "[data-view-name='job-card']",
+    ".jobs-search__results-list li"
+]
+
+TITLE_SELECTORS = [
+    "h3.base-search-card__title a",
+    ".base-search-card__title a",
+    "h3 a",
+    "h3"
+]
+
+COMPANY_SELECTORS = [
+    "h4.base-search-card__subtitle a",
+    ".base-search-card__subtitle a",
+    "h4"
+]
+
+LOCATION_SELECTORS = [
+    ".job-search-card__location",
+    ".base-search-card__metadata span",
+    "[data-test='job-location']"
+]
+
+URL_SELECTORS = [
+    "a.base-card__full-link",
+    "a[href*='/jobs/view/']",
+    "h3 a"
+]
+
+
+def normalize_job_url(url: Optional[str]) -> Optional[str]:
+    if not url:
+        return None
+
+    parts = urllib.parse.urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        return None
+    return urllib.parse.urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+
+
+def build_job_record(title: Optional[str], company: Optional[str], location: Optional[str],
+                     search_keyword: str, url: Optional[str] = None) -> Optional[Dict]:
+    if title and company and location:
+        return {
+            "title": title,
+            "company": company,
+            "location": location,
+            "search_keyword": search_keyword,
+            "scraped_at": datetime.now().isoformat(),
+            "source": "LinkedIn",
+            "url": normalize_job_url(url)
+        }
+
+    return None
+
+
+def select_text(element, selectors: List[str]) -> Optional[str]:
+    for selector in selectors:
+        elem = element.select_one(selector)
+        if elem is None:
+            continue
+
+        text = elem.get("title") or " ".join(elem.get_text(" ", strip=True).split())
+        if text and len(text) > 2:
+            return text
+    return None
+
+
+def select_href(element, selectors: List[str]) -> Optional[str]:
+    for selector in selectors:
+        elem = element.select_one(selector)
+        if elem is not None and elem.get("href"):
+            return elem["href"]
+    return None
+
+
+def find_card_elements(soup: BeautifulSoup, selectors: Optional[List[str]] = None) -> Tuple[Optional[str], List]:
+    for selector in selectors or CARD_SELECTORS:
+        cards = soup.select(selector)
+        if cards:
+            return selector, cards
+    return None, []
+
+
+def parse_job_cards(html: str, search_keyword: str, limit: Optional[int] = None,
+                    card_selectors: Optional[List[str]] = None,
+                    selector_stats: Optional[SelectorStats] = None) -> List[Dict]:
+    soup = BeautifulSoup(html, "html.parser")
+    selectors = card_selectors or (selector_stats.ordered(CARD_SELECTORS) if selector_stats else CARD_SELECTORS)
+
+    selector, cards = find_card_elements(soup, selectors)
+    if selector and selector_stats:
+        selector_stats.record_hit(selector)
+
+    jobs = []
+
+    for card in cards[:limit]:
+        job_data = build_job_record(
+            select_text(card, TITLE_SELECTORS),
+            select_text(card, COMPANY_SELECTORS),
+            select_text(card, LOCATION_SELECTORS),
+            search_keyword,
+            select_href(card, URL_SELECTORS)
+        )
+        if job_data:
+            jobs.append(job_data)
+
+    return jobs
@@ -0,0 +1,176 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from typing import Callable, Dict, List, Optional
+
+import requests
+from bs4 import BeautifulSoup
+
+from .base_scraper import LINKEDIN_SEARCH_URL
+from .http_scraper import HttpSessionPool, get_session_pool, retry_after_seconds
+from ..config.settings import Config
+from ..utils.rate_limiter import AdaptiveRateLimiter, get_rate_limiter
+
+DESCRIPTION_SELECTORS = [
+    ".show-more-less-html__markup",
+    ".description__text",
+    ".jobs-description__content",
+    "#job-details"
+]
+
+
+def extract_description(html: str, max_chars: Optional[int] = None) -> Optional[str]:
+    soup = BeautifulSoup(html, "html.parser")
+
+    for selector in DESCRIPTION_SELECTORS:
+        elem = soup.select_one(selector)
+        if elem is None:
+            continue
+
+        text = "\n".join(line for line in elem.get_text("\n", strip=True).splitlines() if line)
+        if text:
+            return text[:max_chars or Config.DESCRIPTION_MAX_CHARS]
+    return None
+
+
+class ByteBudget:
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def take(self, size: int) -> bool:
+        with self._lock:
+            if self.used + size > self.limit:
+                return False
+            self.used += size
+            return True
+
+
+class DescriptionRun:
+    """One run's shared byte budget and deadline, for callers that fetch descriptions job by job."""
+
+    def __init__(self, fetcher: "JobDescriptionFetcher"):
+        self.fetcher = fetcher
+        self.budget = ByteBudget(fetcher.byte_budget)
+        self.deadline = time.monotonic() + fetcher.run_timeout
+        self.fetched = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, job: Dict) -> bool:
+        """Fetch ``job``'s description in the calling thread. Returns False when skipped or out of budget."""
+        if not job.get("url") or job.get("description") or time.monotonic() >= self.deadline:
+            return False
+
+        description = self.fetcher._fetch_one(job["url"], self.budget, self.deadline)
+        if not description:
+            return False
+
+        job["description"] = description
+        with self._lock:
+            self.fetched += 1
+        return True
+
+
+class JobDescriptionFetcher:
+    """Fetches job detail pages concurrently and writes their descriptions into the job records.
+
+    A run is bounded three ways. ``workers`` caps concurrency. ``byte_budget``
+    caps the total bytes read, with ``max_page_bytes`` as the cap per page.
+    ``run_timeout`` caps wall-clock time, so one slow page cannot hold up the
+    pipeline.
+    """
+
+    def __init__(self, session_pool: Optional[HttpSessionPool] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None, workers: Optional[int] = None,
+                 timeout: Optional[float] = None, max_page_bytes: Optional[int] = None,
+                 byte_budget: Optional[int] = None, run_timeout: Optional[float] = None):
+        self.session_pool = session_pool or get_session_pool()
+        self.rate_limiter = rate_limiter or get_rate_limiter(LINKEDIN_SEARCH_URL)
+        self.workers = max(1, workers or Config.DESCRIPTION_WORKERS)
+        self.timeout = timeout or Config.HTTP_TIMEOUT
+        self.max_page_bytes = max_page_bytes or Config.DESCRIPTION_MAX_PAGE_BYTES
+        self.byte_budget = byte_budget or Config.DESCRIPTION_BYTE_BUDGET
+        self.run_timeout = run_timeout or Config.DESCRIPTION_RUN_TIMEOUT
+
+    def _download(self, url: str, budget: ByteBudget, deadline: float) -> Optional[str]:
+        """Read the whole page, or return None if it fails, is throttled or has to be cut short.
+
+        Only complete reads count as a success for the rate limiter; 429 and
+        5xx responses count as throttling. A page cut short by the deadline,
+        the byte budget or ``max_page_bytes`` is discarded rather than parsed.
+        """
+        if time.monotonic() >= deadline:
+            return None
+
+        self.rate_limiter.acquire()
+
+        with self.session_pool.session() as session:
+            with session.get(url, timeout=self.timeout, stream=True) as response:
+                if response.status_code == 429 or response.status_code >= 500:
+                    self.rate_limiter.record_throttle(retry_after_seconds(response))
+                    return None
+                if not response.ok:
+                    return None
+
+                chunks = []
+                page_bytes = 0
+                for chunk in response.iter_content(chunk_size=16384):
+                    page_bytes += len(chunk)
+                    if (time.monotonic() >= deadline or page_bytes > self.max_page_bytes
+                            or not budget.take(len(chunk))):
+                        return None
+                    chunks.append(chunk)
+
+                encoding = response.encoding or "utf-8"
+
+        self.rate_limiter.record_success()
+        return b"".join(chunks).decode(encoding, errors="replace")
+
+    def _fetch_one(self, url: str, budget: ByteBudget, deadline: float) -> Optional[str]:
+        try:
+            html = self._download(url, budget, deadline)
+            return extract_description(html) if html else None
+        except requests.exceptions.RetryError as e:
+            # The session already retried 5xx responses; a persistent server error is a throttle signal
+            self.rate_limiter.record_throttle()
+            print(f"Failed to fetch description from {url}: {e}")
+            return None
+        except requests.RequestException as e:
+            print(f"Failed to fetch description from {url}: {e}")
+            return None
+
+    def start_run(self) -> DescriptionRun:
+        """Start a run whose byte budget and deadline are shared by every ``DescriptionRun.fetch`` call."""
+        return DescriptionRun(self)
+
+    def fetch_descriptions(self, jobs: List[Dict],
+                           on_description: Optional[Callable[[Dict], None]] = None) -> int:
+        pending = [job for job in jobs if job.get("url") and not job.get("description")]
+        if not pending:
+            return 0
+
+        budget = ByteBudget(self.byte_budget)
+        deadline = time.monotonic() + self.run_timeout
+        fetched = 0
+
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="description-worker")
+        futures = {executor.submit(self._fetch_one, job["url"], budget, deadline): job for job in pending}
+
+        try:
+            for future in as_completed(futures, timeout=self.run_timeout):
+                description = future.result()
+                if description:
+                    job = futures[future]
+                    job["description"] = description
+                    fetched += 1
+                    if on_description:
+                        on_description(job)
+
+        except FuturesTimeout:
+            print(f"Description fetching stopped after {self.run_timeout}s with {fetched}/{len(pending)} fetched")
+
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return fetched
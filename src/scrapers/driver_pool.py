@@ -0,0 +1,182 @@
+import atexit
+import queue
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from .base_scraper import USER_AGENTS
+from ..config.settings import Config
+
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+
+
+def resolve_chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process."""
+    global _chromedriver_path
+
+    with _chromedriver_lock:
+        if _chromedriver_path is None:
+            _chromedriver_path = ChromeDriverManager().install()
+
+    return _chromedriver_path
+
+
+class PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages_served = 0
+
+
+class ChromeDriverPool:
+    """Keeps headless Chrome instances alive between searches.
+
+    Drivers are health-checked when they are handed out and recycled once
+    they have served ``max_pages_per_driver`` pages.
+    """
+
+    def __init__(self, size: Optional[int] = None, max_pages_per_driver: Optional[int] = None,
+                 acquire_timeout: float = 120.0):
+        self.size = max(1, size or Config.DRIVER_POOL_SIZE)
+        self.max_pages_per_driver = max(1, max_pages_per_driver or Config.DRIVER_MAX_PAGES)
+        self.acquire_timeout = acquire_timeout
+
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _build_options(self) -> Options:
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument(f"--user-agent={random.choice(USER_AGENTS)}")
+        return chrome_options
+
+    def _create_driver(self) -> PooledDriver:
+        service = Service(resolve_chromedriver_path())
+        return PooledDriver(webdriver.Chrome(service=service, options=self._build_options()))
+
+    def _reserve_slot(self) -> bool:
+        with self._lock:
+            if self._closed or self._created >= self.size:
+                return False
+            self._created += 1
+            return True
+
+    def _free_slot(self):
+        with self._lock:
+            self._created -= 1
+
+    def _discard(self, pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+        self._free_slot()
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        try:
+            pooled.driver.current_url
+            return bool(pooled.driver.window_handles)
+        except Exception:
+            return False
+
+    def warm_up(self, count: Optional[int] = None) -> int:
+        """Start up to ``count`` drivers in parallel so the first searches don't pay for startup."""
+        wanted = min(count or self.size, self.size)
+        slots = 0
+        while self._idle.qsize() + slots < wanted and self._reserve_slot():
+            slots += 1
+
+        if not slots:
+            return 0
+
+        def start_driver(_):
+            try:
+                return self._create_driver()
+            except Exception as e:
+                print(f"Failed to setup Chrome driver: {e}")
+                self._free_slot()
+                return None
+
+        with ThreadPoolExecutor(max_workers=slots) as executor:
+            started = [pooled for pooled in executor.map(start_driver, range(slots)) if pooled]
+
+        for pooled in started:
+            self._idle.put(pooled)
+
+        return len(started)
+
+    def acquire(self) -> PooledDriver:
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                if self._reserve_slot():
+                    try:
+                        return self._create_driver()
+                    except Exception:
+                        self._free_slot()
+                        raise
+
+                try:
+                    pooled = self._idle.get(timeout=self.acquire_timeout)
+                except queue.Empty:
+                    raise TimeoutError("Timed out waiting for a free Chrome driver")
+
+            if self._is_healthy(pooled):
+                return pooled
+
+            self._discard(pooled)
+
+    def release(self, pooled: PooledDriver):
+        if self._closed or pooled.pages_served >= self.max_pages_per_driver:
+            self._discard(pooled)
+            return
+
+        self._idle.put(pooled)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "created": self._created,
+            "idle": self._idle.qsize()
+        }
+
+    def close(self):
+        self._closed = True
+        drivers: List[PooledDriver] = []
+        while True:
+            try:
+                drivers.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+        for pooled in drivers:
+            self._discard(pooled)
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> ChromeDriverPool:
+    """Process-wide pool shared by every scraper and workflow run."""
+    global _shared_pool
+
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = ChromeDriverPool()
+            atexit.register(_shared_pool.close)
+
+    return _shared_pool
@@ -0,0 +1,125 @@
+import queue
+import random
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .base_scraper import BaseScraper, USER_AGENTS, LINKEDIN_PAGE_SIZE
+from .card_parser import parse_job_cards
+from .selector_stats import SelectorStats, get_selector_stats
+from ..config.settings import Config
+from ..utils.rate_limiter import get_rate_limiter
+
+
+class HttpSessionPool:
+    """A fixed set of keep-alive ``requests`` sessions, each used by one thread at a time."""
+
+    def __init__(self, size: Optional[int] = None):
+        self.size = max(1, size or Config.HTTP_POOL_SIZE)
+        self._sessions = queue.Queue()
+
+        for _ in range(self.size):
+            self._sessions.put(self._create_session())
+
+    def _create_session(self) -> requests.Session:
+        retries = Retry(total=2, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504],
+                        allowed_methods=["GET"])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({
+            "User-Agent": random.choice(USER_AGENTS),
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Language": "en-US,en;q=0.9"
+        })
+        return session
+
+    @contextmanager
+    def session(self):
+        session = self._sessions.get()
+        try:
+            yield session
+        finally:
+            self._sessions.put(session)
+
+    def close(self):
+        for _ in range(self.size):
+            self._sessions.get().close()
+
+
+def retry_after_seconds(response: requests.Response) -> Optional[float]:
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+_shared_session_pool = None
+_shared_session_lock = threading.Lock()
+
+
+def get_session_pool() -> HttpSessionPool:
+    global _shared_session_pool
+
+    with _shared_session_lock:
+        if _shared_session_pool is None:
+            _shared_session_pool = HttpSessionPool()
+
+    return _shared_session_pool
+
+
+class LinkedInHttpScraper(BaseScraper):
+    """Reads the server-rendered guest search page without starting a browser."""
+
+    def __init__(self, session_pool: Optional[HttpSessionPool] = None, search_url: Optional[str] = None,
+                 timeout: Optional[float] = None, max_cards: Optional[int] = None,
+                 max_pages: Optional[int] = None, seen_index=None,
+                 selector_stats: Optional[SelectorStats] = None):
+        super().__init__(search_url, max_cards, max_pages, seen_index)
+        self.session_pool = session_pool or get_session_pool()
+        self.timeout = timeout or Config.HTTP_TIMEOUT
+        self.rate_limiter = get_rate_limiter(self.search_url)
+        self.selector_stats = selector_stats or get_selector_stats()
+
+    def search_jobs_for_keyword(self, keyword: str, location: str, date_filter: str) -> List[Dict]:
+        jobs = []
+
+        try:
+            for page in range(self.max_pages):
+                search_url = self._build_linkedin_url(keyword, location, date_filter, start=page * LINKEDIN_PAGE_SIZE)
+                page_jobs = self._fetch_page(search_url, keyword, self.max_cards - len(jobs))
+                jobs.extend(page_jobs)
+
+                if not self._has_more_pages(page, page_jobs, jobs):
+                    break
+
+        except requests.RequestException as e:
+            print(f"Error scraping jobs for '{keyword}': {e}")
+
+        return jobs
+
+    def _fetch_page(self, search_url: str, keyword: str, limit: int) -> List[Dict]:
+        self.rate_limiter.acquire()
+        with self.session_pool.session() as session:
+            response = session.get(search_url, timeout=self.timeout)
+
+        if response.status_code == 429:
+            print(f"Rate limited while scraping jobs for '{keyword}'")
+            self.rate_limiter.record_throttle(retry_after_seconds(response))
+            return []
+
+        response.raise_for_status()
+        jobs = parse_job_cards(response.text, keyword, limit=limit, selector_stats=self.selector_stats)
+
+        if jobs:
+            self.rate_limiter.record_success()
+        else:
+            self.rate_limiter.record_throttle()
+
+        return jobs
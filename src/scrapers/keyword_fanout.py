@@ -0,0 +1,72 @@
+import queue
+import threading
+from typing import Callable, Dict, List, Optional
+
+from .base_scraper import BaseScraper
+from ..config.settings import Config
+
+
+class KeywordFanout:
+    """Scrapes keywords with a pool of worker threads, each owning its own scraper.
+
+    Workers pull keywords from a shared queue. Pacing comes from the per-host
+    rate limiter that every scraper shares, so adding workers never exceeds the
+    politeness budget. Results are merged back in keyword order, so the output
+    does not depend on timing. A worker whose scraper fails to start leaves
+    its keywords to the others; if none can start, ``run_grouped`` raises.
+    """
+
+    def __init__(self, scraper_factory: Callable[[], BaseScraper], workers: Optional[int] = None):
+        self.scraper_factory = scraper_factory
+        self.workers = max(1, workers or Config.SCRAPER_WORKERS)
+
+    def run(self, keywords: List[str], location: str, date_filter: str,
+            on_result: Optional[Callable[[int, str, List[Dict]], None]] = None) -> List[Dict]:
+        results = self.run_grouped(keywords, location, date_filter, on_result)
+        return [job for jobs in results for job in jobs]
+
+    def run_grouped(self, keywords: List[str], location: str, date_filter: str,
+                    on_result: Optional[Callable[[int, str, List[Dict]], None]] = None) -> List[List[Dict]]:
+        work = queue.Queue()
+        for index, keyword in enumerate(keywords):
+            work.put((index, keyword))
+
+        results: List[List[Dict]] = [[] for _ in keywords]
+        startup_errors: List[Exception] = []
+
+        def worker():
+            try:
+                scraper = self.scraper_factory()
+            except Exception as e:
+                print(f"Failed to start scraper worker {threading.current_thread().name}: {e}")
+                startup_errors.append(e)
+                return
+
+            while True:
+                try:
+                    index, keyword = work.get_nowait()
+                except queue.Empty:
+                    return
+
+                try:
+                    results[index] = scraper.search_jobs_for_keyword(keyword, location, date_filter)
+                except Exception as e:
+                    print(f"Error scraping jobs for '{keyword}': {e}")
+
+                if on_result:
+                    on_result(index, keyword, results[index])
+
+        threads = [
+            threading.Thread(target=worker, name=f"keyword-worker-{i}", daemon=True)
+            for i in range(min(self.workers, len(keywords)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if not work.empty():
+            error = startup_errors[0] if startup_errors else None
+            raise RuntimeError(f"No scraper worker could start: {error}") from error
+
+        return results
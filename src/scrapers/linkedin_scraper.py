@@ -1,144 +1,117 @@
-import time
-import urllib.parse
-import random
 from typing import List, Dict, Optional
-from datetime import datetime
 
-from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 
-from ..config.job_keywords import JobKeywords
-
-
-class LinkedInScraper:
-    def __init__(self):
+from .base_scraper import BaseScraper, LINKEDIN_PAGE_SIZE
+from .card_parser import (
+    CARD_SELECTORS, TITLE_SELECTORS, COMPANY_SELECTORS, LOCATION_SELECTORS, URL_SELECTORS,
+    build_job_record, parse_job_cards
+)
+from .driver_pool import ChromeDriverPool, get_driver_pool
+from .selector_stats import SelectorStats, get_selector_stats
+from ..config.settings import Config
+from ..utils.rate_limiter import get_rate_limiter
+
+
+class LinkedInScraper(BaseScraper):
+    def __init__(self, driver_pool: Optional[ChromeDriverPool] = None, search_url: Optional[str] = None,
+                 extraction_mode: Optional[str] = None, max_cards: Optional[int] = None,
+                 max_pages: Optional[int] = None, selector_stats: Optional[SelectorStats] = None,
+                 seen_index=None):
+        super().__init__(search_url, max_cards, max_pages, seen_index)
+        self.driver_pool = driver_pool or get_driver_pool()
+        self.selector_stats = selector_stats or get_selector_stats()
+        self.extraction_mode = extraction_mode or Config.CARD_EXTRACTION_MODE
+        self.rate_limiter = get_rate_limiter(self.search_url)
         self.driver = None
 
-    def _setup_chrome_driver(self):
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-
-            user_agents = [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            ]
-            chrome_options.add_argument(f"--user-agent={random.choice(user_agents)}")
-
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-
-            return True
+    def warm_up(self) -> int:
+        if not Config.DRIVER_WARMUP:
+            return 0
+        return self.driver_pool.warm_up()
 
+    def search_jobs_for_keyword(self, keyword: str, location: str, date_filter: str) -> List[Dict]:
+        try:
+            lease = self.driver_pool.acquire()
         except Exception as e:
             print(f"Failed to setup Chrome driver: {e}")
-            return False
-
-    def search_jobs_for_keyword(self, keyword: str, location: str, date_filter: str) -> List[Dict]:
-        if not self._setup_chrome_driver():
             return []
 
         jobs = []
 
         try:
-            search_url = self._build_linkedin_url(keyword, location, date_filter)
-
-            self.driver.get(search_url)
-            time.sleep(random.uniform(3, 5))
+            self.driver = lease.driver
 
-            job_cards = self._find_job_cards()
+            for page in range(self.max_pages):
+                search_url = self._build_linkedin_url(keyword, location, date_filter, start=page * LINKEDIN_PAGE_SIZE)
+                page_jobs = self._scrape_page(search_url, keyword, self.max_cards - len(jobs))
+                lease.pages_served += 1
+                jobs.extend(page_jobs)
 
-            for i, card in enumerate(job_cards[:5]):
-                job_data = self._extract_job_info(card, keyword)
-                if job_data:
-                    jobs.append(job_data)
-
-                time.sleep(random.uniform(1, 2))
+                if not self._has_more_pages(page, page_jobs, jobs):
+                    break
 
         except Exception as e:
             print(f"Error scraping jobs for '{keyword}': {e}")
 
         finally:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
+            self.driver = None
+            self.driver_pool.release(lease)
 
         return jobs
 
-    def _build_linkedin_url(self, keyword: str, location: str, date_filter: str) -> str:
-        base_url = "https://www.linkedin.com/jobs/search/"
-        date_param = JobKeywords.get_date_filter(date_filter)
+    def _scrape_page(self, search_url: str, keyword: str, limit: int) -> List[Dict]:
+        self.rate_limiter.acquire()
+        self.driver.get(search_url)
 
-        keyword_encoded = urllib.parse.quote_plus(keyword)
-        location_encoded = urllib.parse.quote_plus(location)
+        card_selector = self._wait_for_card_selector()
 
-        url = f"{base_url}?keywords={keyword_encoded}&location={location_encoded}&f_TPR={date_param}"
-        return url
+        if not card_selector:
+            self.rate_limiter.record_throttle()
+            return []
 
-    def _find_job_cards(self) -> List:
-        job_cards = []
+        self.rate_limiter.record_success()
 
-        selectors = [
-            ".job-search-card",
-            ".base-search-card",
-            "[data-view-name='job-card']",
-            ".jobs-search__results-list li"
-        ]
+        if self.extraction_mode == "page_source":
+            return parse_job_cards(self.driver.page_source, keyword, limit=limit, card_selectors=[card_selector])
 
-        for selector in selectors:
-            try:
-                WebDriverWait(self.driver, 8).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if job_cards:
-                    break
-            except:
-                continue
+        jobs = []
+        job_cards = self.driver.find_elements(By.CSS_SELECTOR, card_selector)
+        for i, card in enumerate(job_cards[:limit]):
+            job_data = self._extract_job_info(card, keyword)
+            if job_data:
+                jobs.append(job_data)
+
+        return jobs
+
+    def _wait_for_card_selector(self) -> Optional[str]:
+        """Wait once for whichever card selector matches first, trying the historical winner first."""
+        selectors = self.selector_stats.ordered(CARD_SELECTORS)
+
+        def matching_selector(driver):
+            return driver.execute_script(
+                "return arguments[0].find(function (s) { return document.querySelector(s) !== null; }) || null;",
+                selectors
+            )
+
+        try:
+            selector = WebDriverWait(self.driver, 8).until(matching_selector)
+        except TimeoutException:
+            return None
 
-        return job_cards
+        self.selector_stats.record_hit(selector)
+        return selector
 
     def _extract_job_info(self, card, search_keyword: str) -> Optional[Dict]:
         try:
-            title = self._extract_text_with_selectors(card, [
-                "h3.base-search-card__title a",
-                ".base-search-card__title a",
-                "h3 a",
-                "h3"
-            ])
-
-            company = self._extract_text_with_selectors(card, [
-                "h4.base-search-card__subtitle a",
-                ".base-search-card__subtitle a",
-                "h4"
-            ])
-
-            location = self._extract_text_with_selectors(card, [
-                ".job-search-card__location",
-                ".base-search-card__metadata span",
-                "[data-test='job-location']"
-            ])
-
-            if title and company and location:
-                return {
-                    "title": title,
-                    "company": company,
-                    "location": location,
-                    "search_keyword": search_keyword,
-                    "scraped_at": datetime.now().isoformat(),
-                    "source": "LinkedIn"
-                }
+            title = self._extract_text_with_selectors(card, TITLE_SELECTORS)
+            company = self._extract_text_with_selectors(card, COMPANY_SELECTORS)
+            location = self._extract_text_with_selectors(card, LOCATION_SELECTORS)
+            url = self._extract_href_with_selectors(card, URL_SELECTORS)
 
-            return None
+            return build_job_record(title, company, location, search_keyword, url)
 
         except Exception as e:
             return None
@@ -152,4 +125,14 @@ class LinkedInScraper:
                     return text
             except:
                 continue
-        return None
\ No newline at end of file
+        return None
+
+    def _extract_href_with_selectors(self, element, selectors: List[str]) -> Optional[str]:
+        for selector in selectors:
+            try:
+                href = element.find_element(By.CSS_SELECTOR, selector).get_attribute("href")
+                if href:
+                    return href
+            except:
+                continue
+        return None
@@ -0,0 +1,18 @@
+from typing import Optional
+
+from .base_scraper import BaseScraper
+from ..config.settings import Config
+
+
+def create_scraper(backend: Optional[str] = None, seen_index=None) -> BaseScraper:
+    backend = (backend or Config.SCRAPER_BACKEND).lower()
+
+    if backend == "http":
+        from .http_scraper import LinkedInHttpScraper
+        return LinkedInHttpScraper(seen_index=seen_index)
+
+    if backend == "selenium":
+        from .linkedin_scraper import LinkedInScraper
+        return LinkedInScraper(seen_index=seen_index)
+
+    raise ValueError(f"Unknown scraper backend: {backend}")
@@ -0,0 +1,68 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+from ..config.settings import Config
+
+
+class SelectorStats:
+    """Remembers which card selector matched LinkedIn's markup, persisted across runs.
+
+    ``ordered`` puts the most recent winner first and then sorts by hit count,
+    so a layout change is picked up after a single successful page.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(Config.DATA_DIR, "selector_stats.json")
+        self._lock = threading.Lock()
+        self.hits: Dict[str, int] = {}
+        self.last_hit: Optional[str] = None
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self.hits = {str(k): int(v) for k, v in data.get("hits", {}).items()}
+            self.last_hit = data.get("last_hit")
+        except (OSError, ValueError, AttributeError):
+            self.hits = {}
+            self.last_hit = None
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"hits": self.hits, "last_hit": self.last_hit}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def ordered(self, selectors: List[str]) -> List[str]:
+        with self._lock:
+            return sorted(
+                selectors,
+                key=lambda s: (s != self.last_hit, -self.hits.get(s, 0), selectors.index(s))
+            )
+
+    def record_hit(self, selector: str):
+        with self._lock:
+            self.hits[selector] = self.hits.get(selector, 0) + 1
+            self.last_hit = selector
+            try:
+                self._save()
+            except OSError as e:
+                print(f"Failed to save selector stats: {e}")
+
+
+_shared_stats = None
+_shared_stats_lock = threading.Lock()
+
+
+def get_selector_stats() -> SelectorStats:
+    global _shared_stats
+
+    with _shared_stats_lock:
+        if _shared_stats is None:
+            _shared_stats = SelectorStats()
+
+    return _shared_stats
@@ -1,79 +1,180 @@
-from typing import Dict, List, Any
+import math
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from collections import Counter
 
+import numpy as np
+from scipy import sparse
+
+from .skill_categories import SkillCategoryIndex, get_skill_category_index
+from .skill_registry import SkillRegistry, get_skill_registry
+from .skill_sketch import SkillFrequencySketch
+from ..config.settings import Config
+from ..utils.fp_growth import frequent_itemsets
+
 
 class AnalysisService:
-    def __init__(self):
-        pass
+    """Skill statistics over a result set, computed from a sparse binary job x skill matrix.
+
+    The matrix is built once per result set and reused while the same jobs
+    list is passed in. Columns are ordered by first appearance, so frequency
+    ties keep the order skills were first seen.
+    """
+
+    def __init__(self, skill_registry: Optional[SkillRegistry] = None,
+                 category_index: Optional[SkillCategoryIndex] = None):
+        self.skill_registry = skill_registry or get_skill_registry()
+        self.category_index = category_index or get_skill_category_index()
+        self._matrix_cache: Optional[Tuple[List[Dict], int, sparse.csr_matrix, np.ndarray]] = None
+        self._bundle_cache: Dict[Tuple[int, int, int], List[Dict]] = {}
+
+    def _skill_ids(self, job: Dict) -> List[int]:
+        skill_ids = job.get("skill_ids")
+        if skill_ids is None:
+            skill_ids = self.skill_registry.intern_all(job.get("skills") or [])
+        return skill_ids
+
+    def skill_matrix(self, jobs_with_skills: List[Dict]) -> Tuple[sparse.csr_matrix, np.ndarray]:
+        """Return the binary job x skill CSR matrix and the registry id of each column."""
+        cached = self._matrix_cache
+        if cached and cached[0] is jobs_with_skills and cached[1] == len(jobs_with_skills):
+            return cached[2], cached[3]
+
+        job_skill_ids = [self._skill_ids(job) for job in jobs_with_skills]
+        lengths = np.fromiter((len(ids) for ids in job_skill_ids), dtype=np.int64, count=len(job_skill_ids))
+        ids = np.fromiter((skill_id for ids in job_skill_ids for skill_id in ids), dtype=np.int64,
+                          count=int(lengths.sum()))
+
+        unique_ids, first_seen, inverse = np.unique(ids, return_index=True, return_inverse=True)
+        order = np.argsort(first_seen, kind="stable")
+        column_of = np.empty_like(order)
+        column_of[order] = np.arange(len(order))
+
+        rows = np.repeat(np.arange(len(job_skill_ids)), lengths)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(ids), dtype=np.int32), (rows, column_of[inverse])),
+            shape=(len(job_skill_ids), len(unique_ids))
+        )
+        matrix.data[:] = 1
+        columns = unique_ids[order]
+
+        self._matrix_cache = (jobs_with_skills, len(jobs_with_skills), matrix, columns)
+        self._bundle_cache = {}
+        return matrix, columns
+
+    def sketch_skills_frequency(self, jobs: Iterable[Dict],
+                                sketch: Optional[SkillFrequencySketch] = None) -> SkillFrequencySketch:
+        """Stream ``jobs`` into a fixed-memory sketch, which can be a saved or merged one from earlier runs."""
+        sketch = sketch or SkillFrequencySketch(skill_registry=self.skill_registry)
+        sketch.add_jobs(jobs)
+        return sketch
+
+    def analyze_skills_frequency(self, jobs_with_skills: List[Dict], approximate: Optional[bool] = None) -> List[Dict]:
+        if Config.ANALYSIS_APPROXIMATE if approximate is None else approximate:
+            return self.sketch_skills_frequency(jobs_with_skills).skill_frequencies()
 
-    def analyze_skills_frequency(self, jobs_with_skills: List[Dict]) -> List[Dict]:
-        skill_freq = {}
         total_jobs = len(jobs_with_skills)
+        matrix, columns = self.skill_matrix(jobs_with_skills)
 
-        for job in jobs_with_skills:
-            if job.get("skills"):
-                for skill in job["skills"]:
-                    skill_freq[skill] = skill_freq.get(skill, 0) + 1
+        counts = np.asarray(matrix.sum(axis=0)).ravel()
+        ranked = np.argsort(-counts, kind="stable")
 
         skill_frequencies = []
-        for skill, count in sorted(skill_freq.items(), key=lambda x: x[1], reverse=True):
+        for column in ranked:
+            count = int(counts[column])
             skill_frequencies.append({
-                "skill": skill,
+                "skill": self.skill_registry.name(int(columns[column])),
                 "frequency": count,
                 "percentage": round((count / total_jobs) * 100, 1) if total_jobs > 0 else 0
             })
 
         return skill_frequencies
 
-    def categorize_skills(self, skills: List[str]) -> Dict[str, List[str]]:
-        categories = {
-            "Programming Languages": ["Python", "Java", "JavaScript", "R", "Scala", "Go", "C++"],
-            "ML/AI Frameworks": ["TensorFlow", "PyTorch", "Scikit-learn", "Keras", "XGBoost"],
-            "Cloud Platforms": ["AWS", "Azure", "GCP", "Google Cloud"],
-            "Databases": ["SQL", "PostgreSQL", "MongoDB", "Redis", "MySQL"],
-            "Tools & Platforms": ["Docker", "Kubernetes", "Git", "Jenkins", "Airflow"]
-        }
-
-        categorized_skills = {category: [] for category in categories}
-        uncategorized = []
-
-        for skill in skills:
-            categorized = False
-            for category, keywords in categories.items():
-                if any(keyword.lower() in skill.lower() for keyword in keywords):
-                    categorized_skills[category].append(skill)
-                    categorized = True
-                    break
-
-            if not categorized:
-                uncategorized.append(skill)
-
-        if uncategorized:
-            categorized_skills["Other"] = uncategorized
-
-        return {k: v for k, v in categorized_skills.items() if v}
-
-    def find_skill_combinations(self, jobs_with_skills: List[Dict], min_frequency: int = 2) -> List[Dict]:
-        skill_pairs = {}
-
-        for job in jobs_with_skills:
-            skills = job.get("skills", [])
-            if len(skills) > 1:
-                for i, skill1 in enumerate(skills):
-                    for skill2 in skills[i + 1:]:
-                        pair = tuple(sorted([skill1, skill2]))
-                        skill_pairs[pair] = skill_pairs.get(pair, 0) + 1
+    def categorize_skills(self, skills: List[str], level: int = 0) -> Dict[str, List[str]]:
+        """Group skills by top-level group, or by finer category with ``level=1``."""
+        return self.category_index.categorize(self.skill_registry.canonicalize(skills), level)
+
+    def find_skill_combinations(self, jobs_with_skills: List[Dict], min_frequency: int = 2,
+                                top_k: Optional[int] = None) -> List[Dict]:
+        """Skill pairs seen together in at least ``min_frequency`` jobs, most frequent first.
+
+        Pair counts are the upper triangle of the co-occurrence matrix XᵀX.
+        With ``top_k`` only the k most frequent pairs are returned.
+        """
+        matrix, columns = self.skill_matrix(jobs_with_skills)
+        if matrix.shape[1] < 2:
+            return []
+
+        co_occurrence = sparse.triu(matrix.T @ matrix, k=1).tocoo()
+        keep = co_occurrence.data >= min_frequency
+        counts = co_occurrence.data[keep]
+        firsts, seconds = co_occurrence.row[keep], co_occurrence.col[keep]
+
+        if top_k is not None and top_k < len(counts):
+            candidates = np.argpartition(-counts, top_k)[:top_k]
+            candidates.sort()
+            ranked = candidates[np.argsort(-counts[candidates], kind="stable")]
+        else:
+            ranked = np.argsort(-counts, kind="stable")
 
         combinations = []
-        for (skill1, skill2), count in skill_pairs.items():
-            if count >= min_frequency:
-                combinations.append({
-                    "skills": [skill1, skill2],
+        for index in ranked:
+            count = int(counts[index])
+            pair = (int(columns[firsts[index]]), int(columns[seconds[index]]))
+            combinations.append({
+                "skills": sorted(self.skill_registry.names(pair)),
+                "frequency": count,
+                "percentage": round((count / len(jobs_with_skills)) * 100, 1)
+            })
+
+        return combinations
+
+    def find_skill_bundles(self, jobs_with_skills: List[Dict], min_support: float = 0.05, min_size: int = 3,
+                           max_size: int = 5, min_frequency: int = 2, top_k: Optional[int] = None) -> List[Dict]:
+        """Skill sets of ``min_size`` to ``max_size`` skills that appear together, mined with FP-growth.
+
+        A bundle must occur in at least ``min_support`` of the jobs and in at
+        least ``min_frequency`` jobs. Support is the share of jobs containing
+        the whole bundle. Lift is support divided by the product of each
+        skill's own support, so values above 1 mean the skills are asked for
+        together more often than chance. Results are ordered by frequency,
+        larger bundles first on ties.
+        """
+        matrix, columns = self.skill_matrix(jobs_with_skills)
+        total_jobs = matrix.shape[0]
+        if not total_jobs:
+            return []
+
+        min_count = max(min_frequency, math.ceil(min_support * total_jobs))
+        cache_key = (min_count, min_size, max_size)
+        bundles = self._bundle_cache.get(cache_key)
+
+        if bundles is None:
+            indptr, indices = matrix.indptr.tolist(), matrix.indices.tolist()
+            transactions = Counter(
+                tuple(indices[indptr[row]:indptr[row + 1]]) for row in range(total_jobs) if indptr[row + 1] > indptr[row]
+            )
+            skill_support = np.asarray(matrix.sum(axis=0)).ravel() / total_jobs
+
+            bundles = []
+            for itemset, count in frequent_itemsets(list(transactions.items()), min_count, max_size):
+                if len(itemset) < min_size:
+                    continue
+
+                support = count / total_jobs
+                expected = float(np.prod(skill_support[list(itemset)]))
+                bundles.append({
+                    "skills": sorted(self.skill_registry.names(int(columns[column]) for column in itemset)),
+                    "size": len(itemset),
                     "frequency": count,
-                    "percentage": round((count / len(jobs_with_skills)) * 100, 1)
+                    "support": round(support, 4),
+                    "lift": round(support / expected, 2),
+                    "percentage": round(support * 100, 1)
                 })
 
-        return sorted(combinations, key=lambda x: x["frequency"], reverse=True)
+            bundles.sort(key=lambda bundle: (-bundle["frequency"], -bundle["size"], bundle["skills"]))
+            self._bundle_cache[cache_key] = bundles
+
+        return bundles[:top_k] if top_k is not None else list(bundles)
 
     def get_company_analysis(self, jobs_with_skills: List[Dict]) -> Dict[str, Any]:
         companies = [job.get("company", "") for job in jobs_with_skills if job.get("company")]
@@ -0,0 +1,39 @@
+import hashlib
+import os
+from typing import Dict, Optional
+
+from .sqlite_cache import SqliteCache
+from ..config.settings import Config
+
+
+class LLMResponseCache:
+    """Disk-backed cache of chat completions keyed by model name and normalized prompt.
+
+    Entries expire ``ttl`` seconds after they are written (0 keeps them
+    forever). Once ``max_entries`` is exceeded, the least recently used
+    entries are evicted.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: Optional[int] = None,
+                 ttl: Optional[float] = None):
+        self.path = path or os.path.join(Config.DATA_DIR, "llm_cache.sqlite3")
+        self.max_entries = max_entries or Config.LLM_CACHE_MAX_ENTRIES
+        self.ttl = Config.LLM_CACHE_TTL if ttl is None else ttl
+        self.store = SqliteCache(self.path, "llm_cache", self.max_entries)
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        normalized = " ".join(prompt.split())
+        return hashlib.sha256(f"{model}\n{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        return self.store.get(self.make_key(model, prompt))
+
+    def contains(self, model: str, prompt: str) -> bool:
+        return self.store.contains(self.make_key(model, prompt))
+
+    def put(self, model: str, prompt: str, response: str):
+        self.store.put(self.make_key(model, prompt), response, self.ttl)
+
+    def stats(self) -> Dict:
+        return self.store.stats()
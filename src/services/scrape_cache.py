@@ -0,0 +1,53 @@
+import json
+import os
+from typing import Dict, List, Optional
+
+from .sqlite_cache import SqliteCache
+from ..config.job_keywords import JobKeywords
+from ..config.settings import Config
+
+
+class ScrapeCache:
+    """Persistent cache of scraped search pages keyed by (keyword, location, date filter).
+
+    An entry lives for a fraction (``ttl_ratio``) of its date filter's window, so
+    a "Last Week" search is reused for about an hour and a "Today" search for a
+    few minutes. Once ``max_entries`` is exceeded, the least recently used
+    entries are evicted.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: Optional[int] = None,
+                 ttl_ratio: Optional[float] = None):
+        self.path = path or os.path.join(Config.DATA_DIR, "scrape_cache.sqlite3")
+        self.max_entries = max_entries or Config.SCRAPE_CACHE_MAX_ENTRIES
+        self.ttl_ratio = Config.SCRAPE_CACHE_TTL_RATIO if ttl_ratio is None else ttl_ratio
+
+        self.store = SqliteCache(self.path, "scrape_cache", self.max_entries)
+
+    @staticmethod
+    def _normalize(value: str) -> str:
+        return " ".join(value.casefold().split())
+
+    def _key(self, keyword: str, location: str, date_filter: str) -> str:
+        return "\n".join((self._normalize(keyword), self._normalize(location),
+                          JobKeywords.get_date_filter(date_filter)))
+
+    def ttl_for(self, date_filter: str) -> float:
+        window_seconds = int(JobKeywords.get_date_filter(date_filter).lstrip("r"))
+        return window_seconds * self.ttl_ratio
+
+    def get(self, keyword: str, location: str, date_filter: str) -> Optional[List[Dict]]:
+        jobs = self.store.get(self._key(keyword, location, date_filter))
+        return json.loads(jobs) if jobs is not None else None
+
+    def put(self, keyword: str, location: str, date_filter: str, jobs: List[Dict]):
+        ttl = self.ttl_for(date_filter)
+        if not jobs or ttl <= 0:
+            return
+        self.store.put(self._key(keyword, location, date_filter), json.dumps(jobs), ttl)
+
+    def clear(self):
+        self.store.clear()
+
+    def stats(self) -> Dict:
+        return self.store.stats()
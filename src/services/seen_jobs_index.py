@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from ..config.settings import Config
+from ..scrapers.card_parser import normalize_job_url
+from ..utils.bloom_filter import BloomFilter
+
+
+def job_key(job: Dict) -> str:
+    url = normalize_job_url(job.get("url"))
+    if url:
+        return url
+
+    fingerprint = "|".join(
+        " ".join(str(job.get(field, "")).casefold().split())
+        for field in ("title", "company", "location")
+    )
+    return "fp:" + hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+
+
+class SeenJobsIndex:
+    """Persistent record of every posting seen by earlier runs, plus the skills inferred for it per job category.
+
+    An optional in-memory Bloom filter sits in front of SQLite. Most new
+    postings are then rejected without a database lookup.
+    """
+
+    def __init__(self, path: Optional[str] = None, use_bloom: Optional[bool] = None):
+        self.path = path or os.path.join(Config.DATA_DIR, "seen_jobs.sqlite3")
+        use_bloom = Config.SEEN_JOBS_BLOOM if use_bloom is None else use_bloom
+
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                job_key TEXT PRIMARY KEY,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS job_skills (
+                job_key TEXT NOT NULL,
+                job_category TEXT NOT NULL,
+                skills TEXT NOT NULL,
+                skills_source TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (job_key, job_category)
+            )
+        """)
+        self._conn.commit()
+
+        self.bloom = None
+        if use_bloom:
+            count = self._conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
+            self.bloom = BloomFilter(capacity=max(count * 2, 10000))
+            for (key,) in self._conn.execute("SELECT job_key FROM seen_jobs"):
+                self.bloom.add(key)
+
+    def contains(self, job: Dict) -> bool:
+        key = job_key(job)
+        if self.bloom is not None and key not in self.bloom:
+            return False
+
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM seen_jobs WHERE job_key = ?", (key,)).fetchone()
+        return row is not None
+
+    def mark_seen(self, jobs: Iterable[Dict]):
+        now = time.time()
+        keys = [job_key(job) for job in jobs]
+
+        with self._lock:
+            self._conn.executemany(
+                """INSERT INTO seen_jobs (job_key, first_seen, last_seen) VALUES (?, ?, ?)
+                   ON CONFLICT(job_key) DO UPDATE SET last_seen = excluded.last_seen""",
+                [(key, now, now) for key in keys]
+            )
+            self._conn.commit()
+
+        if self.bloom is not None:
+            for key in keys:
+                self.bloom.add(key)
+
+    def get_skills(self, job: Dict, job_category: str) -> Optional[List[str]]:
+        """Skills stored for ``job`` under ``job_category``. Inferred skills depend on the category searched."""
+        key = job_key(job)
+        if self.bloom is not None and key not in self.bloom:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT skills FROM job_skills WHERE job_key = ? AND job_category = ?", (key, job_category)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def record_skills(self, job: Dict, job_category: str, skills: List[str], skills_source: str):
+        key = job_key(job)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                """INSERT INTO seen_jobs (job_key, first_seen, last_seen) VALUES (?, ?, ?)
+                   ON CONFLICT(job_key) DO UPDATE SET last_seen = excluded.last_seen""",
+                (key, now, now)
+            )
+            self._conn.execute(
+                """INSERT INTO job_skills (job_key, job_category, skills, skills_source, updated_at)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(job_key, job_category) DO UPDATE SET
+                       skills = excluded.skills,
+                       skills_source = excluded.skills_source,
+                       updated_at = excluded.updated_at""",
+                (key, job_category, json.dumps(skills), skills_source, now)
+            )
+            self._conn.commit()
+
+        if self.bloom is not None:
+            self.bloom.add(key)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
+            enriched = self._conn.execute("SELECT COUNT(DISTINCT job_key) FROM job_skills").fetchone()[0]
+        return {"seen_jobs": total, "enriched_jobs": enriched}
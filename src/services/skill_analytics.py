@@ -0,0 +1,180 @@
+import heapq
+import threading
+from collections import Counter
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .skill_registry import SkillRegistry, get_skill_registry
+
+_JobEntry = Tuple[Tuple[int, ...], str, str]
+
+
+class SkillAnalytics:
+    """Incrementally maintained skill, pair, company and location counts for a set of jobs.
+
+    Adding or removing a job touches only that job's skills and pairs, so
+    the dashboard, the streaming workflow and merges of stored runs can keep
+    one view up to date instead of recounting every job. Jobs are keyed by
+    title and company. Adding a job again replaces its earlier entry, so
+    merging overlapping runs counts each posting once. Top-k queries read
+    the maintained counters. Safe to share between worker threads.
+    """
+
+    def __init__(self, skill_registry: Optional[SkillRegistry] = None):
+        self.skill_registry = skill_registry or get_skill_registry()
+
+        self._jobs: Dict[str, _JobEntry] = {}
+        self.skill_counts: Counter = Counter()
+        self.pair_counts: Counter = Counter()
+        self.company_counts: Counter = Counter()
+        self.location_counts: Counter = Counter()
+        self.jobs_with_skills = 0
+        self.skill_mentions = 0
+        self.version = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def job_key(job: Dict) -> str:
+        return f"{job.get('title', '').lower()}_{job.get('company', '').lower()}"
+
+    def _skill_ids(self, job: Dict) -> Tuple[int, ...]:
+        skill_ids = job.get("skill_ids")
+        if skill_ids is None:
+            skill_ids = self.skill_registry.intern_all(job.get("skills") or [])
+        return tuple(sorted(set(skill_ids)))
+
+    def _apply(self, entry: _JobEntry, sign: int):
+        skill_ids, company, location = entry
+
+        for index, skill_id in enumerate(skill_ids):
+            self.skill_counts[skill_id] += sign
+            if not self.skill_counts[skill_id]:
+                del self.skill_counts[skill_id]
+
+            for other_id in skill_ids[index + 1:]:
+                pair = (skill_id, other_id)
+                self.pair_counts[pair] += sign
+                if not self.pair_counts[pair]:
+                    del self.pair_counts[pair]
+
+        for counter, value in ((self.company_counts, company), (self.location_counts, location)):
+            if value:
+                counter[value] += sign
+                if not counter[value]:
+                    del counter[value]
+
+        if skill_ids:
+            self.jobs_with_skills += sign
+            self.skill_mentions += sign * len(skill_ids)
+        self.version += 1
+
+    def add_job(self, job: Dict):
+        entry = (self._skill_ids(job), job.get("company", ""), job.get("location", ""))
+        key = self.job_key(job)
+
+        with self._lock:
+            previous = self._jobs.get(key)
+            if previous is not None:
+                self._apply(previous, -1)
+            self._jobs[key] = entry
+            self._apply(entry, 1)
+
+    def add_jobs(self, jobs: Iterable[Dict]):
+        for job in jobs:
+            self.add_job(job)
+
+    def remove_job(self, job: Dict) -> bool:
+        with self._lock:
+            entry = self._jobs.pop(self.job_key(job), None)
+            if entry is None:
+                return False
+            self._apply(entry, -1)
+            return True
+
+    def merge(self, other: "SkillAnalytics"):
+        """Fold another accumulator's jobs into this one. Both must share a skill registry."""
+        with other._lock:
+            items = list(other._jobs.items())
+
+        with self._lock:
+            for key, entry in items:
+                previous = self._jobs.get(key)
+                if previous is not None:
+                    self._apply(previous, -1)
+                self._jobs[key] = entry
+                self._apply(entry, 1)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def total_jobs(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def avg_skills_per_job(self) -> float:
+        return self.skill_mentions / max(self.jobs_with_skills, 1)
+
+    def _top(self, counter: Counter, top_k: Optional[int]) -> List[Tuple[Any, int]]:
+        with self._lock:
+            if top_k is None:
+                return counter.most_common()
+            return heapq.nlargest(top_k, counter.items(), key=itemgetter(1))
+
+    def extracted_skills(self) -> List[str]:
+        with self._lock:
+            return sorted(self.skill_registry.names(self.skill_counts))
+
+    def skill_frequencies(self, top_k: Optional[int] = None) -> List[Dict]:
+        """Same records as ``AnalysisService.analyze_skills_frequency``, served from the counters."""
+        total_jobs = self.total_jobs
+        return [
+            {
+                "skill": self.skill_registry.name(skill_id),
+                "frequency": count,
+                "percentage": round((count / total_jobs) * 100, 1) if total_jobs > 0 else 0
+            }
+            for skill_id, count in self._top(self.skill_counts, top_k)
+        ]
+
+    def skill_combinations(self, min_frequency: int = 2, top_k: Optional[int] = None) -> List[Dict]:
+        """Same records as ``AnalysisService.find_skill_combinations``, served from the counters."""
+        total_jobs = self.total_jobs
+        return [
+            {
+                "skills": sorted(self.skill_registry.names(pair)),
+                "frequency": count,
+                "percentage": round((count / total_jobs) * 100, 1)
+            }
+            for pair, count in self._top(self.pair_counts, top_k)
+            if count >= min_frequency
+        ]
+
+    def company_analysis(self, top_k: int = 10) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "total_companies": len(self.company_counts),
+                "top_companies": dict(self.company_counts.most_common(top_k)),
+                "unique_companies": len(self.company_counts)
+            }
+
+    def to_dict(self, top_k: int = 20) -> Dict[str, Any]:
+        """Plain-data summary of the current counts, safe to keep in graph state or write to JSON."""
+        with self._lock:
+            return {
+                "total_jobs": self.total_jobs,
+                "jobs_with_skills": self.jobs_with_skills,
+                "avg_skills_per_job": round(self.avg_skills_per_job, 2),
+                "top_skills": self.skill_frequencies(top_k),
+                "top_combinations": self.skill_combinations(top_k=top_k),
+                "companies": self.company_analysis(top_k),
+                "locations": self.location_analysis(top_k)
+            }
+
+    def location_analysis(self, top_k: int = 10) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "total_locations": len(self.location_counts),
+                "top_locations": dict(self.location_counts.most_common(top_k)),
+                "geographic_distribution": dict(self.location_counts)
+            }
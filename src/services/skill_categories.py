@@ -0,0 +1,122 @@
+import json
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .skill_registry import SkillRegistry
+from ..config.settings import Config
+from ..utils.aho_corasick import AhoCorasickMatcher
+
+OTHER = "Other"
+
+
+class SkillCategoryIndex:
+    """Two-level category lookup (group, then category) for skill names, compiled once from config.
+
+    Categories come from the skills taxonomy, plus ``overrides`` and extra
+    ``keywords`` from the categories file. The file's ``groups`` arrange
+    categories under top-level groups. A skill is first looked up by its
+    normalized full name. If that fails, the first taxonomy term or keyword
+    found on word boundaries decides, so "AWS Lambda functions" lands in
+    Cloud Services while "Docker" no longer matches "R". Results are cached
+    per skill string.
+    """
+
+    def __init__(self, categories_path: Optional[str] = None, taxonomy_path: Optional[str] = None,
+                 cache_size: int = 50000):
+        self.categories_path = categories_path or Config.SKILL_CATEGORIES_PATH
+        self.taxonomy_path = taxonomy_path or Config.SKILLS_TAXONOMY_PATH
+        self.cache_size = cache_size
+
+        self.groups: List[str] = []
+        self._group_of: Dict[str, str] = {}
+        self._by_key: Dict[str, str] = {}
+        self._by_exact: Dict[str, str] = {}
+        self._matcher = AhoCorasickMatcher()
+        self._cache: Dict[str, Tuple[str, str]] = {}
+        self._load()
+
+    def _load(self):
+        with open(self.categories_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        with open(self.taxonomy_path, 'r', encoding='utf-8') as f:
+            taxonomy = json.load(f)
+
+        for group, categories in config.get("groups", {}).items():
+            self.groups.append(group)
+            for category in categories:
+                self._group_of.setdefault(category, group)
+
+        overrides = {SkillRegistry.normalize_key(name): category for name, category in config.get("overrides", {}).items()}
+
+        for entry in taxonomy.get("skills", []):
+            name = entry["name"]
+            category = overrides.get(SkillRegistry.normalize_key(name), entry.get("category", OTHER))
+            exact = entry.get("exact", []) + entry.get("ambiguous", [])
+
+            for spelling in ([] if name in exact else [name]) + entry.get("aliases", []):
+                self._by_key.setdefault(SkillRegistry.normalize_key(spelling), category)
+                self._matcher.add(spelling, category)
+            for spelling in exact:
+                self._by_exact.setdefault(" ".join(spelling.split()), category)
+                self._matcher.add(spelling, category, case_sensitive=True)
+
+        self._by_key.update(overrides)
+        for category, keywords in config.get("keywords", {}).items():
+            for keyword in keywords:
+                self._by_key.setdefault(SkillRegistry.normalize_key(keyword), category)
+                self._matcher.add(keyword, category)
+
+        self._matcher.build()
+
+    def _lookup(self, skill: str) -> str:
+        category = self._by_exact.get(" ".join(skill.split())) or self._by_key.get(SkillRegistry.normalize_key(skill))
+        if category:
+            return category
+
+        matches = self._matcher.find(skill)
+        return matches[0][2] if matches else OTHER
+
+    def path_of(self, skill: str) -> Tuple[str, str]:
+        """Return ``(group, category)`` for ``skill``. Unknown skills are ``("Other", "Other")``."""
+        path = self._cache.get(skill)
+        if path is None:
+            category = self._lookup(skill)
+            path = (self._group_of.get(category, OTHER), category)
+
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[skill] = path
+        return path
+
+    def categorize(self, skills: List[str], level: int = 0) -> Dict[str, List[str]]:
+        """Group ``skills`` by top-level group (``level=0``) or by category (``level=1``), "Other" last."""
+        grouped: Dict[str, List[str]] = {group: [] for group in self.groups} if level == 0 else {}
+        for skill in skills:
+            grouped.setdefault(self.path_of(skill)[level], []).append(skill)
+
+        other = grouped.pop(OTHER, None)
+        if other:
+            grouped[OTHER] = other
+        return {key: value for key, value in grouped.items() if value}
+
+    def categorize_tree(self, skills: List[str]) -> Dict[str, Dict[str, List[str]]]:
+        """Nested ``{group: {category: [skills]}}`` view of ``skills``."""
+        tree: Dict[str, Dict[str, List[str]]] = {}
+        for group, group_skills in self.categorize(skills).items():
+            for skill in group_skills:
+                tree.setdefault(group, {}).setdefault(self.path_of(skill)[1], []).append(skill)
+        return tree
+
+
+_shared_index = None
+_shared_index_lock = threading.Lock()
+
+
+def get_skill_category_index() -> SkillCategoryIndex:
+    global _shared_index
+
+    with _shared_index_lock:
+        if _shared_index is None:
+            _shared_index = SkillCategoryIndex()
+
+    return _shared_index
@@ -0,0 +1,109 @@
+import json
+import re
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from ..config.settings import Config
+
+_SEPARATORS = re.compile(r"[\s_\-]+")
+
+
+class SkillRegistry:
+    """Maps skill names to canonical spellings and dense integer ids.
+
+    Names are matched on a case-folded key with separators collapsed, and
+    then looked up in the taxonomy's alias table. "sklearn", "scikit learn"
+    and "Scikit-Learn" therefore all become "Scikit-learn". A name missing
+    from the taxonomy is interned under its key and keeps the first spelling
+    it was interned with, so "PyTorch Lightning" and "pytorch lightning"
+    share one id. Ids are only valid inside the running process.
+    """
+
+    def __init__(self, taxonomy_path: Optional[str] = None):
+        self.taxonomy_path = taxonomy_path or Config.SKILLS_TAXONOMY_PATH
+        self._aliases: Dict[str, str] = {}
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+        self._load_aliases()
+
+    @staticmethod
+    def normalize_key(name: str) -> str:
+        return _SEPARATORS.sub(" ", name.casefold()).strip()
+
+    def _load_aliases(self):
+        try:
+            with open(self.taxonomy_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Failed to load skill aliases: {e}")
+            return
+
+        for entry in data.get("skills", []):
+            name = entry["name"]
+            for spelling in [name, *entry.get("aliases", []), *entry.get("exact", []),
+                             *entry.get("ambiguous", [])]:
+                self._aliases.setdefault(self.normalize_key(spelling), name)
+
+    def canonical(self, name: str) -> str:
+        """Canonical spelling of ``name``. Unknown names that were never interned keep their own spelling."""
+        key = self.normalize_key(name)
+        known = self._aliases.get(key)
+        if known:
+            return known
+
+        skill_id = self._ids.get(key)
+        return self._names[skill_id] if skill_id is not None else " ".join(name.split())
+
+    def intern(self, name: str) -> int:
+        key = self.normalize_key(name)
+        known = self._aliases.get(key)
+        if known:
+            key = self.normalize_key(known)
+
+        with self._lock:
+            skill_id = self._ids.get(key)
+            if skill_id is None:
+                skill_id = len(self._names)
+                self._ids[key] = skill_id
+                self._names.append(known or " ".join(name.split()))
+            return skill_id
+
+    def intern_all(self, names: Iterable[str]) -> List[int]:
+        """Ids for ``names`` with duplicates removed, in order of first appearance."""
+        ids = []
+        seen = set()
+        for name in names:
+            if not name or not name.strip():
+                continue
+            skill_id = self.intern(name)
+            if skill_id not in seen:
+                seen.add(skill_id)
+                ids.append(skill_id)
+        return ids
+
+    def name(self, skill_id: int) -> str:
+        return self._names[skill_id]
+
+    def names(self, skill_ids: Iterable[int]) -> List[str]:
+        return [self._names[skill_id] for skill_id in skill_ids]
+
+    def canonicalize(self, names: Iterable[str]) -> List[str]:
+        return self.names(self.intern_all(names))
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+_shared_registry = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_skill_registry() -> SkillRegistry:
+    global _shared_registry
+
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            _shared_registry = SkillRegistry()
+
+    return _shared_registry
@@ -0,0 +1,110 @@
+from typing import Dict, Iterable, List, Optional
+
+from .skill_registry import SkillRegistry, get_skill_registry
+from ..config.settings import Config
+from ..utils.sketches import CountMinSketch, SpaceSaving
+
+
+class SkillFrequencySketch:
+    """Approximate skill frequencies over any number of jobs in fixed memory.
+
+    A Space-Saving summary of ``capacity`` entries tracks the most frequent
+    skills, and a Count-Min sketch answers point queries for any skill,
+    including ones in the long tail. With N skill mentions, a reported
+    frequency is never below the true count. It exceeds the true count by
+    at most N / capacity for the top list, and by at most epsilon * N for
+    point queries with probability 1 - delta. Skills are keyed by their
+    normalized canonical name rather than registry id, so "PyTorch Lightning"
+    and "pytorch lightning" count as one skill, and sketches from different
+    runs, shards or processes merge while preserving the documented bounds
+    over the combined stream. ``spellings`` keeps the first display spelling
+    of each monitored skill.
+    """
+
+    def __init__(self, capacity: Optional[int] = None, epsilon: Optional[float] = None,
+                 delta: Optional[float] = None, skill_registry: Optional[SkillRegistry] = None):
+        self.skill_registry = skill_registry or get_skill_registry()
+        self.heavy_hitters = SpaceSaving(capacity or Config.SKETCH_CAPACITY)
+        self.counts = CountMinSketch(epsilon or Config.SKETCH_EPSILON, delta or Config.SKETCH_DELTA)
+        self.spellings: Dict[str, str] = {}
+        self.total_jobs = 0
+
+    def _key(self, skill: str) -> str:
+        return SkillRegistry.normalize_key(self.skill_registry.canonical(skill))
+
+    def _prune_spellings(self):
+        if len(self.spellings) > 2 * self.heavy_hitters.capacity:
+            self.spellings = {key: spelling for key, spelling in self.spellings.items()
+                              if key in self.heavy_hitters.counts}
+
+    def add_job(self, job: Dict):
+        names = {}
+        for name in job.get("skills") or []:
+            if name.strip():
+                canonical = self.skill_registry.canonical(name)
+                names.setdefault(SkillRegistry.normalize_key(canonical), canonical)
+
+        for key, name in names.items():
+            self.heavy_hitters.add(key)
+            self.counts.add(key)
+            self.spellings.setdefault(key, name)
+        self.total_jobs += 1
+        self._prune_spellings()
+
+    def add_jobs(self, jobs: Iterable[Dict]):
+        for job in jobs:
+            self.add_job(job)
+
+    def merge(self, other: "SkillFrequencySketch"):
+        self.heavy_hitters.merge(other.heavy_hitters)
+        self.counts.merge(other.counts)
+        self.total_jobs += other.total_jobs
+        for key, spelling in other.spellings.items():
+            self.spellings.setdefault(key, spelling)
+        self._prune_spellings()
+
+    def estimate(self, skill: str) -> int:
+        """Upper-bound estimate of the number of jobs listing ``skill``."""
+        key = self._key(skill)
+        return min(self.counts.estimate(key), self.heavy_hitters.estimate(key)[0])
+
+    def skill_frequencies(self, top_k: Optional[int] = None) -> List[Dict]:
+        """Records shaped like ``AnalysisService.analyze_skills_frequency``, plus a ``min_frequency`` lower bound."""
+        records = []
+        for key, count, error in self.heavy_hitters.top():
+            frequency = min(count, self.counts.estimate(key))
+            records.append({
+                "skill": self.spellings.get(key, key),
+                "frequency": frequency,
+                "min_frequency": max(count - error, 0),
+                "percentage": round((frequency / self.total_jobs) * 100, 1) if self.total_jobs > 0 else 0
+            })
+
+        records.sort(key=lambda record: (-record["frequency"], -record["min_frequency"]))
+        return records[:top_k]
+
+    def error_bounds(self) -> Dict:
+        mentions = self.counts.total
+        return {
+            "skill_mentions": mentions,
+            "top_list_max_overcount": mentions / self.heavy_hitters.capacity,
+            "point_query_max_overcount": self.counts.epsilon * mentions,
+            "point_query_confidence": 1 - self.counts.delta
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            "total_jobs": self.total_jobs,
+            "heavy_hitters": self.heavy_hitters.to_dict(),
+            "counts": self.counts.to_dict(),
+            "spellings": {key: self.spellings[key] for key in self.heavy_hitters.counts if key in self.spellings}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict, skill_registry: Optional[SkillRegistry] = None) -> "SkillFrequencySketch":
+        sketch = cls(skill_registry=skill_registry)
+        sketch.heavy_hitters = SpaceSaving.from_dict(data["heavy_hitters"])
+        sketch.counts = CountMinSketch.from_dict(data["counts"])
+        sketch.spellings = dict(data.get("spellings", {}))
+        sketch.total_jobs = data["total_jobs"]
+        return sketch
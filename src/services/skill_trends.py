@@ -0,0 +1,361 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from .seen_jobs_index import job_key
+from .skill_categories import SkillCategoryIndex, get_skill_category_index
+from .skill_registry import SkillRegistry, get_skill_registry
+from .storage_service import StorageService
+from ..config.settings import Config
+
+_DAY_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}")
+_FILENAME_DAY_PATTERN = re.compile(r"_(\d{4})(\d{2})(\d{2})_\d{6}\.json$")
+
+
+class SkillTrendStore:
+    """Per-day skill demand pre-aggregated from stored runs, for fast trend queries.
+
+    Each results file is ingested once. Its jobs are counted on the day they
+    were scraped, under the run's search location. A posting seen by several
+    runs for the same location on the same day counts once. Each stored
+    skill's top-level category is kept in ``skill_categories`` so category
+    queries filter in SQL. The table is rebuilt when the store is opened
+    after the category or taxonomy file changed, so edits apply to data
+    that is already stored. Queries compare skill shares
+    of postings rather than raw counts, so a week with more runs does not
+    look like a surge in demand.
+    """
+
+    def __init__(self, path: Optional[str] = None, storage_service: Optional[StorageService] = None,
+                 skill_registry: Optional[SkillRegistry] = None,
+                 category_index: Optional[SkillCategoryIndex] = None):
+        self.path = path or os.path.join(Config.DATA_DIR, "skill_trends.sqlite3")
+        self.skill_registry = skill_registry or get_skill_registry()
+        self.storage_service = storage_service or StorageService(self.skill_registry)
+        self.category_index = category_index or get_skill_category_index()
+
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS ingested_files (
+                filename TEXT PRIMARY KEY,
+                jobs INTEGER NOT NULL,
+                ingested_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS posting_days (
+                day TEXT NOT NULL,
+                location TEXT NOT NULL COLLATE NOCASE,
+                job_key TEXT NOT NULL,
+                PRIMARY KEY (day, location, job_key)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS job_counts (
+                day TEXT NOT NULL,
+                location TEXT NOT NULL COLLATE NOCASE,
+                jobs INTEGER NOT NULL,
+                PRIMARY KEY (day, location)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS skill_counts (
+                day TEXT NOT NULL,
+                location TEXT NOT NULL COLLATE NOCASE,
+                skill TEXT NOT NULL,
+                jobs INTEGER NOT NULL,
+                PRIMARY KEY (day, location, skill)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS skill_counts_by_skill ON skill_counts (skill, day);
+            CREATE TABLE IF NOT EXISTS skill_categories (
+                skill TEXT PRIMARY KEY,
+                category TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS skill_categories_by_category ON skill_categories (category, skill);
+            CREATE TABLE IF NOT EXISTS store_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        self._conn.commit()
+        self._refresh_categories()
+
+    def _category_of(self, skill: str) -> str:
+        return self.category_index.path_of(skill)[0]
+
+    def _categories_fingerprint(self) -> str:
+        digest = hashlib.sha256()
+        for path in (self.category_index.categories_path, self.category_index.taxonomy_path):
+            try:
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+            except OSError:
+                digest.update(b"missing")
+        return digest.hexdigest()
+
+    def _refresh_categories(self):
+        """Recategorize every stored skill if the category or taxonomy file changed since the last refresh."""
+        fingerprint = self._categories_fingerprint()
+
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM store_meta WHERE key = 'categories'").fetchone()
+            if row and row[0] == fingerprint:
+                return
+
+            skills = [row[0] for row in self._conn.execute("SELECT DISTINCT skill FROM skill_counts")]
+            self._conn.execute("DELETE FROM skill_categories")
+            self._conn.executemany(
+                "INSERT INTO skill_categories (skill, category) VALUES (?, ?)",
+                [(skill, self._category_of(skill)) for skill in skills]
+            )
+            self._conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES ('categories', ?)",
+                               (fingerprint,))
+            self._conn.commit()
+
+    @staticmethod
+    def _day_of(job: Dict, filename: str, fallback: str) -> str:
+        scraped_at = str(job.get("scraped_at") or "")
+        if _DAY_PATTERN.match(scraped_at):
+            return scraped_at[:10]
+
+        match = _FILENAME_DAY_PATTERN.search(filename)
+        if match:
+            return "-".join(match.groups())
+        return fallback
+
+    def ingest_file(self, filename: str) -> bool:
+        """Add one results file to the store. Returns False if it was already ingested or unreadable."""
+        if self.is_ingested(filename):
+            return False
+
+        filepath = os.path.join(self.storage_service.data_dir, filename)
+        try:
+            with open(filepath, 'r') as f:
+                data = json.load(f)
+            fallback_day = datetime.fromtimestamp(os.path.getmtime(filepath)).date().isoformat()
+        except Exception as e:
+            print(f"Failed to read {filename} for trends: {e}")
+            return False
+
+        location = " ".join(str(data.get("location") or "Unknown").split())
+        jobs = data.get("jobs_with_skills", [])
+
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM ingested_files WHERE filename = ?", (filename,)).fetchone():
+                return False
+
+            job_counts = Counter()
+            skill_counts = Counter()
+
+            for job in jobs:
+                day = self._day_of(job, filename, fallback_day)
+                inserted = self._conn.execute(
+                    "INSERT OR IGNORE INTO posting_days (day, location, job_key) VALUES (?, ?, ?)",
+                    (day, location, job_key(job))
+                ).rowcount
+                if not inserted:
+                    continue
+
+                job_counts[day] += 1
+                skills = {self.skill_registry.canonical(skill)
+                          for skill in job.get("skills") or [] if skill.strip()}
+                for skill in skills:
+                    skill_counts[(day, skill)] += 1
+
+            self._conn.executemany(
+                """INSERT INTO job_counts (day, location, jobs) VALUES (?, ?, ?)
+                   ON CONFLICT(day, location) DO UPDATE SET jobs = jobs + excluded.jobs""",
+                [(day, location, count) for day, count in job_counts.items()]
+            )
+            self._conn.executemany(
+                """INSERT INTO skill_counts (day, location, skill, jobs) VALUES (?, ?, ?, ?)
+                   ON CONFLICT(day, location, skill) DO UPDATE SET jobs = jobs + excluded.jobs""",
+                [(day, location, skill, count) for (day, skill), count in skill_counts.items()]
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO skill_categories (skill, category) VALUES (?, ?)",
+                [(skill, self._category_of(skill)) for skill in {skill for _, skill in skill_counts}]
+            )
+            self._conn.execute(
+                "INSERT INTO ingested_files (filename, jobs, ingested_at) VALUES (?, ?, ?)",
+                (filename, sum(job_counts.values()), time.time())
+            )
+            self._conn.commit()
+
+        return True
+
+    def is_ingested(self, filename: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM ingested_files WHERE filename = ?", (filename,)).fetchone()
+        return row is not None
+
+    def ingest_new(self) -> int:
+        """Ingest every stored results file not seen before and return how many were added."""
+        return sum(self.ingest_file(filename) for filename in self.storage_service.list_results())
+
+    def _window(self, weeks: int, until: Optional[str]) -> Tuple[str, str, str]:
+        """Return ``(prior_start, recent_start, end)``. Both windows are half-open at their start."""
+        if until is None:
+            with self._lock:
+                until = self._conn.execute("SELECT MAX(day) FROM job_counts").fetchone()[0] or date.today().isoformat()
+
+        end = date.fromisoformat(until)
+        recent_start = end - timedelta(weeks=weeks)
+        prior_start = recent_start - timedelta(weeks=weeks)
+        return prior_start.isoformat(), recent_start.isoformat(), end.isoformat()
+
+    def _total_jobs(self, start: str, end: str, location: Optional[str]) -> int:
+        query = "SELECT COALESCE(SUM(jobs), 0) FROM job_counts WHERE day > ? AND day <= ?"
+        params: List = [start, end]
+        if location:
+            query += " AND location = ?"
+            params.append(location)
+
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def rising_skills(self, weeks: int = 4, location: Optional[str] = None, category: Optional[str] = None,
+                      limit: int = 20, min_jobs: int = 2, until: Optional[str] = None) -> List[Dict]:
+        """Skills whose share of postings grew most in the last ``weeks`` weeks, against the weeks before.
+
+        The window ends on ``until`` (YYYY-MM-DD), or the latest ingested day.
+        Skills need at least ``min_jobs`` recent postings. ``change`` is in
+        percentage points of postings.
+        """
+        prior_start, recent_start, end = self._window(weeks, until)
+        recent_total = self._total_jobs(recent_start, end, location)
+        prior_total = self._total_jobs(prior_start, recent_start, location)
+        if not recent_total:
+            return []
+
+        query = """SELECT skill, category,
+                          SUM(CASE WHEN day > ? THEN jobs ELSE 0 END),
+                          SUM(CASE WHEN day <= ? THEN jobs ELSE 0 END)
+                   FROM skill_counts JOIN skill_categories USING (skill) WHERE day > ? AND day <= ?"""
+        params: List = [recent_start, recent_start, prior_start, end]
+        if location:
+            query += " AND location = ?"
+            params.append(location)
+        if category:
+            query += " AND category = ?"
+            params.append(category)
+        query += " GROUP BY skill HAVING SUM(CASE WHEN day > ? THEN jobs ELSE 0 END) >= ?"
+        params += [recent_start, min_jobs]
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        trends = []
+        for skill, skill_category, recent_jobs, prior_jobs in rows:
+            recent_share = recent_jobs / recent_total
+            prior_share = prior_jobs / prior_total if prior_total else 0.0
+            trends.append({
+                "skill": skill,
+                "category": skill_category,
+                "recent_jobs": recent_jobs,
+                "prior_jobs": prior_jobs,
+                "recent_share": round(recent_share * 100, 1),
+                "prior_share": round(prior_share * 100, 1),
+                "change": round((recent_share - prior_share) * 100, 1)
+            })
+
+        trends.sort(key=lambda trend: (-trend["change"], -trend["recent_jobs"]))
+        return trends[:limit]
+
+    def top_skills(self, weeks: int = 4, location: Optional[str] = None, category: Optional[str] = None,
+                   limit: int = 20, until: Optional[str] = None) -> List[Dict]:
+        _, start, end = self._window(weeks, until)
+        total_jobs = self._total_jobs(start, end, location)
+
+        query = """SELECT skill, category, SUM(jobs) AS total
+                   FROM skill_counts JOIN skill_categories USING (skill) WHERE day > ? AND day <= ?"""
+        params: List = [start, end]
+        if location:
+            query += " AND location = ?"
+            params.append(location)
+        if category:
+            query += " AND category = ?"
+            params.append(category)
+        query += " GROUP BY skill ORDER BY total DESC, skill LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        return [{
+            "skill": skill,
+            "category": skill_category,
+            "frequency": count,
+            "percentage": round((count / total_jobs) * 100, 1) if total_jobs else 0
+        } for skill, skill_category, count in rows]
+
+    def category_trends(self, weeks: int = 4, location: Optional[str] = None,
+                        until: Optional[str] = None) -> List[Dict]:
+        """Skill mentions per top-level category in the recent and prior windows."""
+        prior_start, recent_start, end = self._window(weeks, until)
+
+        query = """SELECT category,
+                          SUM(CASE WHEN day > ? THEN jobs ELSE 0 END) AS recent,
+                          SUM(CASE WHEN day <= ? THEN jobs ELSE 0 END)
+                   FROM skill_counts JOIN skill_categories USING (skill) WHERE day > ? AND day <= ?"""
+        params: List = [recent_start, recent_start, prior_start, end]
+        if location:
+            query += " AND location = ?"
+            params.append(location)
+        query += " GROUP BY category ORDER BY recent DESC, category"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        return [{"category": category, "recent_mentions": recent, "prior_mentions": prior}
+                for category, recent, prior in rows]
+
+    def skill_series(self, skill: str, weeks: int = 12, location: Optional[str] = None,
+                     until: Optional[str] = None) -> List[Dict]:
+        """Weekly postings and share of postings for one skill over the last ``weeks`` weeks."""
+        skill = self.skill_registry.canonical(skill)
+        _, start, end = self._window(weeks, until)
+        end_day = date.fromisoformat(end)
+
+        def week_of(day: str) -> int:
+            return (end_day - date.fromisoformat(day)).days // 7
+
+        location_filter = " AND location = ?" if location else ""
+        extra = [location] if location else []
+
+        with self._lock:
+            totals = self._conn.execute(
+                "SELECT day, SUM(jobs) FROM job_counts WHERE day > ? AND day <= ?" + location_filter + " GROUP BY day",
+                [start, end] + extra
+            ).fetchall()
+            counts = self._conn.execute(
+                "SELECT day, SUM(jobs) FROM skill_counts WHERE skill = ? AND day > ? AND day <= ?" + location_filter
+                + " GROUP BY day",
+                [skill, start, end] + extra
+            ).fetchall()
+
+        weekly_totals = Counter()
+        weekly_counts = Counter()
+        for day, jobs in totals:
+            weekly_totals[week_of(day)] += jobs
+        for day, jobs in counts:
+            weekly_counts[week_of(day)] += jobs
+
+        series = []
+        for weeks_ago in range(weeks - 1, -1, -1):
+            total = weekly_totals[weeks_ago]
+            series.append({
+                "week_ending": (end_day - timedelta(weeks=weeks_ago)).isoformat(),
+                "jobs": weekly_counts[weeks_ago],
+                "share": round(weekly_counts[weeks_ago] / total * 100, 1) if total else 0.0
+            })
+        return series
+
+    def stats(self) -> Dict:
+        with self._lock:
+            files, jobs = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(jobs), 0) FROM ingested_files").fetchone()
+            first_day, last_day = self._conn.execute("SELECT MIN(day), MAX(day) FROM job_counts").fetchone()
+        return {"ingested_files": files, "jobs": jobs, "first_day": first_day, "last_day": last_day}
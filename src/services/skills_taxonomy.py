@@ -0,0 +1,99 @@
+import json
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from ..config.settings import Config
+from ..utils.aho_corasick import AhoCorasickMatcher
+
+# How far, in characters, an ambiguous spelling may be from its context
+CONTEXT_WINDOW = 40
+
+
+class SkillsTaxonomy:
+    """Skills dictionary loaded from a JSON taxonomy file and compiled once into a single matcher.
+
+    Each entry has a canonical ``name``, a ``category``, optional ``aliases``
+    matched case-insensitively, and optional ``exact`` spellings that must
+    match case too. ``ambiguous`` spellings are common words ("Ruby",
+    "Spark", "Flask") that also have to match case, and only count when a
+    top-level ``context_terms`` entry or an unambiguous skill is within
+    ``CONTEXT_WINDOW`` characters, so "Ruby developer" matches but "Ruby red"
+    does not. A name listed under ``exact`` or ``ambiguous`` is only matched
+    that way.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or Config.SKILLS_TAXONOMY_PATH
+        self.categories: Dict[str, str] = {}
+        self.matcher = AhoCorasickMatcher()
+        self.context = AhoCorasickMatcher()
+        self._load()
+
+    def _load(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        for term in data.get("context_terms", []):
+            self.context.add(term, term)
+
+        for entry in data.get("skills", []):
+            name = entry["name"]
+            exact = entry.get("exact", [])
+            ambiguous = entry.get("ambiguous", [])
+            self.categories.setdefault(name, entry.get("category", "Other"))
+
+            if name not in exact and name not in ambiguous:
+                self.matcher.add(name, (name, False))
+            for alias in entry.get("aliases", []):
+                self.matcher.add(alias, (name, False))
+            for spelling in exact:
+                self.matcher.add(spelling, (name, False), case_sensitive=True)
+            for spelling in ambiguous:
+                self.matcher.add(spelling, (name, True), case_sensitive=True)
+
+        self.matcher.build()
+        self.context.build()
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def extract(self, *texts: str) -> List[str]:
+        """Canonical skill names found in ``texts``, in order of first mention."""
+        skills = []
+        seen = set()
+
+        for text in texts:
+            if not text:
+                continue
+            matches = self.matcher.find(text)
+            anchors = [(start, end) for start, end, (_, ambiguous) in matches if not ambiguous]
+            anchors += [(start, end) for start, end, _ in self.context.find(text)]
+
+            for start, end, (name, ambiguous) in matches:
+                if ambiguous and not self._has_context(start, end, anchors):
+                    continue
+                if name not in seen:
+                    seen.add(name)
+                    skills.append(name)
+        return skills
+
+    @staticmethod
+    def _has_context(start: int, end: int, anchors: List[Tuple[int, int]]) -> bool:
+        return any(a_start < end + CONTEXT_WINDOW and a_end > start - CONTEXT_WINDOW for a_start, a_end in anchors)
+
+    def category_of(self, skill: str) -> Optional[str]:
+        return self.categories.get(skill)
+
+
+_shared_taxonomy = None
+_shared_taxonomy_lock = threading.Lock()
+
+
+def get_skills_taxonomy() -> SkillsTaxonomy:
+    global _shared_taxonomy
+
+    with _shared_taxonomy_lock:
+        if _shared_taxonomy is None:
+            _shared_taxonomy = SkillsTaxonomy()
+
+    return _shared_taxonomy
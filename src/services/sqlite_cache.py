@@ -0,0 +1,99 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+class SqliteCache:
+    """Disk-backed string cache in one SQLite table, with per-entry expiry and LRU eviction.
+
+    ``put`` stores an entry for ``ttl`` seconds (0 keeps it until evicted).
+    Expired entries count as misses and are deleted when read. Once
+    ``max_entries`` is exceeded, the least recently used entries are
+    evicted. Safe to share between worker threads.
+    """
+
+    def __init__(self, path: str, table: str, max_entries: int):
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                cache_key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE cache_key = ?", (key,)
+            ).fetchone()
+
+            if row is None or (row[1] is not None and row[1] <= now):
+                if row is not None:
+                    self._conn.execute(f"DELETE FROM {self.table} WHERE cache_key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(f"UPDATE {self.table} SET last_used = ? WHERE cache_key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+
+        return row[0]
+
+    def contains(self, key: str) -> bool:
+        """Whether ``key`` has an unexpired entry. Does not count as a lookup or refresh the entry."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT 1 FROM {self.table} WHERE cache_key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time())
+            ).fetchone()
+        return row is not None
+
+    def put(self, key: str, value: str, ttl: float = 0):
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl if ttl > 0 else None, now)
+            )
+            self._conn.execute(
+                f"""DELETE FROM {self.table} WHERE rowid IN (
+                        SELECT rowid FROM {self.table} ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                    )""",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            entries = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": entries
+        }
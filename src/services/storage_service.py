@@ -1,18 +1,31 @@
+import glob
 import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from .skill_analytics import SkillAnalytics
+from .skill_registry import SkillRegistry, get_skill_registry
+from .skill_sketch import SkillFrequencySketch
+
 
 class StorageService:
-    def __init__(self):
+    def __init__(self, skill_registry: Optional[SkillRegistry] = None):
         self.data_dir = "data"
+        self.skill_registry = skill_registry or get_skill_registry()
         os.makedirs(self.data_dir, exist_ok=True)
 
+    def _without_skill_ids(self, jobs: List[Dict]) -> List[Dict]:
+        # Skill ids only mean something inside this process, so files keep the names
+        return [{key: value for key, value in job.items() if key != "skill_ids"} for job in jobs]
+
     def save_results(self, filename: str, data: Dict[str, Any]) -> str:
         try:
             filepath = os.path.join(self.data_dir, filename)
 
+            if "jobs_with_skills" in data:
+                data = {**data, "jobs_with_skills": self._without_skill_ids(data["jobs_with_skills"])}
+
             with open(filepath, 'w') as f:
                 json.dump(data, f, indent=2)
 
@@ -30,12 +43,56 @@ class StorageService:
             with open(filepath, 'r') as f:
                 data = json.load(f)
 
+            for job in data.get("jobs_with_skills", []):
+                job["skill_ids"] = self.skill_registry.intern_all(job.get("skills") or [])
+                job["skills"] = self.skill_registry.names(job["skill_ids"])
+
             return data
 
         except Exception as e:
             print(f"Failed to load results: {e}")
             return {}
 
+    def list_results(self) -> List[str]:
+        """Saved analysis files, oldest first (the timestamp in the name sorts chronologically)."""
+        pattern = os.path.join(self.data_dir, "location_filtered_analysis_*.json")
+        return sorted(os.path.basename(path) for path in glob.glob(pattern))
+
+    def load_analytics(self, filenames: Optional[List[str]] = None,
+                       analytics: Optional[SkillAnalytics] = None) -> SkillAnalytics:
+        """Merge the jobs of stored runs into one SkillAnalytics view, each posting counted once."""
+        analytics = analytics or SkillAnalytics(self.skill_registry)
+
+        for filename in filenames if filenames is not None else self.list_results():
+            analytics.add_jobs(self.load_results(filename).get("jobs_with_skills", []))
+
+        return analytics
+
+    def sketch_results(self, filenames: Optional[List[str]] = None,
+                       sketch: Optional[SkillFrequencySketch] = None) -> SkillFrequencySketch:
+        """Stream stored runs, one file at a time, into a fixed-memory skill frequency sketch.
+
+        Skills are not interned, so a long tail of one-off LLM skills does not
+        grow the shared registry.
+        """
+        sketch = sketch or SkillFrequencySketch(skill_registry=self.skill_registry)
+
+        for filename in filenames if filenames is not None else self.list_results():
+            try:
+                with open(os.path.join(self.data_dir, filename), 'r') as f:
+                    sketch.add_jobs(json.load(f).get("jobs_with_skills", []))
+            except Exception as e:
+                print(f"Failed to sketch {filename}: {e}")
+
+        return sketch
+
+    def save_sketch(self, filename: str, sketch: SkillFrequencySketch) -> str:
+        return self.save_results(filename, sketch.to_dict())
+
+    def load_sketch(self, filename: str) -> Optional[SkillFrequencySketch]:
+        data = self.load_results(filename)
+        return SkillFrequencySketch.from_dict(data, self.skill_registry) if data else None
+
     def export_to_csv(self, data: Dict[str, Any], filename: str) -> str:
         import pandas as pd
 
@@ -43,7 +100,7 @@ class StorageService:
             jobs_data = data.get("jobs_with_skills", [])
 
             if jobs_data:
-                df = pd.DataFrame(jobs_data)
+                df = pd.DataFrame(self._without_skill_ids(jobs_data))
                 csv_path = os.path.join(self.data_dir, f"{filename}.csv")
                 df.to_csv(csv_path, index=False)
                 return csv_path
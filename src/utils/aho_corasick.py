@@ -0,0 +1,116 @@
+import re
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+_SEPARATORS = re.compile(r"[\s_\-]+")
+_WORD_SUFFIX_CHARS = "+#"
+
+
+def collapse_separators(text: str) -> str:
+    return _SEPARATORS.sub(" ", text)
+
+
+class AhoCorasickMatcher:
+    """Multi-pattern matcher that finds every dictionary term in one pass over the text.
+
+    Matching ignores case, and treats runs of whitespace, hyphens and
+    underscores as a single space. Patterns added with ``case_sensitive``
+    must also match the original casing, which keeps short names such as
+    "R" or "Go" from matching ordinary words. A match only counts on word
+    boundaries, so "java" does not match inside "javascript" and "c" does not
+    match inside "c++". Overlaps resolve leftmost-longest, so "asp.net core"
+    wins over ".net".
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._terms: List[List[Tuple[int, Any, Optional[str]]]] = [[]]
+        self._output: List[List[Tuple[int, Any, Optional[str]]]] = [[]]
+        self._built = False
+
+    def add(self, pattern: str, value: Any, case_sensitive: bool = False):
+        cased = collapse_separators(pattern).strip()
+        folded = cased.lower()
+        if not folded:
+            return
+
+        state = 0
+        for char in folded:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._terms.append([])
+            state = next_state
+
+        self._terms[state].append((len(folded), value, cased if case_sensitive else None))
+        self._built = False
+
+    def build(self):
+        self._fail = [0] * len(self._goto)
+        self._output = [list(terms) for terms in self._terms]
+
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self._goto[state].items():
+                pending.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+        self._built = True
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    @staticmethod
+    def _is_boundary(text: str, start: int, end: int) -> bool:
+        if start > 0 and text[start - 1].isalnum():
+            return False
+        if end < len(text) and (text[end].isalnum() or text[end] in _WORD_SUFFIX_CHARS):
+            return False
+        return True
+
+    def iter_matches(self, text: str):
+        """Yield ``(start, end, value)`` for every word-bounded match, with offsets into the collapsed text."""
+        if not self._built:
+            self.build()
+
+        cased = collapse_separators(text)
+        folded = cased.lower()
+        same_length = len(folded) == len(cased)
+
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+
+        for index, char in enumerate(folded):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for length, value, cased_pattern in output[state]:
+                start = index + 1 - length
+                if not self._is_boundary(folded, start, index + 1):
+                    continue
+                if cased_pattern is not None and (not same_length or cased[start:index + 1] != cased_pattern):
+                    continue
+                yield start, index + 1, value
+
+    def find(self, text: str) -> List[Tuple[int, int, Any]]:
+        """Return non-overlapping matches in ``text`` chosen leftmost-longest."""
+        matches = sorted(self.iter_matches(text), key=lambda m: (m[0], m[0] - m[1]))
+
+        selected = []
+        last_end = 0
+        for start, end, value in matches:
+            if start >= last_end:
+                selected.append((start, end, value))
+                last_end = end
+        return selected
@@ -0,0 +1,80 @@
+from collections import Counter, defaultdict
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+WeightedTransactions = List[Tuple[Sequence[Hashable], int]]
+
+
+class _Node:
+    __slots__ = ("item", "count", "parent", "children")
+
+    def __init__(self, item: Optional[Hashable], parent: Optional["_Node"]):
+        self.item = item
+        self.count = 0
+        self.parent = parent
+        self.children: Dict[Hashable, "_Node"] = {}
+
+
+def _build_tree(transactions: WeightedTransactions, min_count: int):
+    counts = Counter()
+    for items, weight in transactions:
+        for item in items:
+            counts[item] += weight
+
+    frequent = {item: count for item, count in counts.items() if count >= min_count}
+    rank = {item: position for position, item in enumerate(sorted(frequent, key=lambda i: (-frequent[i], i)))}
+
+    root = _Node(None, None)
+    header: Dict[Hashable, List[_Node]] = defaultdict(list)
+    for items, weight in transactions:
+        node = root
+        for item in sorted((i for i in items if i in rank), key=rank.__getitem__):
+            child = node.children.get(item)
+            if child is None:
+                child = _Node(item, node)
+                node.children[item] = child
+                header[item].append(child)
+            child.count += weight
+            node = child
+
+    return header, frequent, rank
+
+
+def _mine(transactions: WeightedTransactions, min_count: int, max_size: int,
+          suffix: Tuple, results: List[Tuple[Tuple, int]]):
+    header, frequent, rank = _build_tree(transactions, min_count)
+
+    for item in sorted(frequent, key=rank.__getitem__, reverse=True):
+        itemset = suffix + (item,)
+        results.append((itemset, frequent[item]))
+        if len(itemset) >= max_size:
+            continue
+
+        conditional = []
+        for node in header[item]:
+            path = []
+            parent = node.parent
+            while parent.item is not None:
+                path.append(parent.item)
+                parent = parent.parent
+            if path:
+                conditional.append((path, node.count))
+
+        if conditional:
+            _mine(conditional, min_count, max_size, itemset, results)
+
+
+def frequent_itemsets(transactions: WeightedTransactions, min_count: int,
+                      max_size: int = 5) -> List[Tuple[Tuple, int]]:
+    """Mine every itemset contained in at least ``min_count`` transactions, up to ``max_size`` items.
+
+    Uses FP-growth: transactions are folded into a prefix tree ordered by
+    item frequency, and each item's conditional tree is mined recursively,
+    so no candidate itemsets are generated. Each transaction is a sequence
+    of distinct items with a weight, which lets callers collapse identical
+    transactions first. Returns ``(itemset, count)`` pairs, singletons
+    included, in no particular order.
+    """
+    results: List[Tuple[Tuple, int]] = []
+    if max_size >= 1:
+        _mine(list(transactions), max(1, min_count), max_size, (), results)
+    return results
@@ -0,0 +1,227 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from ..config.settings import Config
+
+TRANSIENT_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+TRANSIENT_ERROR_NAMES = {
+    "RateLimitError", "APITimeoutError", "APIConnectionError", "InternalServerError", "ServiceUnavailableError"
+}
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_transient(error: Exception) -> bool:
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError)):
+        return True
+    return _status_code(error) in TRANSIENT_STATUS_CODES or type(error).__name__ in TRANSIENT_ERROR_NAMES
+
+
+def retry_after_from_error(error: Exception) -> Optional[float]:
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class LLMScheduler:
+    """Shared gate for chat model calls that keeps a run under its provider limits.
+
+    Requests-per-minute and tokens-per-minute budgets are token buckets.
+    Callers reserve their share up front and sleep until it is covered, so
+    bursts queue rather than hit 429s. Transient failures are retried with
+    full-jitter exponential backoff, honouring Retry-After. After
+    ``failure_threshold`` consecutive failed attempts the circuit opens and
+    calls fail fast for ``reset_timeout`` seconds. One trial call then
+    decides whether it closes again. ``clock`` and ``sleep`` default to the
+    real monotonic clock and can be replaced in tests.
+    """
+
+    def __init__(self, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None,
+                 max_retries: Optional[int] = None, backoff_base: Optional[float] = None,
+                 backoff_max: Optional[float] = None, failure_threshold: Optional[int] = None,
+                 reset_timeout: Optional[float] = None, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.requests_per_minute = max(1, requests_per_minute or Config.LLM_REQUESTS_PER_MINUTE)
+        self.tokens_per_minute = max(1, tokens_per_minute or Config.LLM_TOKENS_PER_MINUTE)
+        self.max_retries = Config.LLM_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_base = Config.LLM_BACKOFF_BASE if backoff_base is None else backoff_base
+        self.backoff_max = Config.LLM_BACKOFF_MAX if backoff_max is None else backoff_max
+        self.failure_threshold = max(1, failure_threshold or Config.LLM_CIRCUIT_FAILURES)
+        self.reset_timeout = Config.LLM_CIRCUIT_RESET if reset_timeout is None else reset_timeout
+        self.clock = clock
+        self.sleep = sleep
+
+        self._request_allowance = float(self.requests_per_minute)
+        self._token_allowance = float(self.tokens_per_minute)
+        self._updated_at = self.clock()
+        self._paused_until = 0.0
+
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.rejected = 0
+        self.tokens = 0
+        self.total_queue_delay = 0.0
+        self.max_queue_delay = 0.0
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated_at
+        self._request_allowance = min(self.requests_per_minute,
+                                      self._request_allowance + elapsed * self.requests_per_minute / 60)
+        self._token_allowance = min(self.tokens_per_minute,
+                                    self._token_allowance + elapsed * self.tokens_per_minute / 60)
+        self._updated_at = now
+
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self._request_allowance -= 1
+            self._token_allowance -= min(tokens, self.tokens_per_minute)
+
+            wait = max(0.0,
+                       -self._request_allowance * 60 / self.requests_per_minute,
+                       -self._token_allowance * 60 / self.tokens_per_minute,
+                       self._paused_until - now)
+            self.total_queue_delay += wait
+            self.max_queue_delay = max(self.max_queue_delay, wait)
+        return wait
+
+    def _settle(self, response: Any, estimated_tokens: int):
+        usage = getattr(response, "usage_metadata", None) or {}
+        actual_tokens = usage.get("total_tokens") or estimated_tokens
+
+        with self._lock:
+            self.calls += 1
+            self.tokens += actual_tokens
+            self._token_allowance -= actual_tokens - min(estimated_tokens, self.tokens_per_minute)
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def _check_circuit(self):
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self.clock() - self._opened_at < self.reset_timeout or self._trial_in_flight:
+                self.rejected += 1
+                raise CircuitOpenError("LLM circuit breaker is open after repeated failures")
+            self._trial_in_flight = True
+
+    def _record_failure(self, error: Exception, attempt: int) -> Optional[float]:
+        """Count a failed attempt and return the backoff before retrying, or None to give up."""
+        with self._lock:
+            self.failures += 1
+            self._consecutive_failures += 1
+            self._trial_in_flight = False
+            if self._consecutive_failures >= self.failure_threshold:
+                self._opened_at = self.clock()
+
+            retry_after = retry_after_from_error(error)
+            if retry_after:
+                self._paused_until = max(self._paused_until, self.clock() + retry_after)
+
+            if self._opened_at is not None or attempt >= self.max_retries or not is_transient(error):
+                return None
+
+            self.retries += 1
+            backoff = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+            return max(backoff, retry_after or 0.0)
+
+    def invoke(self, llm: Any, messages: Any, estimated_tokens: int, **kwargs: Any) -> Any:
+        attempt = 0
+        while True:
+            self._check_circuit()
+            wait = self._reserve(estimated_tokens)
+            if wait > 0:
+                self.sleep(wait)
+
+            try:
+                response = llm.invoke(messages, **kwargs)
+            except Exception as e:
+                backoff = self._record_failure(e, attempt)
+                if backoff is None:
+                    raise
+                self.sleep(backoff)
+                attempt += 1
+                continue
+
+            self._settle(response, estimated_tokens)
+            return response
+
+    async def ainvoke(self, llm: Any, messages: Any, estimated_tokens: int,
+                      timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        attempt = 0
+        while True:
+            self._check_circuit()
+            wait = self._reserve(estimated_tokens)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            try:
+                response = await asyncio.wait_for(llm.ainvoke(messages, **kwargs), timeout)
+            except Exception as e:
+                backoff = self._record_failure(e, attempt)
+                if backoff is None:
+                    raise
+                await asyncio.sleep(backoff)
+                attempt += 1
+                continue
+
+            self._settle(response, estimated_tokens)
+            return response
+
+    @property
+    def circuit_state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if self.clock() - self._opened_at >= self.reset_timeout else "open"
+
+    def stats(self) -> Dict:
+        with self._lock:
+            attempts = self.calls + self.failures
+            return {
+                "calls": self.calls,
+                "retries": self.retries,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "tokens": self.tokens,
+                "circuit": self.circuit_state,
+                "total_queue_delay": round(self.total_queue_delay, 2),
+                "avg_queue_delay": round(self.total_queue_delay / attempts, 3) if attempts else 0.0,
+                "max_queue_delay": round(self.max_queue_delay, 2)
+            }
+
+
+_shared_scheduler = None
+_shared_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    global _shared_scheduler
+
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = LLMScheduler()
+
+    return _shared_scheduler
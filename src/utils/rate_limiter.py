@@ -0,0 +1,104 @@
+import threading
+import time
+import urllib.parse
+from typing import Callable, Dict, Optional
+
+from ..config.settings import Config
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose refill rate adapts with AIMD.
+
+    Every success raises the rate by ``increase`` requests/second, and every
+    throttling signal multiplies it by ``decrease_factor``. The rate always
+    stays between ``min_rate`` and ``max_rate``. A ``retry_after`` hint pauses
+    all callers until it has elapsed. ``clock`` and ``sleep`` default to the
+    real monotonic clock and can be replaced in tests.
+    """
+
+    def __init__(self, rate: float, min_rate: float, max_rate: float, burst: float = 1.0,
+                 increase: float = 0.05, decrease_factor: float = 0.5,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.burst = max(burst, 1.0)
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.clock = clock
+        self.sleep = sleep
+
+        self._rate = min(max(rate, self.min_rate), self.max_rate)
+        self._tokens = self.burst
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        self.successes = 0
+        self.throttles = 0
+        self.total_wait = 0.0
+
+    @property
+    def current_rate(self) -> float:
+        return self._rate
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def acquire(self) -> float:
+        """Block until a request may start and return how long we waited."""
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            wait = max(wait, self._paused_until - now)
+            self.total_wait += wait
+
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    def record_success(self):
+        with self._lock:
+            self.successes += 1
+            self._rate = min(self.max_rate, self._rate + self.increase)
+
+    def record_throttle(self, retry_after: Optional[float] = None):
+        with self._lock:
+            self.throttles += 1
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            if retry_after:
+                self._paused_until = max(self._paused_until, self.clock() + retry_after)
+
+    def stats(self) -> Dict:
+        return {
+            "current_rate": round(self._rate, 3),
+            "successes": self.successes,
+            "throttles": self.throttles,
+            "total_wait": round(self.total_wait, 2)
+        }
+
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(url: str) -> AdaptiveRateLimiter:
+    """Return the limiter shared by every scraper and worker that talks to ``url``'s host."""
+    host = urllib.parse.urlparse(url).netloc.lower()
+
+    with _limiters_lock:
+        if host not in _limiters:
+            initial_rate = 1 / Config.SCRAPING_DELAY if Config.SCRAPING_DELAY > 0 else Config.SCRAPE_MAX_RATE
+            _limiters[host] = AdaptiveRateLimiter(
+                rate=initial_rate,
+                min_rate=Config.SCRAPE_MIN_RATE,
+                max_rate=Config.SCRAPE_MAX_RATE
+            )
+        return _limiters[host]
+
+
+def rate_limiter_stats() -> Dict[str, Dict]:
+    with _limiters_lock:
+        return {host: limiter.stats() for host, limiter in _limiters.items()}
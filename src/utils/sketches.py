@@ -0,0 +1,162 @@
+import hashlib
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple
+
+
+def _hash_pair(item: str) -> Tuple[int, int]:
+    digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class CountMinSketch:
+    """Fixed-size frequency sketch for point queries over an unbounded stream.
+
+    With width ``ceil(e / epsilon)`` and depth ``ceil(ln(1 / delta))``, an
+    estimate never undercounts. It exceeds the true count by more than
+    ``epsilon * total`` with probability at most ``delta``, where ``total``
+    is the sum of all increments. Hashing is keyed only on the item text, so
+    sketches of the same shape built in different runs or processes can be
+    merged by adding their tables.
+    """
+
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01):
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.table = [[0] * self.width for _ in range(self.depth)]
+        self.total = 0
+
+    def _positions(self, item: str):
+        first, second = _hash_pair(item)
+        for row in range(self.depth):
+            yield row, (first + row * second) % self.width
+
+    def add(self, item: str, count: int = 1):
+        for row, position in self._positions(item):
+            self.table[row][position] += count
+        self.total += count
+
+    def estimate(self, item: str) -> int:
+        return min(self.table[row][position] for row, position in self._positions(item))
+
+    def merge(self, other: "CountMinSketch"):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Count-Min sketches must have the same width and depth to merge")
+
+        for row, other_row in zip(self.table, other.table):
+            for position, count in enumerate(other_row):
+                if count:
+                    row[position] += count
+        self.total += other.total
+
+    def to_dict(self) -> Dict:
+        return {"epsilon": self.epsilon, "delta": self.delta, "total": self.total, "table": self.table}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "CountMinSketch":
+        sketch = cls(data["epsilon"], data["delta"])
+        sketch.table = [list(row) for row in data["table"]]
+        sketch.total = data["total"]
+        return sketch
+
+
+class SpaceSaving:
+    """Heavy-hitter summary that monitors at most ``capacity`` items.
+
+    When a new item arrives and the summary is full, the item with the
+    smallest count is replaced. The newcomer inherits that count as its
+    error. Every reported count is an upper bound, and count minus error is
+    a lower bound. The error is at most ``total / capacity``, so any item
+    seen more than ``total / capacity`` times is guaranteed to be
+    monitored. Merging two summaries keeps the same bound over the combined
+    stream.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = max(1, capacity)
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.total = 0
+        self._heap: List[Tuple[int, str]] = []
+
+    def _push(self, item: str):
+        heapq.heappush(self._heap, (self.counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, key) for key, count in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[str, int]:
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return item, count
+
+    def add(self, item: str, count: int = 1):
+        self.total += count
+
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            evicted, floor = self._pop_min()
+            del self.counts[evicted]
+            del self.errors[evicted]
+            self.counts[item] = floor + count
+            self.errors[item] = floor
+
+        self._push(item)
+
+    @property
+    def min_count(self) -> int:
+        """Upper bound on the count of any item not currently monitored."""
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+
+    def estimate(self, item: str) -> Tuple[int, int]:
+        """Return ``(upper_bound, error)`` for ``item``."""
+        if item in self.counts:
+            return self.counts[item], self.errors[item]
+        return self.min_count, self.min_count
+
+    def top(self, k: Optional[int] = None) -> List[Tuple[str, int, int]]:
+        ranked = sorted(self.counts.items(), key=lambda entry: (-entry[1], entry[0]))
+        return [(item, count, self.errors[item]) for item, count in ranked[:k]]
+
+    def merge(self, other: "SpaceSaving"):
+        floor, other_floor = self.min_count, other.min_count
+        counts: Dict[str, int] = {}
+        errors: Dict[str, int] = {}
+
+        for item in set(self.counts) | set(other.counts):
+            count, error = self.counts.get(item, floor), self.errors.get(item, floor)
+            other_count, other_error = other.counts.get(item, other_floor), other.errors.get(item, other_floor)
+            counts[item] = count + other_count
+            errors[item] = error + other_error
+
+        kept = heapq.nlargest(self.capacity, counts, key=counts.__getitem__)
+        self.counts = {item: counts[item] for item in kept}
+        self.errors = {item: errors[item] for item in kept}
+        self.total += other.total
+        self._heap = [(count, item) for item, count in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def to_dict(self) -> Dict:
+        return {
+            "capacity": self.capacity,
+            "total": self.total,
+            "items": [[item, count, self.errors[item]] for item, count in self.counts.items()]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SpaceSaving":
+        summary = cls(data["capacity"])
+        summary.total = data["total"]
+        for item, count, error in data["items"]:
+            summary.counts[item] = count
+            summary.errors[item] = error
+        summary._heap = [(count, item) for item, count in summary.counts.items()]
+        heapq.heapify(summary._heap)
+        return summary
@@ -1,39 +1,75 @@
+import asyncio
 import json
-import time
-import random
-from typing import Dict, List
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
-import os
 
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph, END
 
 from .workflow_state import JobSkillsState
+from ..agents.llm_router import ConfidenceRouter, RoutingRun
 from ..agents.skills_agent import SkillsAgent
-from ..scrapers.linkedin_scraper import LinkedInScraper
+from ..agents.taxonomy_skills_agent import TaxonomySkillsAgent
+from ..config.settings import Config
+from ..scrapers.description_fetcher import JobDescriptionFetcher
+from ..scrapers.keyword_fanout import KeywordFanout
+from ..scrapers.scraper_factory import create_scraper
 from ..services.analysis_service import AnalysisService
+from ..services.scrape_cache import ScrapeCache
+from ..services.seen_jobs_index import SeenJobsIndex
+from ..services.skill_analytics import SkillAnalytics
+from ..services.skill_registry import get_skill_registry
+from ..services.skill_trends import SkillTrendStore
 from ..services.storage_service import StorageService
+from ..utils.llm_scheduler import get_llm_scheduler
+from ..utils.rate_limiter import get_rate_limiter
 
 
 class SkillsExtractionWorkflow:
     def __init__(self, openai_api_key: str):
-        os.environ["OPENAI_API_KEY"] = openai_api_key
-
-        self.scraper = LinkedInScraper()
-        self.skills_agent = SkillsAgent(openai_api_key)
-        self.analysis_service = AnalysisService()
+        self.seen_index = SeenJobsIndex() if Config.SEEN_JOBS_ENABLED else None
+        self.scraper = create_scraper(seen_index=self.seen_index)
+        self.keyword_fanout = KeywordFanout(lambda: create_scraper(seen_index=self.seen_index))
+        self.scrape_cache = ScrapeCache() if Config.SCRAPE_CACHE_ENABLED else None
+        self.description_fetcher = JobDescriptionFetcher() if Config.FETCH_DESCRIPTIONS else None
+        self.skills_agent = (TaxonomySkillsAgent(openai_api_key) if Config.SKILLS_EXTRACTOR == "taxonomy"
+                             else SkillsAgent(openai_api_key))
+        self.llm_router = ConfidenceRouter() if Config.LLM_ROUTING_ENABLED else None
+        self.skill_registry = get_skill_registry()
+        self.analysis_service = AnalysisService(self.skill_registry)
         self.storage_service = StorageService()
+        self.trend_store = SkillTrendStore(storage_service=self.storage_service) if Config.SKILL_TRENDS_ENABLED else None
+        self.last_analytics: Optional[SkillAnalytics] = None  # accumulator of the most recent run
         self.workflow = self._build_workflow()
 
     def _build_workflow(self):
         workflow = StateGraph(JobSkillsState)
 
+        if Config.STREAMING_PIPELINE:
+            workflow.add_node("stream", self.stream_pipeline_node)
+            workflow.add_node("save", self.save_results_node)
+            workflow.add_edge("stream", "save")
+            workflow.add_edge("save", END)
+            workflow.set_entry_point("stream")
+            return workflow.compile()
+
         workflow.add_node("search", self.search_jobs_node)
         workflow.add_node("filter_location", self.filter_location_node)
         workflow.add_node("infer", self.infer_skills_node)
         workflow.add_node("save", self.save_results_node)
 
         workflow.add_edge("search", "filter_location")
-        workflow.add_edge("filter_location", "infer")
+
+        if self.description_fetcher:
+            workflow.add_node("describe", self.fetch_descriptions_node)
+            workflow.add_edge("filter_location", "describe")
+            workflow.add_edge("describe", "infer")
+        else:
+            workflow.add_edge("filter_location", "infer")
+
         workflow.add_edge("infer", "save")
         workflow.add_edge("save", END)
 
@@ -45,22 +81,12 @@ class SkillsExtractionWorkflow:
         state["current_step"] = f"Searching for {state['job_category']} jobs in {state['location']}..."
 
         try:
-            all_jobs = []
-            search_keywords = state["search_keywords"]
-
-            for i, keyword in enumerate(search_keywords[:3]):
-                state["current_step"] = f"Searching '{keyword}' in {state['location']} ({i + 1}/3)..."
-
-                jobs = self.scraper.search_jobs_for_keyword(
-                    keyword,
-                    state["location"],
-                    state["date_filter"]
-                )
-                all_jobs.extend(jobs)
-
-                time.sleep(random.uniform(3, 5))
+            all_jobs = self._collect_jobs(state)
 
             unique_jobs = self._remove_duplicate_jobs(all_jobs)
+            if self.seen_index:
+                self.seen_index.mark_seen(unique_jobs)
+
             state["raw_jobs"] = unique_jobs
             state["current_step"] = f"Found {len(unique_jobs)} jobs (before location filtering)"
 
@@ -70,6 +96,53 @@ class SkillsExtractionWorkflow:
 
         return state
 
+    def _search_keywords(self, state: JobSkillsState) -> List[str]:
+        search_keywords = state["search_keywords"]
+        if Config.MAX_KEYWORDS_PER_SEARCH > 0:
+            search_keywords = search_keywords[:Config.MAX_KEYWORDS_PER_SEARCH]
+        return search_keywords
+
+    def _collect_jobs(self, state: JobSkillsState,
+                      on_keyword_jobs: Optional[Callable[[str, List[Dict]], None]] = None) -> List[Dict]:
+        search_keywords = self._search_keywords(state)
+
+        keyword_results = {}
+        if self.scrape_cache:
+            for keyword in search_keywords:
+                cached_jobs = self.scrape_cache.get(keyword, state["location"], state["date_filter"])
+                if cached_jobs is not None:
+                    keyword_results[keyword] = cached_jobs
+                    if on_keyword_jobs:
+                        on_keyword_jobs(keyword, cached_jobs)
+
+        pending_keywords = [keyword for keyword in search_keywords if keyword not in keyword_results]
+
+        if pending_keywords:
+            self.scraper.warm_up()
+
+            completed = []
+            rate_limiter = get_rate_limiter(self.scraper.search_url)
+
+            def on_result(index: int, keyword: str, jobs: List[Dict]):
+                completed.append(keyword)
+                if self.scrape_cache:
+                    self.scrape_cache.put(keyword, state["location"], state["date_filter"], jobs)
+                if on_keyword_jobs:
+                    on_keyword_jobs(keyword, jobs)
+                state["current_step"] = (f"Searched '{keyword}' in {state['location']} "
+                                         f"({len(completed)}/{len(pending_keywords)}, "
+                                         f"{rate_limiter.current_rate:.2f} req/s)...")
+
+            scraped = self.keyword_fanout.run_grouped(
+                pending_keywords,
+                state["location"],
+                state["date_filter"],
+                on_result=on_result
+            )
+            keyword_results.update(zip(pending_keywords, scraped))
+
+        return [job for keyword in search_keywords for job in keyword_results.get(keyword, [])]
+
     def filter_location_node(self, state: JobSkillsState) -> JobSkillsState:
         state["current_step"] = f"Filtering jobs to ONLY {state['location']}..."
 
@@ -101,41 +174,264 @@ class SkillsExtractionWorkflow:
 
         return state
 
+    def fetch_descriptions_node(self, state: JobSkillsState) -> JobSkillsState:
+        state["current_step"] = "Fetching job descriptions..."
+
+        jobs = state["filtered_jobs"]
+        fetched = []
+
+        def on_description(job: Dict):
+            fetched.append(job)
+            state["current_step"] = f"Fetched {len(fetched)}/{len(jobs)} job descriptions..."
+
+        try:
+            self.description_fetcher.fetch_descriptions(jobs, on_description=on_description)
+        except Exception as e:
+            print(f"Description fetch error: {e}")
+            state["error_messages"].append(f"Description fetch error: {str(e)}")
+
+        state["current_step"] = f"Fetched descriptions for {len(fetched)} of {len(jobs)} jobs"
+        return state
+
     def infer_skills_node(self, state: JobSkillsState) -> JobSkillsState:
         state["current_step"] = "Inferring skills from location-filtered jobs..."
 
         jobs_with_skills = []
         all_skills = set()
+        reused = 0
+        analytics = SkillAnalytics(self.skill_registry)
 
-        for job in state["filtered_jobs"]:
-            try:
-                inferred_skills = self.skills_agent.infer_skills_from_job(job, state["job_category"])
+        routing = (self.llm_router.start_run(is_cached=self.skills_agent.has_cached_enhancement)
+                   if self.llm_router else None)
+
+        for job_with_skills in self._infer_skills_for_jobs(state["filtered_jobs"], state["job_category"], routing):
+            jobs_with_skills.append(job_with_skills)
+            all_skills.update(job_with_skills["skills"])
+            analytics.add_job(job_with_skills)
+            if job_with_skills["skills_source"] == "previous_run":
+                reused += 1
+
+        state["jobs_with_skills"] = jobs_with_skills
+        state["extracted_skills"] = sorted(list(all_skills))
+        state["routing_stats"] = routing.stats() if routing else {}
+        state["analytics_summary"] = analytics.to_dict()
+        self.last_analytics = analytics
+        state[
+            "current_step"] = (f"Extracted {len(all_skills)} skills from {len(jobs_with_skills)} {state['location']} jobs"
+                               f" ({reused} reused from earlier runs,"
+                               f" {state['routing_stats'].get('llm', 'all')} sent to the LLM)")
+
+        return state
+
+    def _skills_record(self, job: Dict, skills: List[str], skills_source: str) -> Dict:
+        skill_ids = self.skill_registry.intern_all(skills)
+        skills = self.skill_registry.names(skill_ids)
+        return {
+            **job,
+            "skills": skills,
+            "skill_ids": skill_ids,
+            "skills_source": skills_source,
+            "skills_count": len(skills)
+        }
+
+    def _known_skills_record(self, job: Dict, job_category: str) -> Optional[Dict]:
+        known_skills = self.seen_index.get_skills(job, job_category) if self.seen_index else None
+        if known_skills:
+            return self._skills_record(job, known_skills, "previous_run")
+        return None
+
+    def _enhanced_record(self, job: Dict, job_category: str, inferred_skills: List[str],
+                         ai_skills: List[str]) -> Dict:
+        final_skills = self.skill_registry.canonicalize(inferred_skills + ai_skills)
+        skills_source = "inferred + ai_enhanced" if ai_skills else "inferred"
+
+        if self.seen_index and ai_skills:
+            self.seen_index.record_skills(job, job_category, final_skills, skills_source)
+
+        return self._skills_record(job, final_skills, skills_source)
+
+    def _should_enhance(self, routing: Optional[RoutingRun], job: Dict, inferred_skills: List[str]) -> bool:
+        """Single LLM gate: the router when enabled, otherwise the agent's own check."""
+        if routing is not None:
+            return routing.should_enhance(job, inferred_skills)
+        return self.skills_agent.needs_llm(job)
+
+    def _infer_job_skills(self, job: Dict, job_category: str, routing: Optional[RoutingRun] = None) -> Dict:
+        known_record = self._known_skills_record(job, job_category)
+        if known_record:
+            return known_record
+
+        try:
+            inferred_skills = self.skills_agent.infer_skills_from_job(job, job_category)
+            ai_skills = []
+            if self._should_enhance(routing, job, inferred_skills):
                 ai_skills = self.skills_agent.enhance_with_ai(job, inferred_skills)
+            return self._enhanced_record(job, job_category, inferred_skills, ai_skills)
 
-                final_skills = list(set(inferred_skills + ai_skills))
+        except Exception as e:
+            print(f"Error inferring skills for {job['title']}: {e}")
+            return self._skills_record(job, [], "error")
 
-                jobs_with_skills.append({
-                    **job,
-                    "skills": final_skills,
-                    "skills_source": "inferred + ai_enhanced",
-                    "skills_count": len(final_skills)
-                })
+    async def _ainfer_skills_for_jobs(self, jobs: List[Dict], job_category: str,
+                                      routing: Optional[RoutingRun] = None) -> List[Dict]:
+        semaphore = asyncio.Semaphore(Config.LLM_CONCURRENCY)
 
-                all_skills.update(final_skills)
+        async def infer_one(job: Dict) -> Dict:
+            known_record = self._known_skills_record(job, job_category)
+            if known_record:
+                return known_record
 
+            try:
+                inferred_skills = self.skills_agent.infer_skills_from_job(job, job_category)
+            except Exception as e:
+                print(f"Error inferring skills for {job['title']}: {e!r}")
+                return self._skills_record(job, [], "error")
+
+            if not self._should_enhance(routing, job, inferred_skills):
+                return self._enhanced_record(job, job_category, inferred_skills, [])
+
+            try:
+                async with semaphore:
+                    ai_skills = await self.skills_agent.aenhance_with_ai(job, inferred_skills, timeout=Config.LLM_TIMEOUT)
+            except Exception as e:
+                print(f"AI enhancement failed for {job['title']}: {e!r}")
+                return {**self._enhanced_record(job, job_category, inferred_skills, []), "llm_error": repr(e)}
+
+            return self._enhanced_record(job, job_category, inferred_skills, ai_skills)
+
+        return list(await asyncio.gather(*(infer_one(job) for job in jobs)))
+
+    def _run_async(self, coroutine):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    def _infer_skills_for_jobs(self, jobs: List[Dict], job_category: str,
+                               routing: Optional[RoutingRun] = None) -> List[Dict]:
+        if Config.ENHANCE_BATCH_SIZE <= 1 and Config.LLM_CONCURRENCY > 1:
+            return self._run_async(self._ainfer_skills_for_jobs(jobs, job_category, routing))
+
+        if Config.ENHANCE_BATCH_SIZE <= 1:
+            return [self._infer_job_skills(job, job_category, routing) for job in jobs]
+
+        results: List[Optional[Dict]] = [None] * len(jobs)
+        pending = []
+
+        for index, job in enumerate(jobs):
+            results[index] = self._known_skills_record(job, job_category)
+            if results[index]:
+                continue
+
+            try:
+                inferred_skills = self.skills_agent.infer_skills_from_job(job, job_category)
             except Exception as e:
                 print(f"Error inferring skills for {job['title']}: {e}")
-                jobs_with_skills.append({
-                    **job,
-                    "skills": [],
-                    "skills_source": "error",
-                    "skills_count": 0
-                })
+                results[index] = self._skills_record(job, [], "error")
+                continue
 
-        state["jobs_with_skills"] = jobs_with_skills
-        state["extracted_skills"] = sorted(list(all_skills))
-        state[
-            "current_step"] = f"Extracted {len(all_skills)} skills from {len(jobs_with_skills)} {state['location']} jobs"
+            if self._should_enhance(routing, job, inferred_skills):
+                pending.append((index, job, inferred_skills))
+            else:
+                results[index] = self._enhanced_record(job, job_category, inferred_skills, [])
+
+        ai_skills_list = self.skills_agent.enhance_batch_with_ai(
+            [job for _, job, _ in pending],
+            [inferred_skills for _, _, inferred_skills in pending]
+        ) if pending else []
+
+        for (index, job, inferred_skills), ai_skills in zip(pending, ai_skills_list):
+            results[index] = self._enhanced_record(job, job_category, inferred_skills, ai_skills)
+
+        return results
+
+    def stream_pipeline_node(self, state: JobSkillsState) -> JobSkillsState:
+        """Search, filter and infer as one overlapping stage.
+
+        Keyword results are pushed onto a queue as soon as they are scraped.
+        Each new job is location-filtered and handed to a pool of inference
+        workers, so LLM calls start while other keywords are still being
+        scraped. Every enriched job is also emitted on the graph's custom
+        stream for live display.
+        """
+        state["current_step"] = f"Streaming {state['job_category']} jobs in {state['location']}..."
+
+        writer = get_stream_writer()
+        user_location = state["location"].lower().strip()
+        arrivals = queue.Queue()
+        scrape_result = {}
+
+        def produce():
+            try:
+                scrape_result["jobs"] = self._collect_jobs(state, lambda keyword, jobs: arrivals.put(jobs))
+            except Exception as e:
+                scrape_result["error"] = e
+            finally:
+                arrivals.put(None)
+
+        producer = threading.Thread(target=produce, name="stream-producer", daemon=True)
+        producer.start()
+
+        seen = set()
+        filtered_jobs = {}
+        pending = {}
+        executor = ThreadPoolExecutor(max_workers=Config.STREAM_WORKERS, thread_name_prefix="stream-infer")
+        routing = (self.llm_router.start_run(is_cached=self.skills_agent.has_cached_enhancement)
+                   if self.llm_router else None)
+        analytics = SkillAnalytics(self.skill_registry)
+        description_run = self.description_fetcher.start_run() if self.description_fetcher else None
+
+        def enrich(job: Dict) -> Dict:
+            if description_run:
+                description_run.fetch(job)
+            job_with_skills = self._infer_job_skills(job, state["job_category"], routing)
+            analytics.add_job(job_with_skills)
+            writer({"job": job_with_skills})
+            return job_with_skills
+
+        try:
+            while True:
+                batch = arrivals.get()
+                if batch is None:
+                    break
+
+                for job in batch:
+                    identifier = self._job_identifier(job)
+                    if identifier in seen:
+                        continue
+                    seen.add(identifier)
+
+                    if self._is_location_match(job.get("location", "").lower().strip(), user_location):
+                        filtered_jobs[identifier] = job
+                        pending[identifier] = executor.submit(enrich, job)
+
+            enriched = {identifier: future.result() for identifier, future in pending.items()}
+        finally:
+            executor.shutdown(wait=True)
+
+        producer.join()
+        if "error" in scrape_result:
+            print(f"Search error: {scrape_result['error']}")
+            state["error_messages"].append(f"Search error: {str(scrape_result['error'])}")
+
+        raw_jobs = self._remove_duplicate_jobs(scrape_result.get("jobs", []))
+        if self.seen_index:
+            self.seen_index.mark_seen(raw_jobs)
+
+        ordered_ids = [self._job_identifier(job) for job in raw_jobs if self._job_identifier(job) in enriched]
+
+        state["raw_jobs"] = raw_jobs
+        state["filtered_jobs"] = [filtered_jobs[identifier] for identifier in ordered_ids]
+        state["jobs_with_skills"] = [enriched[identifier] for identifier in ordered_ids]
+        state["extracted_skills"] = analytics.extracted_skills()
+        state["routing_stats"] = routing.stats() if routing else {}
+        state["analytics_summary"] = analytics.to_dict()
+        self.last_analytics = analytics
+        state["current_step"] = (f"Extracted {len(state['extracted_skills'])} skills from "
+                                 f"{len(state['jobs_with_skills'])} {state['location']} jobs")
 
         return state
 
@@ -163,10 +459,14 @@ class SkillsExtractionWorkflow:
                     "total_skills": len(state["extracted_skills"]),
                     "analysis_timestamp": timestamp,
                     "method": "strict_location_filtering"
-                }
+                },
+                "llm_routing": state.get("routing_stats", {}),
+                "llm_scheduler": get_llm_scheduler().stats()
             }
 
             self.storage_service.save_results(filename, save_data)
+            if self.trend_store:
+                self.trend_store.ingest_new()
             state[
                 "current_step"] = f"Results saved - {len(state['jobs_with_skills'])} {state['location']} jobs analyzed"
 
@@ -175,12 +475,15 @@ class SkillsExtractionWorkflow:
 
         return state
 
+    def _job_identifier(self, job: Dict) -> str:
+        return f"{job['title'].lower()}_{job['company'].lower()}"
+
     def _remove_duplicate_jobs(self, jobs: List[Dict]) -> List[Dict]:
         seen = set()
         unique_jobs = []
 
         for job in jobs:
-            identifier = f"{job['title'].lower()}_{job['company'].lower()}"
+            identifier = self._job_identifier(job)
             if identifier not in seen:
                 seen.add(identifier)
                 unique_jobs.append(job)
@@ -237,9 +540,38 @@ class SkillsExtractionWorkflow:
             filtered_jobs=[],
             extracted_skills=[],
             jobs_with_skills=[],
+            routing_stats={},
+            analytics_summary={},
             error_messages=[],
             current_step="Starting..."
         )
 
         final_state = self.workflow.invoke(initial_state)
-        return final_state
\ No newline at end of file
+        return final_state
+
+    def stream_analysis(self, job_category: str, location: str, date_filter: str,
+                        search_keywords: List[str]) -> Iterator[Tuple[str, Dict]]:
+        """Yield ("job", job_with_skills) as jobs are enriched, then ("result", final_state)."""
+        initial_state = JobSkillsState(
+            job_category=job_category,
+            location=location,
+            date_filter=date_filter,
+            search_keywords=search_keywords,
+            raw_jobs=[],
+            filtered_jobs=[],
+            extracted_skills=[],
+            jobs_with_skills=[],
+            routing_stats={},
+            analytics_summary={},
+            error_messages=[],
+            current_step="Starting..."
+        )
+
+        final_state = initial_state
+        for mode, chunk in self.workflow.stream(initial_state, stream_mode=["custom", "values"]):
+            if mode == "custom" and "job" in chunk:
+                yield "job", chunk["job"]
+            elif mode == "values":
+                final_state = chunk
+
+        yield "result", final_state
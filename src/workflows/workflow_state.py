@@ -11,5 +11,7 @@ class JobSkillsState(TypedDict):
     filtered_jobs: List[Dict]
     extracted_skills: List[str]
     jobs_with_skills: List[Dict]
+    routing_stats: Dict
+    analytics_summary: Dict
     error_messages: List[str]
     current_step: str
\ No newline at end of file
@@ -0,0 +1,206 @@
+import json
+
+import pytest
+
+from src.agents.chat_models import RecordingChatModel, ReplayChatModel, SyntheticChatModel
+from src.agents.llm_router import ConfidenceRouter
+from src.agents.skills_agent import SkillsAgent
+from src.agents.taxonomy_skills_agent import TaxonomySkillsAgent
+from src.config.settings import Config
+from src.services.llm_cache import LLMResponseCache
+
+JOBS = [
+    {"title": "Machine Learning Engineer", "company": "Acme AI", "location": "New York, NY"},
+    {"title": "Data Scientist", "company": "Northwind Analytics", "location": "Brooklyn, NY"},
+    {"title": "AI Engineer", "company": "Contoso", "location": "Remote"},
+    {"title": "Python Developer", "company": "Initech", "location": "Austin, TX"}
+]
+BASE_SKILLS = [["Python"], ["SQL"], ["Machine Learning"], ["Django"]]
+
+# Job 0 is answered, job 1 has a malformed value, job 2 is left out and
+# job 3 comes back under a "Job 3" key.
+PARTLY_MALFORMED_ANSWER = "Here you go:\n" + json.dumps(
+    {"0": ["Docker", "Kubernetes"], "1": "Airflow, Spark", "Job 3": ["FastAPI"]}
+)
+
+
+@pytest.fixture(autouse=True)
+def no_llm_cache(monkeypatch):
+    monkeypatch.setattr(Config, "LLM_CACHE_ENABLED", False)
+
+
+def _read_log(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _write_log(path, entries):
+    with open(path, 'w', encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def _is_batch(entry) -> bool:
+    return "Job 0:" in entry["prompt"]
+
+
+@pytest.fixture
+def recorded_log(tmp_path):
+    """Record one batch prompt and every single-job prompt against the synthetic model."""
+    path = str(tmp_path / "recordings.jsonl")
+    llm = RecordingChatModel(inner=SyntheticChatModel(latency=0), path=path, model_name="synthetic")
+    agent = SkillsAgent("test-key", llm=llm)
+
+    agent.enhance_batch_with_ai(JOBS, BASE_SKILLS, batch_size=len(JOBS), token_budget=10000)
+    for job, base_skills in zip(JOBS, BASE_SKILLS):
+        agent.enhance_with_ai(job, base_skills)
+
+    return path
+
+
+def test_enhance_batch_uses_one_round_trip_per_batch(recorded_log):
+    entries = _read_log(recorded_log)
+    batches = [entry for entry in entries if _is_batch(entry)]
+
+    assert len(batches) == 1
+    assert all(f"Job {index}:" in batches[0]["prompt"] for index in range(len(JOBS)))
+    assert len(entries) == 1 + len(JOBS)
+
+
+def test_enhance_batch_splits_on_batch_size(tmp_path):
+    path = str(tmp_path / "recordings.jsonl")
+    llm = RecordingChatModel(inner=SyntheticChatModel(latency=0), path=path, model_name="synthetic")
+
+    SkillsAgent("test-key", llm=llm).enhance_batch_with_ai(JOBS, BASE_SKILLS, batch_size=2, token_budget=10000)
+
+    assert len(_read_log(path)) == 2
+
+
+def test_enhance_batch_falls_back_per_job_for_missing_or_malformed_entries(recorded_log):
+    entries = _read_log(recorded_log)
+    singles = {entry["prompt"]: json.loads(entry["response"]) for entry in entries if not _is_batch(entry)}
+    for entry in entries:
+        if _is_batch(entry):
+            entry["response"] = PARTLY_MALFORMED_ANSWER
+    _write_log(recorded_log, entries)
+
+    replay = ReplayChatModel(path=recorded_log, model_name="synthetic")
+    results = SkillsAgent("test-key", llm=replay).enhance_batch_with_ai(
+        JOBS, BASE_SKILLS, batch_size=len(JOBS), token_budget=10000
+    )
+
+    def single_answer(job):
+        return next(skills for prompt, skills in singles.items() if job["title"] in prompt)
+
+    assert results[0] == ["Docker", "Kubernetes"]
+    assert results[3] == ["FastAPI"]
+    assert results[1] == single_answer(JOBS[1])
+    assert results[2] == single_answer(JOBS[2])
+
+    # One batch round trip plus one single-job call for each missing or malformed entry
+    assert (replay.hits, replay.misses) == (3, 0)
+
+
+@pytest.fixture(scope="module")
+def taxonomy_agent():
+    return TaxonomySkillsAgent("test-key", fallback_agent=SkillsAgent("test-key", llm=SyntheticChatModel(latency=0)))
+
+
+def _taxonomy_skills(agent, description, title="Operations Associate"):
+    return agent.extract_skills({"title": title, "description": description})
+
+
+@pytest.mark.parametrize("description", [
+    "We express our thanks to every applicant.",
+    "Express your interest by email.",
+    "Company car with new spark plugs and tyres.",
+    "Bring a flask of coffee for the night shift.",
+    "Ruby red uniforms are provided.",
+    "Go the extra mile for our customers."
+])
+def test_taxonomy_skips_common_words(taxonomy_agent, description):
+    assert _taxonomy_skills(taxonomy_agent, description) == []
+
+
+def test_taxonomy_matches_ambiguous_names_in_context(taxonomy_agent):
+    assert _taxonomy_skills(taxonomy_agent, "", title="Senior Ruby Developer") == ["Ruby"]
+    assert _taxonomy_skills(taxonomy_agent, "Pipelines in Python, Spark and Kafka.") == [
+        "Python", "Apache Spark", "Apache Kafka"
+    ]
+    assert _taxonomy_skills(taxonomy_agent, "REST services with Node.js and Express.") == [
+        "REST API", "Node.js", "Express.js"
+    ]
+
+
+def test_taxonomy_respects_word_boundaries_and_case(taxonomy_agent):
+    assert _taxonomy_skills(taxonomy_agent, "JavaScript, golang and c++") == ["JavaScript", "Go", "C++"]
+    assert _taxonomy_skills(taxonomy_agent, "sparkling water and flask-shaped bottles") == []
+
+
+def test_taxonomy_maps_aliases_to_canonical_names_and_categories(taxonomy_agent):
+    assert _taxonomy_skills(taxonomy_agent, "sklearn, k8s and UE5") == ["Scikit-learn", "Kubernetes", "Unreal Engine"]
+    assert taxonomy_agent.taxonomy.category_of("Unreal Engine") == "Game Development"
+
+
+def test_taxonomy_needs_llm_below_min_skills(taxonomy_agent):
+    assert taxonomy_agent.needs_llm({"title": "Ruby red", "description": ""})
+    assert not taxonomy_agent.needs_llm({"title": "Engineer", "description": "Python, SQL and Docker"})
+
+
+LOW_CONFIDENCE_JOB = {"title": "Operations Associate", "company": "Initech", "location": "Remote"}
+
+
+def test_router_score_blends_skill_count_and_title_without_description():
+    router = ConfidenceRouter(threshold=0.5, target_skills=4)
+
+    assert router.score(LOW_CONFIDENCE_JOB, []) == 0.0
+    assert router.score(LOW_CONFIDENCE_JOB, ["Python", "SQL"]) == 0.3
+    assert router.score({"title": "Django Developer"}, []) == 0.4
+    assert router.score({"title": "Django Developer"}, ["A", "B", "C", "D", "E"]) == 1.0
+
+
+def test_router_score_counts_description_density():
+    router = ConfidenceRouter(threshold=0.5, target_skills=4)
+
+    dense = {**LOW_CONFIDENCE_JOB, "description": "Python, SQL and Docker"}
+    sparse = {**LOW_CONFIDENCE_JOB, "description": "Python " + "word " * 99}
+
+    assert router.score(dense, []) == 0.3
+    assert router.score(sparse, []) == 0.1
+
+
+def test_routing_run_keeps_confident_jobs_local():
+    run = ConfidenceRouter(threshold=0.5, target_skills=4).start_run(max_calls=0, max_tokens=0)
+
+    assert not run.should_enhance({"title": "Django Developer"}, ["A", "B", "C", "D"])
+    assert run.should_enhance(LOW_CONFIDENCE_JOB, ["Python"])
+    assert (run.stats()["local"], run.stats()["llm"]) == (1, 1)
+
+
+def test_routing_run_caps_llm_calls_and_tokens():
+    router = ConfidenceRouter(threshold=0.5)
+
+    calls = router.start_run(max_calls=2, max_tokens=0)
+    assert [calls.should_enhance(LOW_CONFIDENCE_JOB, []) for _ in range(3)] == [True, True, False]
+    assert (calls.stats()["llm"], calls.stats()["capped"]) == (2, 1)
+
+    tokens = router.start_run(max_calls=0, max_tokens=router.estimate_tokens(LOW_CONFIDENCE_JOB) * 3 // 2)
+    assert [tokens.should_enhance(LOW_CONFIDENCE_JOB, []) for _ in range(2)] == [True, False]
+
+
+def test_routing_run_does_not_charge_cached_answers_to_the_cap(tmp_path):
+    agent = SkillsAgent("test-key", llm=SyntheticChatModel(latency=0))
+    agent.llm_cache = LLMResponseCache(path=str(tmp_path / "llm_cache.sqlite3"))
+    cached_job = {**LOW_CONFIDENCE_JOB, "title": "Warehouse Associate"}
+    assert not agent.has_cached_enhancement(cached_job, [])
+    answer = agent.enhance_with_ai(cached_job, [])
+    assert answer and agent.has_cached_enhancement(cached_job, [])
+
+    run = ConfidenceRouter(threshold=0.5).start_run(max_calls=1, max_tokens=0,
+                                                    is_cached=agent.has_cached_enhancement)
+
+    assert run.should_enhance(cached_job, [])
+    assert run.should_enhance(LOW_CONFIDENCE_JOB, [])
+    assert not run.should_enhance(LOW_CONFIDENCE_JOB, [])
+    assert {key: run.stats()[key] for key in ("cached", "llm", "capped")} == {"cached": 1, "llm": 1, "capped": 1}
+    assert agent.enhance_with_ai(cached_job, []) == answer
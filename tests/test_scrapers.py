@@ -0,0 +1,283 @@
+import os
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.scrapers.card_parser import parse_job_cards
+from src.scrapers.description_fetcher import JobDescriptionFetcher
+from src.scrapers.http_scraper import HttpSessionPool, LinkedInHttpScraper
+from src.scrapers.keyword_fanout import KeywordFanout
+from src.scrapers.selector_stats import SelectorStats
+from src.utils.rate_limiter import AdaptiveRateLimiter
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+SEARCH_RESULTS_FIXTURE = os.path.join(FIXTURES_DIR, "linkedin_search_results.html")
+
+EXPECTED_JOBS = [
+    {
+        "title": "Machine Learning Engineer",
+        "company": "Acme AI",
+        "location": "New York, NY",
+        "url": "https://www.linkedin.com/jobs/view/machine-learning-engineer-at-acme-ai-4012345678"
+    },
+    {
+        "title": "Senior Data Scientist",
+        "company": "Northwind Analytics",
+        "location": "Brooklyn, NY",
+        "url": "https://www.linkedin.com/jobs/view/senior-data-scientist-at-northwind-4012345679"
+    }
+]
+
+
+def _read_fixture() -> bytes:
+    with open(SEARCH_RESULTS_FIXTURE, "rb") as f:
+        return f.read()
+
+
+@contextmanager
+def _serve(body: bytes):
+    requested_paths = []
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requested_paths.append(self.path)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/jobs/search/", requested_paths
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def fixture_server():
+    with _serve(_read_fixture()) as served:
+        yield served
+
+
+@pytest.fixture
+def selector_stats(tmp_path):
+    return SelectorStats(path=str(tmp_path / "selector_stats.json"))
+
+
+def _card_fields(jobs):
+    return [{field: job[field] for field in ("title", "company", "location", "url")} for job in jobs]
+
+
+def test_http_scraper_parses_saved_search_page(fixture_server, selector_stats):
+    search_url, requested_paths = fixture_server
+    pool = HttpSessionPool(size=1)
+    scraper = LinkedInHttpScraper(session_pool=pool, search_url=search_url, max_cards=10, max_pages=1,
+                                  selector_stats=selector_stats)
+
+    try:
+        jobs = scraper.search_jobs_for_keyword("machine learning engineer", "New York", "Last Week")
+    finally:
+        pool.close()
+
+    assert _card_fields(jobs) == EXPECTED_JOBS
+    assert all(job["search_keyword"] == "machine learning engineer" for job in jobs)
+    assert all(job["source"] == "LinkedIn" for job in jobs)
+    assert len(requested_paths) == 1
+    assert "keywords=machine+learning+engineer" in requested_paths[0]
+    assert "location=New+York" in requested_paths[0]
+    assert SelectorStats(path=selector_stats.path).last_hit == ".job-search-card"
+
+
+def test_http_scraper_matches_selenium_page_source_parsing(fixture_server, selector_stats):
+    search_url, _ = fixture_server
+    pool = HttpSessionPool(size=1)
+    scraper = LinkedInHttpScraper(session_pool=pool, search_url=search_url, max_cards=10, max_pages=1,
+                                  selector_stats=selector_stats)
+
+    try:
+        http_jobs = scraper.search_jobs_for_keyword("data scientist", "New York", "Last Week")
+    finally:
+        pool.close()
+
+    # The Selenium scraper parses driver.page_source with the card selector it waited on
+    selenium_jobs = parse_job_cards(_read_fixture().decode("utf-8"), "data scientist",
+                                    limit=10, card_selectors=[".job-search-card"])
+
+    assert _card_fields(http_jobs) == _card_fields(selenium_jobs) == EXPECTED_JOBS
+
+
+def test_http_scraper_respects_card_limit(fixture_server, selector_stats):
+    search_url, _ = fixture_server
+    pool = HttpSessionPool(size=1)
+    scraper = LinkedInHttpScraper(session_pool=pool, search_url=search_url, max_cards=1, max_pages=1,
+                                  selector_stats=selector_stats)
+
+    try:
+        jobs = scraper.search_jobs_for_keyword("machine learning engineer", "New York", "Last Week")
+    finally:
+        pool.close()
+
+    assert _card_fields(jobs) == EXPECTED_JOBS[:1]
+
+
+def test_cards_missing_a_company_are_skipped(fixture_server, selector_stats):
+    search_url, _ = fixture_server
+    pool = HttpSessionPool(size=1)
+    scraper = LinkedInHttpScraper(session_pool=pool, search_url=search_url, max_cards=10, max_pages=1,
+                                  selector_stats=selector_stats)
+
+    try:
+        jobs = scraper.search_jobs_for_keyword("python developer", "New York", "Last Week")
+    finally:
+        pool.close()
+
+    html = _read_fixture().decode("utf-8")
+    assert html.count('class="base-card ') == 3
+    assert "Python Developer" in html
+    assert "Python Developer" not in [job["title"] for job in jobs]
+    assert all(job["company"] for job in jobs)
+    assert len(jobs) == 2
+
+
+class _FakeScraper:
+    def search_jobs_for_keyword(self, keyword, location, date_filter):
+        return [{"title": keyword, "company": "Acme", "location": location}]
+
+
+def test_keyword_fanout_reports_when_no_scraper_starts():
+    def broken_factory():
+        raise OSError("chromedriver failed to start")
+
+    fanout = KeywordFanout(broken_factory, workers=1)
+    completed = []
+
+    with pytest.raises(RuntimeError, match="chromedriver failed to start"):
+        fanout.run_grouped(["python", "data"], "New York", "Last Week",
+                           on_result=lambda index, keyword, jobs: completed.append(keyword))
+
+    assert completed == []
+
+
+def test_keyword_fanout_other_workers_take_over_from_a_failed_start():
+    attempts = []
+    lock = threading.Lock()
+
+    def flaky_factory():
+        with lock:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError("chromedriver failed to start")
+        return _FakeScraper()
+
+    fanout = KeywordFanout(flaky_factory, workers=2)
+    results = fanout.run_grouped(["python", "data", "ml"], "New York", "Last Week")
+
+    assert [[job["title"] for job in jobs] for jobs in results] == [["python"], ["data"], ["ml"]]
+
+
+def _scrape_once(search_url, selector_stats):
+    """Scrape one page and return the change in the host limiter's success and throttle counts."""
+    pool = HttpSessionPool(size=1)
+    scraper = LinkedInHttpScraper(session_pool=pool, search_url=search_url, max_cards=10, max_pages=1,
+                                  selector_stats=selector_stats)
+    # Limiters are shared per host and port, and a port can be reused by a later test server
+    before = (scraper.rate_limiter.successes, scraper.rate_limiter.throttles)
+    try:
+        jobs = scraper.search_jobs_for_keyword("python", "New York", "Last Week")
+    finally:
+        pool.close()
+    return jobs, scraper.rate_limiter.successes - before[0], scraper.rate_limiter.throttles - before[1]
+
+
+def test_empty_search_page_is_a_throttle_signal(selector_stats):
+    with _serve(b"<html><body><p>Please sign in</p></body></html>") as (search_url, _):
+        jobs, successes, throttles = _scrape_once(search_url, selector_stats)
+
+    assert jobs == []
+    assert (successes, throttles) == (0, 1)
+
+
+def test_search_page_with_cards_is_a_success_signal(fixture_server, selector_stats):
+    jobs, successes, throttles = _scrape_once(fixture_server[0], selector_stats)
+
+    assert len(jobs) == 2
+    assert (successes, throttles) == (1, 0)
+
+
+DESCRIPTION_PAGE = (b"<html><body><div class=\"show-more-less-html__markup\">"
+                    b"<p>Build ML pipelines in Python.</p>" + b"<p>" + b"x" * 4000 + b"</p>"
+                    b"</div></body></html>")
+
+
+@contextmanager
+def _serve_status(status: int, body: bytes = b""):
+    class StatusHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/jobs/view/1"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _fetch_description(url: str, **kwargs):
+    """Fetch one description and return it with the limiter's (successes, throttles)."""
+    pool = HttpSessionPool(size=1)
+    limiter = AdaptiveRateLimiter(rate=100.0, min_rate=1.0, max_rate=100.0)
+    fetcher = JobDescriptionFetcher(session_pool=pool, rate_limiter=limiter, workers=1, **kwargs)
+    job = {"title": "ML Engineer", "company": "Acme", "url": url}
+
+    try:
+        fetcher.fetch_descriptions([job])
+    finally:
+        pool.close()
+    return job.get("description"), (limiter.successes, limiter.throttles)
+
+
+def test_description_fetcher_records_success_for_complete_pages():
+    with _serve_status(200, DESCRIPTION_PAGE) as url:
+        description, signals = _fetch_description(url)
+
+    assert description.startswith("Build ML pipelines in Python.")
+    assert signals == (1, 0)
+
+
+@pytest.mark.parametrize("limits", [{"max_page_bytes": 1024}, {"byte_budget": 1024}])
+def test_description_fetcher_drops_truncated_pages_without_a_success(limits):
+    with _serve_status(200, DESCRIPTION_PAGE) as url:
+        description, signals = _fetch_description(url, **limits)
+
+    assert description is None
+    assert signals == (0, 0)
+
+
+@pytest.mark.parametrize("status, signals", [(503, (0, 1)), (429, (0, 1)), (404, (0, 0))])
+def test_description_fetcher_throttles_on_server_errors(status, signals):
+    with _serve_status(status) as url:
+        description, recorded = _fetch_description(url)
+
+    assert description is None
+    assert recorded == signals
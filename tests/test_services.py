@@ -0,0 +1,251 @@
+import json
+import shutil
+
+import pytest
+
+from src.services import sqlite_cache
+from src.services.llm_cache import LLMResponseCache
+from src.services.scrape_cache import ScrapeCache
+from src.config.settings import Config
+from src.services.seen_jobs_index import SeenJobsIndex
+from src.services.skill_categories import SkillCategoryIndex
+from src.services.skill_registry import SkillRegistry
+from src.services.skill_sketch import SkillFrequencySketch
+from src.services.skill_trends import SkillTrendStore
+from src.services.sqlite_cache import SqliteCache
+from src.services.storage_service import StorageService
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(sqlite_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_sqlite_cache_expires_entries(tmp_path, clock):
+    cache = SqliteCache(str(tmp_path / "cache.sqlite3"), "entries", max_entries=10)
+
+    cache.put("short", "a", ttl=60)
+    cache.put("forever", "b")
+    clock[0] += 61
+
+    assert cache.get("short") is None
+    assert cache.get("forever") == "b"
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1}
+
+
+def test_sqlite_cache_evicts_least_recently_used(tmp_path, clock):
+    cache = SqliteCache(str(tmp_path / "cache.sqlite3"), "entries", max_entries=2)
+
+    cache.put("a", "1")
+    clock[0] += 1
+    cache.put("b", "2")
+    clock[0] += 1
+    assert cache.get("a") == "1"
+    clock[0] += 1
+    cache.put("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_scrape_cache_normalizes_keys_and_skips_empty_results(tmp_path, clock):
+    cache = ScrapeCache(str(tmp_path / "scrape.sqlite3"), max_entries=10, ttl_ratio=0.005)
+    jobs = [{"title": "ML Engineer", "company": "Acme"}]
+
+    cache.put("Machine  Learning", "New York", "Last Week", jobs)
+    cache.put("python", "New York", "Last Week", [])
+
+    assert cache.get("machine learning", "new york", "Last Week") == jobs
+    assert cache.get("python", "New York", "Last Week") is None
+
+    clock[0] += cache.ttl_for("Last Week") + 1
+    assert cache.get("machine learning", "new york", "Last Week") is None
+
+
+def test_llm_cache_keys_on_model_and_normalized_prompt(tmp_path, clock):
+    cache = LLMResponseCache(str(tmp_path / "llm.sqlite3"), max_entries=10, ttl=0)
+
+    cache.put("gpt-4o-mini", "Suggest  skills\nfor this job", '["Python"]')
+
+    assert cache.get("gpt-4o-mini", "Suggest skills for this job") == '["Python"]'
+    assert cache.get("other-model", "Suggest skills for this job") is None
+
+
+def test_seen_jobs_index_keys_stored_skills_by_job_category(tmp_path):
+    index = SeenJobsIndex(str(tmp_path / "seen.sqlite3"), use_bloom=True)
+    job = {"title": "ML Engineer", "company": "Acme", "url": "https://www.linkedin.com/jobs/view/1?trk=x"}
+
+    index.record_skills(job, "AI ENGINEER", ["Python", "PyTorch"], "inferred + ai_enhanced")
+
+    assert index.get_skills(job, "AI ENGINEER") == ["Python", "PyTorch"]
+    assert index.get_skills(job, "PYTHON DEVELOPER") is None
+    assert index.contains(job)
+    assert index.stats() == {"seen_jobs": 1, "enriched_jobs": 1}
+
+
+def test_skill_registry_folds_aliases_and_case_variants():
+    registry = SkillRegistry()
+
+    ids = registry.intern_all(["Foo Widget", "A1", "A2", "A3", "foo widget", "FOO-widget"])
+    assert ids == [0, 1, 2, 3]
+    assert registry.name(0) == "Foo Widget"
+    assert registry.canonical("foo_widget") == "Foo Widget"
+
+    assert registry.canonicalize(["sklearn", "scikit learn", "Scikit-Learn"]) == ["Scikit-learn"]
+    assert registry.intern("k8s") == registry.intern("Kubernetes")
+
+
+def test_skill_registry_canonical_does_not_intern_unknown_names():
+    registry = SkillRegistry()
+
+    assert registry.canonical("  Some   New Tool ") == "Some New Tool"
+    assert len(registry) == 0
+
+
+def _sketch() -> SkillFrequencySketch:
+    return SkillFrequencySketch(capacity=10, epsilon=0.01, delta=0.01, skill_registry=SkillRegistry())
+
+
+def test_skill_sketch_folds_case_variants_of_unknown_skills():
+    sketch = _sketch()
+    sketch.add_jobs([
+        {"skills": ["PyTorch Lightning", "sklearn"]},
+        {"skills": ["pytorch lightning", "Scikit-Learn"]},
+        {"skills": ["PYTORCH-LIGHTNING", "pytorch lightning"]}
+    ])
+
+    assert sketch.estimate("pytorch_lightning") == 3
+    assert [(record["skill"], record["frequency"]) for record in sketch.skill_frequencies()] == [
+        ("PyTorch Lightning", 3), ("Scikit-learn", 2)
+    ]
+
+
+def test_skill_sketch_never_undercounts_and_round_trips_after_merge():
+    jobs = [{"skills": [f"Tool {index % 7}", f"Tool {index % 13}", "Python"]} for index in range(200)]
+    first, second = _sketch(), _sketch()
+    first.add_jobs(jobs[:120])
+    second.add_jobs(jobs[120:])
+    first.merge(second)
+
+    restored = SkillFrequencySketch.from_dict(first.to_dict(), skill_registry=SkillRegistry())
+
+    truth = {}
+    for job in jobs:
+        for skill in set(job["skills"]):
+            truth[skill] = truth.get(skill, 0) + 1
+    for skill, count in truth.items():
+        assert restored.estimate(skill) >= count
+        assert restored.estimate(skill) == first.estimate(skill)
+
+    max_overcount = first.error_bounds()["top_list_max_overcount"]
+    for record in restored.skill_frequencies():
+        assert record["frequency"] - truth[record["skill"]] <= max_overcount
+    assert restored.skill_frequencies() == first.skill_frequencies()
+    assert restored.total_jobs == 200
+
+
+@pytest.fixture
+def trends(tmp_path, monkeypatch):
+    """Storage and a trend store factory rooted in a temporary data directory."""
+    monkeypatch.chdir(tmp_path)
+    categories_path = str(tmp_path / "skill_categories.json")
+    shutil.copy(Config.SKILL_CATEGORIES_PATH, categories_path)
+
+    registry = SkillRegistry()
+    storage = StorageService(registry)
+
+    def open_store() -> SkillTrendStore:
+        return SkillTrendStore(path=str(tmp_path / "skill_trends.sqlite3"), storage_service=storage,
+                               skill_registry=registry,
+                               category_index=SkillCategoryIndex(categories_path=categories_path))
+
+    return storage, open_store, categories_path
+
+
+def _save_run(storage, stamp, location, postings):
+    jobs = [{"title": "Engineer", "company": "Acme", "url": f"https://example.com/jobs/{posting_id}",
+             "scraped_at": f"{day}T09:00:00", "skills": skills}
+            for posting_id, day, skills in postings]
+    storage.save_results(f"location_filtered_analysis_{stamp}.json", {"location": location, "jobs_with_skills": jobs})
+
+
+def test_skill_trends_ingest_each_file_once(trends):
+    storage, open_store, _ = trends
+    _save_run(storage, "20240301_090000", "New York", [(1, "2024-03-01", ["Python"])])
+
+    store = open_store()
+    assert store.ingest_new() == 1
+    assert store.ingest_new() == 0
+
+    _save_run(storage, "20240302_090000", "New York", [(2, "2024-03-02", ["Python"])])
+    assert open_store().ingest_new() == 1
+    assert store.stats()["ingested_files"] == 2
+    assert store.stats()["jobs"] == 2
+
+
+def test_skill_trends_count_a_posting_once_per_day_and_location(trends):
+    storage, open_store, _ = trends
+    posting = [(1, "2024-03-01", ["Python", "SQL"])]
+    _save_run(storage, "20240301_090000", "New York", posting)
+    _save_run(storage, "20240301_120000", "new york", posting)
+    _save_run(storage, "20240301_150000", "Boston", posting)
+
+    store = open_store()
+    store.ingest_new()
+
+    def python_jobs(location=None):
+        top = store.top_skills(weeks=1, location=location, until="2024-03-01")
+        return next(record["frequency"] for record in top if record["skill"] == "Python")
+
+    assert python_jobs("New York") == 1
+    assert python_jobs("Boston") == 1
+    assert python_jobs() == 2
+    assert store.stats()["jobs"] == 2
+
+
+def test_rising_skills_compares_half_open_windows(trends):
+    storage, open_store, _ = trends
+    _save_run(storage, "20240328_090000", "Remote", [
+        (1, "2024-03-14", ["Rust"]),
+        (2, "2024-03-20", ["Rust"]), (3, "2024-03-20", ["Go"]), (4, "2024-03-20", ["Go"]),
+        (5, "2024-03-20", ["Go"]), (6, "2024-03-21", ["Rust"]),
+        (7, "2024-03-25", ["Rust"]), (8, "2024-03-25", ["Rust"]), (9, "2024-03-28", ["Rust"]),
+        (10, "2024-03-28", ["Go"])
+    ])
+
+    store = open_store()
+    store.ingest_new()
+    trends_by_skill = {trend["skill"]: trend for trend in store.rising_skills(weeks=1, until="2024-03-28")}
+
+    assert (trends_by_skill["Rust"]["recent_jobs"], trends_by_skill["Rust"]["prior_jobs"]) == (3, 2)
+    assert trends_by_skill["Rust"]["change"] == 35.0
+    assert "Go" not in trends_by_skill
+    assert store.rising_skills(weeks=1, until="2024-03-28", min_jobs=4) == []
+    assert store.rising_skills(weeks=1, until="2024-03-28", category="Databases") == []
+
+
+def test_skill_trends_recategorize_when_the_category_file_changes(trends):
+    storage, open_store, categories_path = trends
+    _save_run(storage, "20240301_090000", "Remote", [(1, "2024-03-01", ["Rust", "PostgreSQL"])])
+
+    store = open_store()
+    store.ingest_new()
+    assert [record["skill"] for record in store.top_skills(weeks=1, category="Programming Languages",
+                                                           until="2024-03-01")] == ["Rust"]
+
+    with open(categories_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    config.setdefault("overrides", {})["Rust"] = "Databases"
+    with open(categories_path, 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+
+    store = open_store()
+    assert store.top_skills(weeks=1, category="Programming Languages", until="2024-03-01") == []
+    assert [record["skill"] for record in store.top_skills(weeks=1, category="Databases",
+                                                           until="2024-03-01")] == ["PostgreSQL", "Rust"]
+    assert store.category_trends(weeks=1, until="2024-03-01") == [
+        {"category": "Databases", "recent_mentions": 2, "prior_mentions": 0}
+    ]
@@ -0,0 +1,261 @@
+import random
+from collections import Counter
+
+import pytest
+
+from src.utils.aho_corasick import AhoCorasickMatcher
+from src.utils.llm_scheduler import CircuitOpenError, LLMScheduler
+from src.utils.rate_limiter import AdaptiveRateLimiter
+from src.utils.sketches import CountMinSketch, SpaceSaving
+
+
+class FakeClock:
+    """Manual clock whose sleep advances time instead of blocking."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock: FakeClock, **kwargs) -> AdaptiveRateLimiter:
+    options = {"rate": 1.0, "min_rate": 0.1, "max_rate": 2.0, "increase": 0.25, "decrease_factor": 0.5}
+    options.update(kwargs)
+    return AdaptiveRateLimiter(clock=clock, sleep=clock.sleep, **options)
+
+
+def test_rate_limiter_increases_additively_up_to_max_rate():
+    limiter = _limiter(FakeClock())
+
+    limiter.record_success()
+    limiter.record_success()
+    assert limiter.current_rate == pytest.approx(1.5)
+
+    for _ in range(10):
+        limiter.record_success()
+    assert limiter.current_rate == pytest.approx(2.0)
+    assert limiter.successes == 12
+
+
+def test_rate_limiter_decreases_multiplicatively_down_to_min_rate():
+    limiter = _limiter(FakeClock())
+
+    limiter.record_throttle()
+    assert limiter.current_rate == pytest.approx(0.5)
+
+    for _ in range(10):
+        limiter.record_throttle()
+    assert limiter.current_rate == pytest.approx(0.1)
+    assert limiter.throttles == 11
+
+
+def test_rate_limiter_paces_requests_at_the_current_rate():
+    clock = FakeClock()
+    limiter = _limiter(clock, rate=2.0)
+
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert clock.sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+
+
+def test_rate_limiter_retry_after_is_a_floor_on_the_next_wait():
+    clock = FakeClock()
+    limiter = _limiter(clock, rate=2.0)
+
+    limiter.record_throttle(retry_after=30)
+    clock.now += 10
+
+    assert limiter.acquire() == pytest.approx(20)
+    assert clock.now == pytest.approx(1030)
+
+    # A shorter hint never pulls the pause forward
+    limiter.record_throttle(retry_after=60)
+    limiter.record_throttle(retry_after=5)
+    assert limiter.acquire() == pytest.approx(60)
+
+
+def _matcher(*patterns, case_sensitive=()) -> AhoCorasickMatcher:
+    matcher = AhoCorasickMatcher()
+    for pattern in patterns:
+        matcher.add(pattern, pattern)
+    for pattern in case_sensitive:
+        matcher.add(pattern, pattern, case_sensitive=True)
+    matcher.build()
+    return matcher
+
+
+def _found(matcher: AhoCorasickMatcher, text: str):
+    return [value for _, _, value in matcher.find(text)]
+
+
+def test_matcher_only_matches_on_word_boundaries():
+    matcher = _matcher("Java", "C", "C++", "SQL")
+
+    assert _found(matcher, "JavaScript and MySQL") == []
+    assert _found(matcher, "java, C++ and c") == ["Java", "C++", "C"]
+
+
+def test_matcher_ignores_case_and_separators():
+    matcher = _matcher("Machine Learning")
+
+    assert _found(matcher, "MACHINE-learning") == ["Machine Learning"]
+    assert _found(matcher, "machine_  learning") == ["Machine Learning"]
+
+
+def test_matcher_case_sensitive_patterns_must_match_casing():
+    matcher = _matcher(case_sensitive=["Go", "R"])
+
+    assert _found(matcher, "Go and R") == ["Go", "R"]
+    assert _found(matcher, "go to the r&d lab") == []
+
+
+def test_matcher_prefers_leftmost_longest_match():
+    matcher = _matcher(".NET", "ASP.NET Core", "Spark", "Spark SQL")
+
+    assert _found(matcher, "ASP.NET Core with Spark SQL") == ["ASP.NET Core", "Spark SQL"]
+
+
+class ScriptedLLM:
+    """Chat model stand-in that raises or answers in the order given."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def invoke(self, messages, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else "ok"
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _scheduler(clock: FakeClock, **kwargs) -> LLMScheduler:
+    settings = dict(requests_per_minute=600, tokens_per_minute=100000, max_retries=3, backoff_base=1.0,
+                    backoff_max=8.0, failure_threshold=5, reset_timeout=30.0)
+    settings.update(kwargs)
+    return LLMScheduler(clock=clock, sleep=clock.sleep, **settings)
+
+
+def test_scheduler_retries_transient_failures_then_succeeds():
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    llm = ScriptedLLM(TimeoutError("slow"), ConnectionError("reset"), "answer")
+
+    assert scheduler.invoke(llm, [], 100) == "answer"
+    assert llm.calls == 3
+    assert (scheduler.stats()["retries"], scheduler.stats()["failures"], scheduler.stats()["calls"]) == (2, 2, 1)
+    assert scheduler.circuit_state == "closed"
+
+
+def test_scheduler_does_not_retry_non_transient_errors():
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    llm = ScriptedLLM(LookupError("no recording"))
+
+    with pytest.raises(LookupError):
+        scheduler.invoke(llm, [], 100)
+    assert llm.calls == 1
+    assert scheduler.stats()["retries"] == 0
+    assert clock.sleeps == []
+
+
+def test_scheduler_circuit_opens_and_allows_one_half_open_trial():
+    clock = FakeClock()
+    scheduler = _scheduler(clock, max_retries=0, failure_threshold=2, reset_timeout=30.0)
+
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            scheduler.invoke(ScriptedLLM(TimeoutError("slow")), [], 100)
+    assert scheduler.circuit_state == "open"
+
+    llm = ScriptedLLM("answer")
+    with pytest.raises(CircuitOpenError):
+        scheduler.invoke(llm, [], 100)
+    assert llm.calls == 0
+
+    clock.now += 30.0
+    assert scheduler.circuit_state == "half_open"
+    with pytest.raises(TimeoutError):
+        scheduler.invoke(ScriptedLLM(TimeoutError("still slow")), [], 100)
+    assert scheduler.circuit_state == "open"
+
+    clock.now += 30.0
+    assert scheduler.invoke(llm, [], 100) == "answer"
+    assert scheduler.circuit_state == "closed"
+    assert scheduler.stats()["rejected"] == 1
+
+
+def test_scheduler_rejects_calls_while_the_half_open_trial_is_in_flight():
+    clock = FakeClock()
+    scheduler = _scheduler(clock, max_retries=0, failure_threshold=1, reset_timeout=30.0)
+    with pytest.raises(TimeoutError):
+        scheduler.invoke(ScriptedLLM(TimeoutError("slow")), [], 100)
+    clock.now += 30.0
+
+    class NestedCall:
+        def invoke(self, messages, **kwargs):
+            with pytest.raises(CircuitOpenError):
+                scheduler.invoke(ScriptedLLM("second"), [], 100)
+            return "trial"
+
+    assert scheduler.invoke(NestedCall(), [], 100) == "trial"
+    assert scheduler.stats()["rejected"] == 1
+
+
+def test_scheduler_waits_when_the_token_budget_is_exhausted():
+    clock = FakeClock()
+    scheduler = _scheduler(clock, tokens_per_minute=600)
+
+    scheduler.invoke(ScriptedLLM("first"), [], 600)
+    assert clock.sleeps == []
+
+    scheduler.invoke(ScriptedLLM("second"), [], 300)
+    assert clock.sleeps == [pytest.approx(30.0)]
+    assert scheduler.stats()["max_queue_delay"] == 30.0
+
+
+def _skewed_stream(seed: int, length: int = 5000):
+    rng = random.Random(seed)
+    return [f"skill-{int(rng.paretovariate(1.2))}" for _ in range(length)]
+
+
+def test_space_saving_bounds_hold_and_survive_merges():
+    first, second = _skewed_stream(1), _skewed_stream(2)
+    summary, other = SpaceSaving(capacity=20), SpaceSaving(capacity=20)
+    for item in first:
+        summary.add(item)
+    for item in second:
+        other.add(item)
+    summary.merge(other)
+
+    truth = Counter(first + second)
+    total = len(first) + len(second)
+    for item, count, error in summary.top():
+        assert count - error <= truth[item] <= count
+        assert error <= total / summary.capacity
+    for item, true_count in truth.items():
+        assert summary.estimate(item)[0] >= true_count
+
+    restored = SpaceSaving.from_dict(summary.to_dict())
+    assert restored.top() == summary.top()
+    assert restored.total == total
+
+
+def test_count_min_sketch_never_undercounts_and_round_trips():
+    stream = _skewed_stream(3)
+    sketch = CountMinSketch(epsilon=0.01, delta=0.01)
+    for item in stream:
+        sketch.add(item)
+
+    restored = CountMinSketch.from_dict(sketch.to_dict())
+    for item, true_count in Counter(stream).items():
+        assert true_count <= sketch.estimate(item) <= true_count + sketch.epsilon * len(stream)
+        assert restored.estimate(item) == sketch.estimate(item)